@@ -4,13 +4,68 @@
 
 from __future__ import annotations
 
+import sys
+from typing import TYPE_CHECKING
+
 from argumentation_mining.pipelines.direct_extraction import (
     DirectArgumentExtractor,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from argumentation_mining.pipelines.direct_extraction import (
+        DirectExtractionResult,
+    )
+
+
+def _iter_result_lines(result: DirectExtractionResult) -> Iterator[str]:
+    """Yield the display lines for one extraction result."""
+    if not result.success:
+        yield (
+            f"Extraction failed for article {result.article_id}: "
+            f"{result.error_message}"
+        )
+        return
+
+    yield f"Extraction successful for article {result.article_id}!\n"
+
+    yield "Conclusions extracted:"
+    if result.conclusions:
+        for i, conclusion in enumerate(result.conclusions, 1):
+            yield f"  {i}. {conclusion}"
+    else:
+        yield "  None"
+
+    yield "\nArguments (Conclusion-Premise pairs):"
+    if result.arguments:
+        for i, arg in enumerate(result.arguments, 1):
+            yield f"\n  Argument {i}:"
+            yield f"    Conclusion: {arg.conclusion}"
+            yield "    Premises:"
+            if arg.premises:
+                for j, premise in enumerate(arg.premises, 1):
+                    yield f"      {j}. {premise}"
+            else:
+                yield "      None"
+    else:
+        yield "  None"
+
+
+def _write_results(results: list[DirectExtractionResult]) -> None:
+    """Write all results to stdout in a single call."""
+    lines = (line for result in results for line in _iter_result_lines(result))
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main(*, run_batch: bool = True) -> None:
+    """
+    Demonstrate direct extraction on a sample text.
+
+    Args:
+        run_batch: Whether to also run the (slow) Batch API example.
 
-def main() -> None:
-    """Demonstrate direct extraction on a sample text."""
+    """
     # Initialize the extractor
     extractor = DirectArgumentExtractor(model="gpt-4o-mini")
 
@@ -29,34 +84,13 @@ y permite a estudiantes de áreas rurales acceder a educación de calidad."""
     result = extractor.process_single(text=sample_text, article_id="example_1")
 
     # Display results
-    if result.success:
-        print("Extraction successful!\n")
-
-        print("Conclusions extracted:")
-        if result.conclusions:
-            for i, conclusion in enumerate(result.conclusions, 1):
-                print(f"  {i}. {conclusion}")
-        else:
-            print("  None")
-
-        print("\nArguments (Conclusion-Premise pairs):")
-        if result.arguments:
-            for i, arg in enumerate(result.arguments, 1):
-                print(f"\n  Argument {i}:")
-                print(f"    Conclusion: {arg['conclusion']}")
-                print("    Premises:")
-                if arg["premises"]:
-                    for j, premise in enumerate(arg["premises"], 1):
-                        print(f"      {j}. {premise}")
-                else:
-                    print("      None")
-        else:
-            print("  None")
-    else:
-        print(f"Extraction failed: {result.error_message}")
+    _write_results([result])
 
     print("\n" + "=" * 70)
 
+    if not run_batch:
+        return
+
     # batch
     print("Batch Processing Example")
     articles = [
@@ -76,36 +110,8 @@ y permite a estudiantes de áreas rurales acceder a educación de calidad."""
     results = extractor.process_batch(articles)
 
     # Display batch results
-    for result in results:
-        if result.success:
-            print(f"Extraction successful for article {result.article_id}!\n")
-
-            print("Conclusions extracted:")
-            if result.conclusions:
-                for i, conclusion in enumerate(result.conclusions, 1):
-                    print(f"  {i}. {conclusion}")
-            else:
-                print("  None")
-
-            print("\nArguments (Conclusion-Premise pairs):")
-            if result.arguments:
-                for i, arg in enumerate(result.arguments, 1):
-                    print(f"\n  Argument {i}:")
-                    print(f"    Conclusion: {arg['conclusion']}")
-                    print("    Premises:")
-                    if arg["premises"]:
-                        for j, premise in enumerate(arg["premises"], 1):
-                            print(f"      {j}. {premise}")
-                    else:
-                        print("      None")
-            else:
-                print("  None")
-        else:
-            print(
-                f"Extraction failed for article \
-                  {result.article_id}: {result.error_message}"
-            )
+    _write_results(results)
 
 
 if __name__ == "__main__":
-    main()
+    main(run_batch="--no-batch" not in sys.argv)
@@ -2,13 +2,21 @@
 
 """Example usage of the Socratic extraction pipeline."""
 
+import sys
+
 from argumentation_mining.pipelines.socratic_extraction import (
     QAArgumentExtractor,
 )
 
 
-def main() -> None:
-    """Run example extraction pipeline."""
+def main(*, run_batch: bool = True) -> None:
+    """
+    Run example extraction pipeline.
+
+    Args:
+        run_batch: Whether to also run the (slow) Batch API example.
+
+    """
     # Initialize extractor
     extractor = QAArgumentExtractor(model="gpt-4o-mini")
 
@@ -30,17 +38,25 @@ def main() -> None:
 
     result = extractor.process_single(sample_text, article_id="example_1")
 
-    print(f"\nSuccess: {result.success}")
-    print(f"\nExtracted {len(result.questions)} questions:")
-    for i, q in enumerate(result.questions or [], 1):
-        print(f"  {i}. {q}")
-
-    print(f"\nExtracted {len(result.arguments or [])} arguments:")
+    parts = [
+        f"\nSuccess: {result.success}",
+        f"\nExtracted {len(result.questions or [])} questions:",
+    ]
+    parts.extend(f"  {i}. {q}" for i, q in enumerate(result.questions or [], 1))
+    parts.append(f"\nExtracted {len(result.arguments or [])} arguments:")
     for i, arg in enumerate(result.arguments or [], 1):
-        print(f"\n  Argument {i}:")
-        print(f"    Question: {arg['question']}")
-        print(f"    Claim: {arg['claim']}")
-        print(f"    Premises: {len(arg['premises'])}")
+        parts.extend(
+            (
+                f"\n  Argument {i}:",
+                f"    Question: {arg.question}",
+                f"    Claim: {arg.claim}",
+                f"    Premises: {len(arg.premises)}",
+            ),
+        )
+    sys.stdout.write("\n".join(parts) + "\n")
+
+    if not run_batch:
+        return
 
     # Example 2: Batch Processing
     print("\n" + "=" * 60)
@@ -71,11 +87,15 @@ def main() -> None:
         id_column="id",
         output_dir="data/interim",
     )
-    for result in results:
-        print(f"\nArticle: {result.article_id}")
-        print(f"Success: {result.success}")
-        print(f"Arguments extracted: {len(result.arguments or [])}")
+    sys.stdout.write(
+        "".join(
+            f"\nArticle: {result.article_id}\n"
+            f"Success: {result.success}\n"
+            f"Arguments extracted: {len(result.arguments or [])}\n"
+            for result in results
+        ),
+    )
 
 
 if __name__ == "__main__":
-    main()
+    main(run_batch="--no-batch" not in sys.argv)
@@ -4,12 +4,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-import time
 import traceback
 
 from argumentation_mining.utils.openai_calls import (
     OpenAIClient,
-    build_batch_request,
+    build_batch_requests,
     extract_batch_result,
 )
 
@@ -48,15 +47,12 @@ def test_batch_call() -> None:
     ]
 
     print(f"\nCreating {len(prompts)} batch requests...")
-    requests = [
-        build_batch_request(
-            custom_id=f"math_{i}",
-            prompt=prompt,
-            model="gpt-4o-mini",
-            temperature=0.0,
-        )
-        for i, prompt in enumerate(prompts)
-    ]
+    requests = build_batch_requests(
+        prompts,
+        model="gpt-4o-mini",
+        temperature=0.0,
+        id_prefix="math",
+    )
 
     # Submit batch
     output_path = Path("./data/interim/test_batch.jsonl")
@@ -84,12 +80,12 @@ def test_batch_call() -> None:
 
     # If you want to wait and poll (not recommended for long batches)
     if input("\nWait and poll for completion? (y/N): ").lower() == "y":
-        print("\nPolling every 10 seconds (press Ctrl+C to stop)...")
+        print("\nPolling with backoff (press Ctrl+C to stop)...")
         try:
-            while not status.is_complete:
-                time.sleep(10)
-                status = client.check_batch(job.job_id)
-                print(f"   Status: {status.status}")
+            status = client.wait_for_batch(
+                job.job_id,
+                on_poll=lambda s: print(f"   Status: {s.status}"),
+            )
 
             if status.status == "completed":
                 print("\nBatch completed! Getting results...")
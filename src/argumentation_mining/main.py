@@ -7,29 +7,37 @@ extraction on a dataset.
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import asdict, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
-from argumentation_mining.pipelines.direct_extraction.direct_extraction import (
-    DirectArgumentExtractor,
-    DirectExtractionResult,
-)
-from argumentation_mining.pipelines.socratic_extraction.socratic_extraction import (  # noqa: E501
-    QAArgumentExtractor,
-    QAResult,
-)
+from argumentation_mining.utils.hashing import fingerprint
+from argumentation_mining.utils.llm_cache import LLMCache
 from argumentation_mining.utils.logger import setup_logger
 from argumentation_mining.utils.output_formatter import (
     print_statistics,
     save_as_csv,
     save_as_json,
 )
+from argumentation_mining.utils.rate_limit import TokenBucket
+from argumentation_mining.utils.semantic_cache import SemanticCache
+from argumentation_mining.utils.tokens import count_tokens, truncate_texts
 
 if TYPE_CHECKING:
     from logging import Logger
 
+    from argumentation_mining.pipelines.direct_extraction.direct_extraction import (  # noqa: E501
+        DirectArgumentExtractor,
+        DirectExtractionResult,
+    )
+    from argumentation_mining.pipelines.socratic_extraction.socratic_extraction import (  # noqa: E501
+        QAArgumentExtractor,
+        QAResult,
+    )
+
 
 def main(  # noqa: PLR0915, PLR0913
     data_file: str = "./data/raw/columns_chi2_w_inter.xlsx",
@@ -41,9 +49,16 @@ def main(  # noqa: PLR0915, PLR0913
     log_file: str = "./reports/argumentation_mining.log",
     *,
     run_batch: bool = True,
+    resume: bool = False,
     num_rows: int | None = None,
     start_row: int = 0,  # New parameter for start index
     end_row: int | None = None,  # New parameter for end index
+    max_concurrency: int = 20,
+    cache_dir: str | None = None,
+    cache_ttl: float | None = None,
+    semantic_threshold: float | None = None,
+    max_input_tokens: int | None = None,
+    tokens_per_minute: int | None = None,
 ) -> list[dict[str, Any]]:
     """
     Active runner of the pipeline.
@@ -64,10 +79,31 @@ def main(  # noqa: PLR0915, PLR0913
         log_file: Path to the log file.
         run_batch: Whether to run the pipeline in batch mode (True)
                    or sequential single mode (False).
+        resume: In batch mode, reuse the phase results an earlier run over
+                the same data saved under ``data/interim`` instead of
+                resubmitting those phases.
         num_rows: Number of rows to process. If None, process all rows.
         start_row: Starting row index (0-based) for processing.
         end_row: Ending row index (exclusive) for processing. If None,
                  process to end.
+        max_concurrency: Maximum number of articles processed at once in
+                         sequential (non-batch) mode. Tune to the API
+                         rate limit.
+        cache_dir: Directory for the on-disk LLM response cache. If None,
+                   responses are not cached. Only non-batch calls use it.
+        cache_ttl: Seconds after which cached responses expire. If None,
+                   they never expire.
+        semantic_threshold: Cosine similarity above which the socratic
+                            pipeline reuses the answer to a near-identical
+                            question about the same article. Questions are
+                            then answered one request each so they can be
+                            matched individually. If None, the semantic
+                            cache is disabled.
+        max_input_tokens: Truncate articles longer than this many tokens
+                          before submission. If None, texts are sent as is.
+        tokens_per_minute: Client-side token budget for non-batch calls.
+                           Set it just under the account's TPM limit to
+                           avoid 429 retry storms. If None, no limit.
 
     Returns:
         List of result dictionaries.
@@ -92,19 +128,21 @@ def main(  # noqa: PLR0915, PLR0913
     logger.info("  Output format: %s", output_format)
     logger.info("  Batch mode: %s", run_batch)
     logger.info("  Rows to process: %s", num_rows or "all")
+    logger.info("  LLM cache: %s", cache_dir or "disabled")
+    logger.info("  Token budget (TPM): %s", tokens_per_minute or "unlimited")
 
     # 2. Load and preprocess the data
+    if end_row is None and num_rows is not None:
+        end_row = start_row + num_rows
+
     logger.info("Loading data...")
-    data = load_data(data_file)
+    data = load_data(
+        data_file,
+        start_row=start_row,
+        end_row=end_row,
+        columns=[id_column, text_column],
+    )
     logger.info("Loaded %d rows", len(data))
-
-    # Slice data based on start_row and end_row
-    if end_row is not None:
-        data = data.iloc[start_row:end_row]
-    elif num_rows is not None:
-        data = data.iloc[start_row : start_row + num_rows]
-    else:
-        data = data.iloc[start_row:]
     logger.info(
         "Processing rows from %d to %d", start_row, len(data) + start_row - 1
     )
@@ -112,12 +150,37 @@ def main(  # noqa: PLR0915, PLR0913
     preprocessed_data = preprocess_data(data, text_column, id_column, logger)
     logger.info("Preprocessed %d rows", len(preprocessed_data))
 
-    # 3. Pipeline selection and initialization
+    # 3. Pipeline selection and initialization (imported on demand so only
+    # the selected pipeline is loaded)
     logger.info("Initializing pipeline: %s", pipeline_name)
+    cache = LLMCache(cache_dir, ttl=cache_ttl) if cache_dir else None
+    token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+    semantic_cache = (
+        SemanticCache(threshold=semantic_threshold)
+        if semantic_threshold is not None
+        and pipeline_name == "socratic_extraction"
+        else None
+    )
     if pipeline_name == "socratic_extraction":
-        extractor = QAArgumentExtractor(logger=logger)
+        from argumentation_mining.pipelines.socratic_extraction.socratic_extraction import (  # noqa: E501, PLC0415
+            QAArgumentExtractor,
+        )
+
+        extractor = QAArgumentExtractor(
+            logger=logger,
+            cache=cache,
+            token_bucket=token_bucket,
+            semantic_cache=semantic_cache,
+            multi_question=semantic_cache is None,
+        )
     elif pipeline_name == "direct_extraction":
-        extractor = DirectArgumentExtractor(logger=logger)
+        from argumentation_mining.pipelines.direct_extraction.direct_extraction import (  # noqa: E501, PLC0415
+            DirectArgumentExtractor,
+        )
+
+        extractor = DirectArgumentExtractor(
+            logger=logger, cache=cache, token_bucket=token_bucket
+        )
     else:
         error_msg = f"Unsupported pipeline: {pipeline_name}"
         logger.error(error_msg)
@@ -131,13 +194,24 @@ def main(  # noqa: PLR0915, PLR0913
         text_column,
         id_column,
         run_batch=run_batch,
+        resume=resume,
+        max_concurrency=max_concurrency,
+        max_input_tokens=max_input_tokens,
         logger=logger,
     )
 
     logger.info("Extraction completed!")
+    if cache:
+        logger.info("LLM cache hit rate: %.1f%%", cache.cache_hit_rate * 100)
+        cache.close()
+    if semantic_cache:
+        logger.info(
+            "Semantic cache hit rate: %.1f%%",
+            semantic_cache.cache_hit_rate * 100,
+        )
 
     # 5. Convert results to dictionary format
-    results_dict = _convert_results_to_dict(results)
+    results_dict = [_result_to_dict(r) for r in results]
 
     # 6. Print statistics
     print_statistics(results_dict, logger)
@@ -165,12 +239,26 @@ def main(  # noqa: PLR0915, PLR0913
     return results_dict
 
 
-def load_data(file_path: str) -> pd.DataFrame:
+def load_data(
+    file_path: str,
+    *,
+    start_row: int = 0,
+    end_row: int | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
     """
     Load data from a specified file.
 
+    Only the rows in ``[start_row, end_row)`` and the requested columns are
+    parsed, so slicing a large workbook does not load the whole sheet.
+    Requested columns missing from the file are skipped; callers validate
+    them afterwards.
+
     Args:
         file_path: Path to the input data file.
+        start_row: First data row to load (0-based, header excluded).
+        end_row: Data row to stop at (exclusive). If None, load to the end.
+        columns: Columns to keep. If None, keep all columns.
 
     Returns:
         data: Loaded data as a pandas DataFrame.
@@ -182,9 +270,16 @@ def load_data(file_path: str) -> pd.DataFrame:
     file_path_obj = Path(file_path)
 
     if file_path_obj.suffix == ".xlsx":
-        data = pd.read_excel(file_path)
+        data = _read_excel_rows(file_path_obj, start_row, end_row, columns)
     elif file_path_obj.suffix == ".csv":
-        data = pd.read_csv(file_path)
+        data = pd.read_csv(
+            file_path,
+            skiprows=range(1, start_row + 1),
+            nrows=None if end_row is None else max(end_row - start_row, 0),
+            usecols=None if columns is None else lambda c: c in columns,
+        )
+    elif file_path_obj.suffix == ".parquet":
+        data = _read_parquet_rows(file_path_obj, start_row, end_row, columns)
     else:
         msg = f"Unsupported file format: {file_path_obj.suffix}"
         raise ValueError(msg)
@@ -192,6 +287,101 @@ def load_data(file_path: str) -> pd.DataFrame:
     return data
 
 
+def _read_parquet_rows(
+    file_path: Path,
+    start_row: int,
+    end_row: int | None,
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    """
+    Read a row window of a Parquet file, skipping row groups outside it.
+
+    Args:
+        file_path: Path to the .parquet file.
+        start_row: First data row to load (0-based).
+        end_row: Data row to stop at (exclusive), or None for all rows.
+        columns: Columns to keep, or None for all columns.
+
+    Returns:
+        DataFrame with the selected rows and columns.
+
+    """
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    parquet_file = pq.ParquetFile(file_path)
+    names = parquet_file.schema_arrow.names
+    keep = names if columns is None else [n for n in names if n in columns]
+    num_rows = parquet_file.metadata.num_rows
+    stop = num_rows if end_row is None else min(end_row, num_rows)
+
+    tables = []
+    first_offset = None
+    offset = 0
+    for i in range(parquet_file.num_row_groups):
+        group_rows = parquet_file.metadata.row_group(i).num_rows
+        if offset < stop and offset + group_rows > start_row:
+            if first_offset is None:
+                first_offset = offset
+            tables.append(parquet_file.read_row_group(i, columns=keep))
+        offset += group_rows
+
+    if not tables:
+        return parquet_file.schema_arrow.empty_table().select(keep).to_pandas()
+    table = pa.concat_tables(tables)
+    return table.slice(
+        start_row - first_offset,
+        max(stop - start_row, 0),
+    ).to_pandas()
+
+
+def _read_excel_rows(
+    file_path: Path,
+    start_row: int,
+    end_row: int | None,
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    """
+    Stream a row window of the first sheet with openpyxl in read-only mode.
+
+    Args:
+        file_path: Path to the .xlsx file.
+        start_row: First data row to load (0-based, header excluded).
+        end_row: Data row to stop at (exclusive), or None for all rows.
+        columns: Columns to keep, or None for all columns.
+
+    Returns:
+        DataFrame with the selected rows and columns.
+
+    """
+    # openpyxl is only needed for Excel input, so import it on demand
+    from openpyxl import load_workbook  # noqa: PLC0415
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        header = next(sheet.iter_rows(max_row=1, values_only=True), ())
+        keep = [
+            i
+            for i, name in enumerate(header)
+            if columns is None or name in columns
+        ]
+
+        # Sheet row 1 is the header, so data row r lives on sheet row r + 2.
+        rows = (
+            [row[i] if i < len(row) else None for i in keep]
+            for row in sheet.iter_rows(
+                min_row=start_row + 2,
+                max_row=None if end_row is None else end_row + 1,
+                values_only=True,
+            )
+            if any(cell is not None for cell in row)
+        )
+        return pd.DataFrame(rows, columns=[header[i] for i in keep])
+    finally:
+        workbook.close()
+
+
 def preprocess_data(
     data: pd.DataFrame,
     text_column: str,
@@ -209,7 +399,9 @@ def preprocess_data(
         logger: Optional logger for logging.
 
     Returns:
-        preprocessed_data: Preprocessed data.
+        preprocessed_data: Preprocessed data. It may share memory with
+                           ``data`` and is only read downstream, so treat
+                           it as read-only.
 
     Raises:
         ValueError: If required columns are not found.
@@ -228,9 +420,9 @@ def preprocess_data(
             logger.error(msg)
         raise ValueError(msg)
 
-    # Drop all other columns and return a DataFrame
-    # with only the required columns
-    return data[[id_column, text_column]].copy()
+    # Keep only the required columns. load_data already projected them on
+    # read, so there is nothing left to copy.
+    return data[[id_column, text_column]].reset_index(drop=True)
 
 
 def run_pipeline(  # noqa: PLR0913
@@ -240,6 +432,10 @@ def run_pipeline(  # noqa: PLR0913
     id_column: str,
     *,
     run_batch: bool = True,
+    resume: bool = False,
+    max_concurrency: int = 20,
+    bucket_size: int = 1000,
+    max_input_tokens: int | None = None,
     logger: Logger | None = None,
 ) -> list[QAResult | DirectExtractionResult]:
     """
@@ -251,79 +447,285 @@ def run_pipeline(  # noqa: PLR0913
         text_column: Name of the text column.
         id_column: Name of the ID column.
         run_batch: Whether to run in batch mode.
+        resume: In batch mode, reuse saved phase results of earlier runs.
+        max_concurrency: Maximum number of in-flight articles when not
+                         running in batch mode.
+        bucket_size: Maximum number of articles per batch job in batch
+                     mode. Articles are grouped by token length first.
+        max_input_tokens: Truncate articles longer than this many tokens
+                          before submission. If None, texts are sent as is.
         logger: Optional logger for logging.
 
     Returns:
         List of result objects (QAResult or DirectExtractionResult).
 
     """
-    # Convert DataFrame to list of dictionaries
-    articles = data.rename(
-        columns={text_column: "text", id_column: "article_id"},
-    ).to_dict("records")
+    # Pull the two columns out as plain lists; only batch mode needs dicts
+    all_texts = data[text_column].tolist()
+    all_ids = data[id_column].tolist()
+
+    # Send each distinct text once and fan the result out to its duplicates
+    unique_indices, positions = _dedupe_texts(all_texts)
+    texts = [all_texts[i] for i in unique_indices]
+    ids = [all_ids[i] for i in unique_indices]
+    if logger and len(texts) < len(all_texts):
+        logger.info(
+            "Skipping %d duplicate articles (%d unique texts)",
+            len(all_texts) - len(texts),
+            len(texts),
+        )
+
+    token_counts = None
+    if max_input_tokens is not None:
+        original_texts = texts
+        texts, token_counts = truncate_texts(
+            texts, extractor.model, max_input_tokens
+        )
+        if logger:
+            logger.info(
+                "Truncated %d articles to at most %d tokens",
+                sum(
+                    new != old
+                    for new, old in zip(texts, original_texts, strict=True)
+                ),
+                max_input_tokens,
+            )
 
     if run_batch:
         if logger:
             logger.info("Running pipeline in BATCH mode...")
-        results = extractor.process_batch(
-            articles=articles,
-            text_column="text",
-            id_column="article_id",
-            output_dir="data/interim",
+        articles = [
+            {"text": text, "article_id": article_id}
+            for text, article_id in zip(texts, ids, strict=True)
+        ]
+        if token_counts is None:
+            token_counts = count_tokens(texts, extractor.model)
+        buckets = _bucket_by_length(token_counts, bucket_size)
+        results = asyncio.run(
+            _process_buckets(
+                extractor,
+                articles,
+                buckets,
+                resume=resume,
+                logger=logger,
+            ),
         )
     else:
         if logger:
             logger.info("Running pipeline in SEQUENTIAL mode...")
-        results = []
-        for i, article in enumerate(articles):
-            if logger:
-                logger.info(
-                    "Processing article %d/%d: %s",
-                    i + 1,
-                    len(articles),
-                    article.get("article_id", "unknown"),
-                )
-            result = extractor.process_single(
-                text=article["text"],
-                article_id=article.get("article_id"),
+        results = asyncio.run(
+            _process_concurrently(
+                extractor,
+                texts,
+                ids,
+                max_concurrency=max_concurrency,
+                logger=logger,
+            ),
+        )
+
+    return [
+        results[p]
+        if unique_indices[p] == i
+        else replace(results[p], article_id=all_ids[i], text=all_texts[i])
+        for i, p in enumerate(positions)
+    ]
+
+
+def _result_to_dict(
+    result: DirectExtractionResult | QAResult,
+) -> dict[str, Any]:
+    """Convert a result to a plain dict, including its arguments."""
+    record = asdict(result)
+    if record["arguments"]:
+        # Both pipelines keep arguments as NamedTuples until output
+        record["arguments"] = [
+            arg._asdict() if isinstance(arg, tuple) else arg
+            for arg in record["arguments"]
+        ]
+    return record
+
+
+def _dedupe_texts(texts: list[str]) -> tuple[list[int], list[int]]:
+    """
+    Find the distinct texts, ignoring whitespace-only differences.
+
+    Args:
+        texts: Article texts.
+
+    Returns:
+        Tuple of (index of the first occurrence of each distinct text,
+        position of each text's representative in that list).
+
+    """
+    first_seen: dict[bytes, int] = {}
+    unique_indices = []
+    positions = []
+    for i, text in enumerate(texts):
+        normalized = " ".join(str(text).split())
+        key = fingerprint(normalized)
+        if key not in first_seen:
+            first_seen[key] = len(unique_indices)
+            unique_indices.append(i)
+        positions.append(first_seen[key])
+    return unique_indices, positions
+
+
+def _bucket_by_length(
+    token_counts: list[int],
+    bucket_size: int = 1000,
+) -> list[list[int]]:
+    """
+    Group article indices into buckets of similar token length.
+
+    Keeping each batch job homogeneous stops short articles from waiting on
+    long ones.
+
+    Args:
+        token_counts: Token count of each article.
+        bucket_size: Maximum number of articles per bucket.
+
+    Returns:
+        Lists of article indices, shortest articles first.
+
+    """
+    order = sorted(range(len(token_counts)), key=token_counts.__getitem__)
+    return [
+        order[start : start + bucket_size]
+        for start in range(0, len(order), bucket_size)
+    ]
+
+
+async def _process_buckets(
+    extractor: QAArgumentExtractor | DirectArgumentExtractor,
+    articles: list[dict[str, Any]],
+    buckets: list[list[int]],
+    *,
+    resume: bool = False,
+    logger: Logger | None = None,
+) -> list[QAResult | DirectExtractionResult]:
+    """
+    Run one batch job per bucket, all buckets at once.
+
+    ``process_batch`` is blocking (upload, then poll until done), so each
+    bucket runs in its own worker thread and the uploads and waits overlap.
+
+    Args:
+        extractor: Initialized extractor instance.
+        articles: Article dicts with ``text`` and ``article_id`` keys.
+        buckets: Lists of indices into ``articles``.
+        resume: Reuse the phase results saved for each bucket.
+        logger: Optional logger for progress messages.
+
+    Returns:
+        Results in the same order as ``articles``.
+
+    """
+
+    async def _submit(k: int, indices: list[int]) -> list[Any]:
+        if logger:
+            logger.info(
+                "Submitting bucket %d/%d (%d articles)",
+                k + 1,
+                len(buckets),
+                len(indices),
             )
-            results.append(result)
+        return await asyncio.to_thread(
+            extractor.process_batch,
+            articles=[articles[i] for i in indices],
+            text_column="text",
+            id_column="article_id",
+            output_dir=f"data/interim/bucket_{k}",
+            resume=resume,
+        )
+
+    bucket_results = await asyncio.gather(
+        *(_submit(k, indices) for k, indices in enumerate(buckets)),
+    )
 
+    results = [None] * len(articles)
+    for indices, bucket in zip(buckets, bucket_results, strict=True):
+        for i, result in zip(indices, bucket, strict=True):
+            results[i] = result
     return results
 
 
-def _convert_results_to_dict(
-    results: list[QAResult | DirectExtractionResult],
-) -> list[dict[str, Any]]:
+async def _process_concurrently(
+    extractor: QAArgumentExtractor | DirectArgumentExtractor,
+    texts: list[str],
+    ids: list[Any],
+    *,
+    max_concurrency: int,
+    logger: Logger | None = None,
+) -> list[QAResult | DirectExtractionResult]:
     """
-    Convert result objects to dictionaries for serialization.
+    Process articles one request at a time each, many articles at once.
+
+    Results keep the input order. An article whose API calls keep failing
+    after retries gets a failed result instead of aborting the run.
 
     Args:
-        results: List of result objects (QAResult or DirectExtractionResult).
+        extractor: Initialized extractor instance.
+        texts: Article texts.
+        ids: Article identifiers, aligned with ``texts``.
+        max_concurrency: Maximum number of articles in flight.
+        logger: Optional logger for logging.
 
     Returns:
-        List of result dictionaries.
+        List of result objects, one per article.
 
     """
-    output = []
-    for r in results:
-        result_dict = {
-            "article_id": r.article_id,
-            "text": r.text,
-            "success": r.success,
-            "error_message": r.error_message,
-            "arguments": r.arguments,
-        }
-
-        # Add pipeline-specific fields
-        if isinstance(r, QAResult):
-            result_dict["questions"] = r.questions
-        elif isinstance(r, DirectExtractionResult):
-            result_dict["conclusions"] = r.conclusions
-
-        output.append(result_dict)
-
-    return output
+    semaphore = asyncio.Semaphore(max_concurrency)
+    total = len(texts)
+
+    async def _bounded(
+        i: int,
+        text: str,
+        article_id: Any,  # noqa: ANN401
+    ) -> QAResult | DirectExtractionResult:
+        async with semaphore:
+            if logger:
+                logger.info(
+                    "Processing article %d/%d: %s",
+                    i + 1,
+                    total,
+                    article_id,
+                )
+            return await extractor.aprocess_single(
+                text=text,
+                article_id=article_id,
+            )
+
+    try:
+        outcomes = await asyncio.gather(
+            *(
+                _bounded(i, text, article_id)
+                for i, (text, article_id) in enumerate(
+                    zip(texts, ids, strict=True),
+                )
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await extractor.client.aclose()
+
+    result_cls = extractor.result_class
+    results = []
+    for text, article_id, outcome in zip(texts, ids, outcomes, strict=True):
+        if not isinstance(outcome, Exception):
+            results.append(outcome)
+            continue
+
+        if logger:
+            logger.error("Article %s failed: %s", article_id, outcome)
+        results.append(
+            result_cls(
+                text=text,
+                article_id=article_id,
+                error_message=str(outcome),
+            ),
+        )
+
+    return results
 
 
 if __name__ == "__main__":
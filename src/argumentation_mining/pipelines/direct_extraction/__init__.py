@@ -1,8 +1,9 @@
 """Direct extraction pipeline for argument mining."""
 
 from argumentation_mining.pipelines.direct_extraction.direct_extraction import (
+    Argument,
     DirectArgumentExtractor,
     DirectExtractionResult,
 )
 
-__all__ = ["DirectArgumentExtractor", "DirectExtractionResult"]
+__all__ = ["Argument", "DirectArgumentExtractor", "DirectExtractionResult"]
@@ -0,0 +1,192 @@
+"""
+Parsing helpers for direct-extraction responses.
+
+``LIST_ITEM_RE`` and ``clean_items`` are also used by the Socratic pipeline.
+
+These run once per article (or per batch result line), so they make up the
+CPU-bound part of large batch runs. The module is self-contained and fully
+annotated so it can be compiled with mypyc in place::
+
+    mypyc src/argumentation_mining/pipelines/direct_extraction/_parsing.py
+
+The resulting extension module is then imported instead of this file.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from typing import Any, NamedTuple
+
+from argumentation_mining.utils.openai_calls import extract_batch_result
+
+# One list item per line: "1." / "1)" numbering or a "-", "*" or "•" bullet,
+# followed by the item text (surrounding whitespace and bullets dropped)
+LIST_ITEM_RE = re.compile(
+    r"^[ \t]*(?:\d+[.)]|[-*•])[ \t\-*•]*(\S.*?)\s*$",
+    re.MULTILINE,
+)
+
+
+class Argument(NamedTuple):
+    """A conclusion and the premises supporting it."""
+
+    conclusion: str
+    premises: tuple[str, ...]
+
+
+def clean_items(values: list[Any] | str | None) -> list[str]:
+    """
+    Strip JSON list items and drop empty ones.
+
+    A bare string counts as a one-item list; any other non-list value
+    yields no items.
+    """
+    if isinstance(values, str):
+        values = [values]
+    elif not isinstance(values, list):
+        return []
+    return [item for v in values if (item := str(v).strip())]
+
+
+def _load_arguments(content: str, kind: str) -> list[Any]:
+    """Return the ``arguments`` list of a JSON response."""
+    try:
+        entries = json.loads(content)["arguments"]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        msg = f"Invalid {kind} response: {e}"
+        raise ValueError(msg) from e
+    if not isinstance(entries, list):
+        # Callers only catch ValueError for malformed responses
+        msg = f"Invalid {kind} response: 'arguments' is not a list"
+        raise ValueError(msg)  # noqa: TRY004
+    return entries
+
+
+def index_batch_results(results: list[dict[str, Any]]) -> dict[int, str]:
+    """
+    Map article index to response content for one batch phase.
+
+    Custom IDs have the form ``<phase>_<index>``; the index is parsed once
+    here so the merge loops can look results up by integer.
+    """
+    contents: dict[int, str] = {}
+    for result in results:
+        _, _, index = result.get("custom_id", "").rpartition("_")
+        content = extract_batch_result(result)
+        if index.isdigit() and content:
+            contents[int(index)] = content
+    return contents
+
+
+def parse_list_items(text: str) -> list[str]:
+    """
+    Parse items from numbered or bulleted list.
+
+    JSON responses (a list of strings, or an object holding one) are
+    decoded directly; anything else is scanned with ``LIST_ITEM_RE``.
+    """
+    stripped = text.lstrip()
+    if stripped[:1] in {"[", "{"}:
+        try:
+            data = json.loads(stripped)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(data, dict):
+                data = next(
+                    (v for v in data.values() if isinstance(v, list)),
+                    [],
+                )
+            if isinstance(data, list):
+                return clean_items(data)
+
+    return LIST_ITEM_RE.findall(text)
+
+
+def build_conclusions_map(
+    phase1_results: list[dict[str, Any]],
+) -> dict[int, list[str]]:
+    """Build mapping of article index to conclusions."""
+    # Conclusions are looked up again when pairing premises
+    return {
+        i: [sys.intern(item) for item in parse_list_items(content)]
+        for i, content in index_batch_results(phase1_results).items()
+    }
+
+
+def parse_premises_json(content: str, n_conclusions: int) -> list[list[str]]:
+    """
+    Parse a multi-conclusion premise response.
+
+    Entries are matched to conclusions by their ``conclusion`` number
+    when present, otherwise by position.
+
+    Args:
+        content: JSON response text.
+        n_conclusions: Number of conclusions the prompt listed.
+
+    Returns:
+        One premise list per conclusion, in conclusion order.
+
+    Raises:
+        ValueError: If the response is not the expected JSON object.
+
+    """
+    entries = _load_arguments(content, "premise")
+
+    premises_lists: list[list[str]] = [[] for _ in range(n_conclusions)]
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            continue
+        number = entry.get("conclusion")
+        index = number - 1 if isinstance(number, int) else position
+        if 0 <= index < n_conclusions:
+            premises_lists[index] = clean_items(entry.get("premises"))
+    return premises_lists
+
+
+def parse_arguments_json(content: str) -> list[Argument]:
+    """
+    Parse a combined conclusions-and-premises response.
+
+    Args:
+        content: JSON response text.
+
+    Returns:
+        Arguments in response order.
+
+    Raises:
+        ValueError: If the response is not the expected JSON object.
+
+    """
+    entries = _load_arguments(content, "argument")
+
+    arguments_list: list[Argument] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        conclusion = str(entry.get("conclusion") or "").strip()
+        if not conclusion:
+            continue
+        arguments_list.append(
+            Argument(
+                sys.intern(conclusion),
+                tuple(clean_items(entry.get("premises"))),
+            ),
+        )
+    return arguments_list
+
+
+def pair_arguments(
+    conclusions: list[str],
+    premises_lists: list[list[str]],
+) -> list[Argument]:
+    """Zip conclusions with their premise lists into arguments."""
+    missing = len(conclusions) - len(premises_lists)
+    padded = premises_lists + [[] for _ in range(missing)]
+    return [
+        Argument(conclusion, tuple(premises))
+        for conclusion, premises in zip(conclusions, padded, strict=False)
+    ]
@@ -13,41 +13,100 @@ Pipeline:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import logging
 from pathlib import Path
-import time
-from typing import TYPE_CHECKING, Any
-
-import yaml
-
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from argumentation_mining.pipelines.direct_extraction._parsing import (
+    Argument,
+    build_conclusions_map,
+    index_batch_results,
+    pair_arguments,
+    parse_arguments_json,
+    parse_list_items,
+    parse_premises_json,
+)
+from argumentation_mining.utils.batch_poller import BatchPoller
+from argumentation_mining.utils.checkpoint import PhaseCheckpoint, corpus_digest
+from argumentation_mining.utils.llm_cache import LLMCache
+from argumentation_mining.utils.local_llm import (
+    DEFAULT_LOCAL_MODEL,
+    LocalLLMClient,
+)
 from argumentation_mining.utils.openai_calls import (
     OpenAIClient,
     build_batch_request,
-    extract_batch_result,
+    dedupe_batch_requests,
+    fan_out_batch_results,
 )
+from argumentation_mining.utils.prompts import load_prompts
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from logging import Logger
 
+    from argumentation_mining.utils.rate_limit import TokenBucket
+
 
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+# Phase-2 responses are requested as JSON objects (see premise_extraction_multi)
+_JSON_RESPONSE = {"type": "json_object"}
+
+
+def _group_similar(
+    vectors: np.ndarray,
+    threshold: float,
+) -> tuple[list[int], list[int]]:
+    """
+    Group rows whose cosine similarity reaches ``threshold``.
+
+    Each row joins the first earlier representative it is similar enough
+    to, or becomes a new representative.
+
+    Args:
+        vectors: One embedding per row.
+        threshold: Minimum cosine similarity to merge two rows.
+
+    Returns:
+        Tuple of (row index of each representative, group number of each
+        row).
+
+    """
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    similarity = normalized @ normalized.T
+
+    leaders: list[int] = []
+    groups: list[int] = []
+    for row in range(len(normalized)):
+        matches = np.flatnonzero(similarity[row, leaders] >= threshold)
+        if matches.size:
+            groups.append(int(matches[0]))
+        else:
+            groups.append(len(leaders))
+            leaders.append(row)
+    return leaders, groups
+
+
+@dataclass(slots=True)
 class DirectExtractionResult:
     """Results from direct extraction argumentation mining."""
 
     text: str
     article_id: str | None = None
     conclusions: list[str] | None = None
-    arguments: list[dict[str, Any]] | None = None
+    arguments: list[Argument] | None = None
     success: bool = False
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class _BatchConfig:
     """Internal configuration for batch result combination."""
 
@@ -55,6 +114,26 @@ class _BatchConfig:
     phase_results: dict[str, list[dict[str, Any]]]
     text_column: str
     id_column: str | None
+    # Per article: for each conclusion, the position of its representative
+    # in the Phase 2 request (only for articles where conclusions merged)
+    conclusion_groups: dict[int, list[int]] = field(default_factory=dict)
+
+    def make_result(
+        self,
+        index: int,
+        conclusions: list[str],
+        arguments: list[Argument],
+    ) -> DirectExtractionResult:
+        """Build the finished result for one article in a single call."""
+        article = self.articles[index]
+        return DirectExtractionResult(
+            text=article.get(self.text_column, ""),
+            article_id=article.get(self.id_column) if self.id_column else None,
+            conclusions=conclusions,
+            arguments=arguments,
+            success=bool(arguments),
+            error_message=None if arguments else "No arguments extracted",
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -71,25 +150,73 @@ class DirectArgumentExtractor:
     2. Extract premises for each conclusion
     """
 
-    def __init__(
+    # Result type produced by this extractor
+    result_class = DirectExtractionResult
+
+    def __init__(  # noqa: PLR0913
         self,
         api_key: str | None = None,
-        model: str = "gpt-4o-mini",
+        model: str | None = None,
         prompts_path: str | Path | None = None,
         logger: Logger | None = None,
+        *,
+        cache: LLMCache | None = None,
+        token_bucket: TokenBucket | None = None,
+        cache_enabled: bool = False,
+        backend: Literal["openai", "vllm"] = "openai",
+        temperature: float = 0.0,
+        seed: int | None = 0,
     ) -> None:
         """
         Initialize the extractor.
 
         Args:
             api_key: OpenAI API key (reads from env if not provided).
-            model: OpenAI model to use.
+            model: Model to use. Defaults to ``gpt-4o-mini`` for the OpenAI
+                   backend and ``DEFAULT_LOCAL_MODEL`` for vLLM.
             prompts_path: Path to prompts YAML file.
             logger: Logger instance for logging.
+            cache: Optional completion cache for single (non-batch) calls.
+            token_bucket: Optional tokens-per-minute limiter for async calls.
+            cache_enabled: Create a default ``LLMCache`` when no ``cache`` is
+                           given.
+            backend: ``"openai"`` for the OpenAI API, or ``"vllm"`` to run a
+                     local model in-process (short articles, no API latency).
+            temperature: Sampling temperature for every request. The default
+                         of 0 keeps outputs reproducible, so cached and
+                         repeated requests return the same result.
+            seed: Sampling seed sent with every request, or None to omit it.
 
         """
-        self.client = OpenAIClient(api_key=api_key, model=model)
+        if cache is None and cache_enabled:
+            cache = LLMCache()
+
+        self.backend = backend
+        if backend == "vllm":
+            model = model or DEFAULT_LOCAL_MODEL
+            self.client = LocalLLMClient(model=model, cache=cache)
+        else:
+            model = model or "gpt-4o-mini"
+            self.client = OpenAIClient(
+                api_key=api_key,
+                model=model,
+                cache=cache,
+                token_bucket=token_bucket,
+            )
+            # Poll quickly at first so short jobs return promptly, then back
+            # off; jobs waited on from several threads share one poll loop
+            self._batch_poller = BatchPoller(
+                self.client,
+                initial_delay=1.0,
+                max_delay=60.0,
+                jitter=0.2,
+                on_poll=lambda status: self._log(
+                    "Batch %s status: %s", status.job_id, status.status
+                ),
+            )
         self.model = model
+        self.temperature = temperature
+        self.seed = seed
         self.logger = logger
 
         # Load prompts
@@ -98,21 +225,34 @@ class DirectArgumentExtractor:
         else:
             prompts_path = Path(prompts_path)
 
-        with prompts_path.open("r", encoding="utf-8") as f:
-            prompts_data = yaml.safe_load(f)
+        prompts_data = load_prompts(
+            prompts_path,
+            required=(
+                "conclusion_extraction",
+                "premise_extraction",
+                "premise_extraction_multi",
+                "combined_extraction",
+            ),
+        )
 
         self.conclusion_extraction_prompt = prompts_data[
             "conclusion_extraction"
         ]
         self.premise_extraction_prompt = prompts_data["premise_extraction"]
+        self.premise_extraction_multi_prompt = prompts_data[
+            "premise_extraction_multi"
+        ]
+        self.combined_extraction_prompt = prompts_data["combined_extraction"]
 
     # --------------------------- Single Processing --------------------------
 
     def extract_conclusions(self, text: str) -> list[str]:
         """Extract all conclusions from text."""
         prompt = self.conclusion_extraction_prompt.format(text=text)
-        response = self.client.call(prompt, temperature=0.1)
-        return self._parse_list_items(response)
+        response = self.client.call(
+            prompt, temperature=self.temperature, seed=self.seed
+        )
+        return parse_list_items(response)
 
     def extract_premises(self, text: str, conclusion: str) -> list[str]:
         """Extract premises that support a specific conclusion."""
@@ -120,8 +260,10 @@ class DirectArgumentExtractor:
             text=text,
             conclusion=conclusion,
         )
-        response = self.client.call(prompt, temperature=0.1)
-        return self._parse_list_items(response)
+        response = self.client.call(
+            prompt, temperature=self.temperature, seed=self.seed
+        )
+        return parse_list_items(response)
 
     def process_single(
         self,
@@ -157,60 +299,196 @@ class DirectArgumentExtractor:
 
         return result
 
+    def extract_all_premises(
+        self,
+        text: str,
+        conclusions: list[str],
+    ) -> list[list[str]]:
+        """Extract the premises of every conclusion in one call."""
+        if not conclusions:
+            return []
+        response = self.client.call(
+            self._multi_premise_prompt(text, conclusions),
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_JSON_RESPONSE,
+        )
+        return parse_premises_json(response, len(conclusions))
+
     def _process_conclusions(
         self,
         conclusions: list[str],
         text: str,
-    ) -> list[dict[str, Any]]:
+    ) -> list[Argument]:
         """Process conclusions to extract their supporting premises."""
-        arguments_list = []
-
-        for conclusion in conclusions:
-            premises = self.extract_premises(text, conclusion)
-            arguments_list.append(
-                {
-                    "conclusion": conclusion,
-                    "premises": premises,
-                },
+        premises_lists = self.extract_all_premises(text, conclusions)
+        return pair_arguments(conclusions, premises_lists)
+
+    # --------------------------- Async Processing ---------------------------
+
+    async def aextract_conclusions(self, text: str) -> list[str]:
+        """Extract all conclusions from text without blocking."""
+        prompt = self.conclusion_extraction_prompt.format(text=text)
+        response = await self.client.acall(
+            prompt, temperature=self.temperature, seed=self.seed
+        )
+        return parse_list_items(response)
+
+    async def aextract_premises(self, text: str, conclusion: str) -> list[str]:
+        """Extract premises for a specific conclusion without blocking."""
+        prompt = self.premise_extraction_prompt.format(
+            text=text,
+            conclusion=conclusion,
+        )
+        response = await self.client.acall(
+            prompt, temperature=self.temperature, seed=self.seed
+        )
+        return parse_list_items(response)
+
+    async def aextract_all_premises(
+        self,
+        text: str,
+        conclusions: list[str],
+    ) -> list[list[str]]:
+        """Extract the premises of every conclusion in one awaited call."""
+        if not conclusions:
+            return []
+        response = await self.client.acall(
+            self._multi_premise_prompt(text, conclusions),
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_JSON_RESPONSE,
+        )
+        return parse_premises_json(response, len(conclusions))
+
+    async def aprocess_single(
+        self,
+        text: str,
+        article_id: str | None = None,
+    ) -> DirectExtractionResult:
+        """
+        Process a single article asynchronously.
+
+        Same phases as ``process_single``, but the API calls are awaited so
+        several articles can be in flight at once.
+
+        Args:
+            text: The article text.
+            article_id: Optional article identifier.
+
+        Returns:
+            DirectExtractionResult with extracted information.
+
+        """
+        result = DirectExtractionResult(text=text, article_id=article_id)
+
+        try:
+            result.conclusions = await self.aextract_conclusions(text)
+            premises_lists = await self.aextract_all_premises(
+                text,
+                result.conclusions,
+            )
+            result.arguments = pair_arguments(
+                result.conclusions,
+                premises_lists,
             )
+            result.success = True
+
+        except (ValueError, KeyError, RuntimeError) as e:
+            result.error_message = str(e)
 
-        return arguments_list
+        return result
 
     # ---------------------------- Batch Processing --------------------------
 
-    def process_batch(
+    def process_batch(  # noqa: PLR0913
         self,
         articles: list[dict[str, Any]],
         *,
         text_column: str = "text",
         id_column: str | None = None,
         output_dir: str | Path = "data/interim",
+        two_phase: bool = False,
+        similarity_threshold: float | None = None,
+        resume: bool = False,
     ) -> list[DirectExtractionResult]:
         """
         Process multiple articles using batch API.
 
+        By default each article gets a single request that returns its
+        conclusions and premises together, so only one batch job is waited
+        on. ``two_phase=True`` keeps the original conclusions-then-premises
+        flow, e.g. when Phase 1 output must be reviewed.
+
+        With ``similarity_threshold`` set, two-phase runs embed the Phase 1
+        conclusions and send only one of each group of paraphrases per
+        article to Phase 2; every member gets the group's premises.
+
+        The results of the combined request and of Phase 1 are saved under
+        ``output_dir``. With ``resume=True``, those saved by an earlier run
+        over the same articles are loaded instead of resubmitted.
+
         Args:
             articles: List of article dicts with text content.
             text_column: Column name containing article text.
             id_column: Column name containing article IDs.
             output_dir: Directory to save batch files.
+            two_phase: Run separate conclusion and premise batch jobs.
+            similarity_threshold: Cosine similarity at which conclusions of
+                                  the same article are merged before Phase 2
+                                  (e.g. 0.92). Two-phase, OpenAI backend only.
+            resume: Reuse the phase results saved in ``output_dir``.
 
         Returns:
             List of DirectExtractionResult objects.
 
+        Raises:
+            ValueError: If ``similarity_threshold`` is set with the vLLM
+                        backend, or if resuming from results of different
+                        articles.
+
         """
+        if similarity_threshold is not None and self.backend == "vllm":
+            msg = "similarity_threshold needs the OpenAI embeddings API"
+            raise ValueError(msg)
+
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint = PhaseCheckpoint(
+            output_dir,
+            corpus_digest(article.get(text_column) for article in articles),
+            resume=resume,
+        )
 
-        self._log(f"Processing {len(articles)} articles in batch mode...")
+        self._log("Processing %d articles in batch mode...", len(articles))
+
+        if not two_phase:
+            combined_results = self._checkpointed(
+                checkpoint,
+                "combined",
+                lambda: self._batch_combined(articles, text_column, output_dir),
+            )
+            config = _BatchConfig(
+                articles=articles,
+                phase_results={"combined": combined_results},
+                text_column=text_column,
+                id_column=id_column,
+            )
+            return self._combine_fused_results(config)
 
         # Two phases: conclusions -> premises
-        phase1_results = self._batch_phase1(articles, text_column, output_dir)
-        phase2_results = self._batch_phase2(
+        phase1_results = self._checkpointed(
+            checkpoint,
+            "phase1",
+            lambda: self._batch_phase1(articles, text_column, output_dir),
+        )
+        # Phase 2 also yields the conclusion groups, so it always runs
+        phase2_results, conclusion_groups = self._batch_phase2(
             articles,
             phase1_results,
             text_column,
             output_dir,
+            similarity_threshold,
         )
 
         config = _BatchConfig(
@@ -221,9 +499,38 @@ class DirectArgumentExtractor:
             },
             text_column=text_column,
             id_column=id_column,
+            conclusion_groups=conclusion_groups,
         )
         return self._combine_results(config)
 
+    def _batch_combined(
+        self,
+        articles: list[dict[str, Any]],
+        text_column: str,
+        output_dir: Path,
+    ) -> list[dict[str, Any]]:
+        """Single phase: extract conclusions and premises together."""
+        self._log("Combined conclusion and premise extraction...")
+
+        requests = (
+            build_batch_request(
+                custom_id=f"a_{i}",
+                prompt=self.combined_extraction_prompt.format(
+                    text=article[text_column],
+                ),
+                model=self.model,
+                temperature=self.temperature,
+                seed=self.seed,
+                response_format=_JSON_RESPONSE,
+            )
+            for i, article in enumerate(articles)
+            if text_column in article
+        )
+
+        return self._submit_batch(
+            requests, output_dir / "combined_arguments.jsonl"
+        )
+
     def _batch_phase1(
         self,
         articles: list[dict[str, Any]],
@@ -233,22 +540,23 @@ class DirectArgumentExtractor:
         """Phase 1: Extract conclusions."""
         self._log("Phase 1: Conclusion extraction...")
 
-        requests = [
+        requests = (
             build_batch_request(
                 custom_id=f"c_{i}",
                 prompt=self.conclusion_extraction_prompt.format(
                     text=article[text_column],
                 ),
                 model=self.model,
-                temperature=0.1,
+                temperature=self.temperature,
+                seed=self.seed,
             )
             for i, article in enumerate(articles)
             if text_column in article
-        ]
+        )
 
-        batch_file = output_dir / "phase1_conclusions.jsonl"
-        status = self.client.send_batch(requests, batch_file)
-        return self._wait_for_batch(status.job_id)
+        return self._submit_batch(
+            requests, output_dir / "phase1_conclusions.jsonl"
+        )
 
     def _batch_phase2(
         self,
@@ -256,153 +564,305 @@ class DirectArgumentExtractor:
         phase1_results: list[dict[str, Any]],
         text_column: str,
         output_dir: Path,
-    ) -> list[dict[str, Any]]:
-        """Phase 2: Extract premises for each conclusion."""
+        similarity_threshold: float | None = None,
+    ) -> tuple[list[dict[str, Any]], dict[int, list[int]]]:
+        """
+        Phase 2: Extract premises for all conclusions of each article.
+
+        Returns:
+            Tuple of (batch results, conclusion groups of the articles whose
+            near-duplicate conclusions were merged).
+
+        """
         self._log("Phase 2: Premise extraction...")
 
-        conclusions_map = self._build_conclusions_map(phase1_results)
-        requests = []
+        conclusions_map = build_conclusions_map(phase1_results)
 
-        for i, article in enumerate(articles):
-            if text_column not in article:
-                continue
+        # Articles that have text and at least one conclusion
+        pending = [
+            (i, article[text_column], conclusions_map[i])
+            for i, article in enumerate(articles)
+            if text_column in article and conclusions_map.get(i)
+        ]
+        if not pending:
+            self._log(
+                "No valid conclusions extracted in Phase 1", level="warning"
+            )
+            return [], {}
 
-            text = article[text_column]
-            conclusions = conclusions_map.get(f"c_{i}", [])
+        conclusion_groups: dict[int, list[int]] = {}
+        if similarity_threshold is not None:
+            pending, conclusion_groups = self._merge_similar_conclusions(
+                pending,
+                similarity_threshold,
+            )
 
-            for j, conclusion in enumerate(conclusions):
-                requests.append(
-                    build_batch_request(
-                        custom_id=f"p_{i}_{j}",
-                        prompt=self.premise_extraction_prompt.format(
-                            text=text,
-                            conclusion=conclusion,
-                        ),
-                        model=self.model,
-                        temperature=0.1,
-                    ),
-                )
+        # One request per article covering all of its conclusions, built
+        # lazily so send_batch streams them straight to the JSONL file
+        requests = (
+            build_batch_request(
+                custom_id=f"p_{i}",
+                prompt=self._multi_premise_prompt(text, conclusions),
+                model=self.model,
+                temperature=self.temperature,
+                seed=self.seed,
+                response_format=_JSON_RESPONSE,
+            )
+            for i, text, conclusions in pending
+        )
 
-        if not requests:
-            self._log("No valid conclusions extracted in Phase 1", "warning")
-            return []
+        results = self._submit_batch(
+            requests, output_dir / "phase2_premises.jsonl"
+        )
+        return results, conclusion_groups
+
+    def _merge_similar_conclusions(
+        self,
+        pending: list[tuple[int, str, list[str]]],
+        threshold: float,
+    ) -> tuple[list[tuple[int, str, list[str]]], dict[int, list[int]]]:
+        """
+        Keep one conclusion per group of paraphrases in each article.
 
-        batch_file = output_dir / "phase2_premises.jsonl"
-        status = self.client.send_batch(requests, batch_file)
-        return self._wait_for_batch(status.job_id)
+        All conclusions are embedded together; grouping only happens within
+        an article, since premises are looked up in that article's text.
 
-    def _wait_for_batch(self, batch_id: str) -> list[dict[str, Any]]:
-        """Wait for batch completion and return results."""
-        self._log(f"Batch job created: {batch_id}")
+        Args:
+            pending: (article index, text, conclusions) per article.
+            threshold: Minimum cosine similarity to merge two conclusions.
 
-        status = self.client.check_batch(batch_id)
-        while not status.is_complete:
-            time.sleep(30)
-            status = self.client.check_batch(batch_id)
-            self._log(f"Status: {status.status}")
+        Returns:
+            Tuple of (pending entries with only representative conclusions,
+            conclusion groups of the articles where something merged).
 
-        return self.client.get_batch_results(batch_id)
+        """
+        vectors = np.asarray(
+            self.client.embed(
+                [c for _, _, conclusions in pending for c in conclusions],
+            ),
+        )
+
+        merged = []
+        conclusion_groups = {}
+        offset = 0
+        for i, text, conclusions in pending:
+            rows = vectors[offset : offset + len(conclusions)]
+            offset += len(conclusions)
+            leaders, groups = _group_similar(rows, threshold)
+            if len(leaders) < len(conclusions):
+                conclusion_groups[i] = groups
+            merged.append((i, text, [conclusions[j] for j in leaders]))
+
+        skipped = sum(len(c) for _, _, c in pending) - sum(
+            len(c) for _, _, c in merged
+        )
+        self._log("Merged %d near-duplicate conclusions", skipped)
+        return merged, conclusion_groups
 
-    def _build_conclusions_map(
+    def _checkpointed(
         self,
-        phase1_results: list[dict[str, Any]],
-    ) -> dict[str, list[str]]:
-        """Build mapping of custom_id to conclusions."""
-        conclusions_map = {}
-        for result in phase1_results:
-            custom_id = result.get("custom_id", "")
-            content = extract_batch_result(result)
-            if content:
-                conclusions_map[custom_id] = self._parse_list_items(content)
-        return conclusions_map
+        checkpoint: PhaseCheckpoint,
+        phase: str,
+        run: Callable[[], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Load the saved results of ``phase``, or run and save it."""
+        results = checkpoint.load(phase)
+        if results is not None:
+            self._log("Resuming %s from saved results", phase)
+            return results
+        results = run()
+        checkpoint.save(phase, results)
+        return results
+
+    def _submit_batch(
+        self,
+        requests: Iterable[dict[str, Any]],
+        batch_file: Path,
+    ) -> list[dict[str, Any]]:
+        """
+        Submit requests once per distinct prompt and wait for results.
+
+        Large phases are split into several batch jobs, which the API runs
+        in parallel; all of them are polled together.
+        """
+        aliases: dict[str, list[str]] = {}
+        unique_requests = dedupe_batch_requests(requests, aliases)
+        if self.backend == "vllm":
+            # vLLM schedules the whole list itself; no Batch API job needed
+            results = self.client.run_batch(unique_requests)
+        else:
+            statuses = self.client.send_batch_shards(
+                unique_requests,
+                batch_file,
+            )
+            for status in statuses:
+                self._batch_poller.submit(status.job_id)
+            results = [
+                result
+                for status in statuses
+                for result in self._wait_for_batch(status.job_id)
+            ]
+        if aliases:
+            self._log(
+                "Reused results for %d duplicate requests",
+                sum(map(len, aliases.values())),
+            )
+        return fan_out_batch_results(results, aliases)
+
+    def _wait_for_batch(self, batch_id: str) -> list[dict[str, Any]]:
+        """
+        Wait for batch completion and return results.
+
+        Raising here also keeps ``_checkpointed`` from saving the phase, so
+        a resumed run resubmits it instead of reusing empty results.
+
+        Raises:
+            RuntimeError: If the job failed, expired or was cancelled.
+
+        """
+        self._log("Batch job created: %s", batch_id)
+        status = self._batch_poller.wait(batch_id)
+        if status.status != "completed":
+            msg = f"Batch {batch_id} ended with status {status.status}"
+            raise RuntimeError(msg)
+        return self.client.get_batch_results(batch_id)
 
     def _combine_results(
         self,
         config: _BatchConfig,
     ) -> list[DirectExtractionResult]:
         """Combine all phase results into DirectExtractionResult objects."""
-        conclusions_map = self._build_conclusions_map(
+        conclusions_map = build_conclusions_map(
             config.phase_results["phase1"],
         )
+        groups = config.conclusion_groups
         premises_map = self._build_premises_map(
             config.phase_results["phase2"],
+            {
+                i: max(groups[i]) + 1 if i in groups else len(conclusions)
+                for i, conclusions in conclusions_map.items()
+            },
         )
-
-        results = []
-        for i, article in enumerate(config.articles):
-            article_id = (
-                article.get(config.id_column) if config.id_column else None
-            )
-            text = article.get(config.text_column, "")
-
-            result = DirectExtractionResult(text=text, article_id=article_id)
-            conclusions = conclusions_map.get(f"c_{i}", [])
-            result.conclusions = conclusions
-
-            arguments_list = []
-            for j, conclusion in enumerate(conclusions):
-                premise_id = f"p_{i}_{j}"
-                premises = premises_map.get(premise_id, [])
-
-                arguments_list.append(
-                    {
-                        "conclusion": conclusion,
-                        "premises": premises,
-                    },
+        # Give every merged conclusion its representative's premises
+        for i, group in groups.items():
+            if i in premises_map:
+                premises_map[i] = [premises_map[i][g] for g in group]
+
+        # Each result is constructed once, with all of its fields
+        results: list[DirectExtractionResult | None] = [None] * len(
+            config.articles,
+        )
+        for i, conclusions in conclusions_map.items():
+            if conclusions and i < len(results):
+                results[i] = config.make_result(
+                    i,
+                    conclusions,
+                    pair_arguments(conclusions, premises_map.get(i, [])),
                 )
 
-            result.arguments = arguments_list
-            result.success = len(arguments_list) > 0
+        # Articles without conclusions
+        return [
+            result if result is not None else config.make_result(i, [], [])
+            for i, result in enumerate(results)
+        ]
 
-            if not result.success:
-                result.error_message = "No arguments extracted"
+    def _combine_fused_results(
+        self,
+        config: _BatchConfig,
+    ) -> list[DirectExtractionResult]:
+        """
+        Build results from the single-phase batch output.
+
+        Articles whose response is missing or not valid JSON are retried
+        one at a time through ``process_single``.
+        """
+        responses = index_batch_results(config.phase_results["combined"])
 
-            results.append(result)
+        results = []
+        for i, article in enumerate(config.articles):
+            try:
+                arguments_list = parse_arguments_json(
+                    responses.get(i, ""),
+                )
+            except ValueError as e:
+                if config.text_column in article:
+                    self._log(
+                        "Retrying article %d alone: %s", i, e, level="warning"
+                    )
+                    article_id = (
+                        article.get(config.id_column)
+                        if config.id_column
+                        else None
+                    )
+                    results.append(
+                        self.process_single(
+                            article[config.text_column],
+                            article_id,
+                        ),
+                    )
+                    continue
+                arguments_list = []
+
+            results.append(
+                config.make_result(
+                    i,
+                    [arg.conclusion for arg in arguments_list],
+                    arguments_list,
+                ),
+            )
 
         return results
 
     def _build_premises_map(
         self,
         phase2_results: list[dict[str, Any]],
-    ) -> dict[str, list[str]]:
-        """Build mapping of custom_id to premises."""
+        n_requested: dict[int, int],
+    ) -> dict[int, list[list[str]]]:
+        """
+        Build mapping of article index to per-conclusion premise lists.
+
+        ``n_requested`` gives, per article, how many conclusions its Phase 2
+        request listed.
+        """
         premises_map = {}
-        for result in phase2_results:
-            custom_id = result.get("custom_id", "")
-            content = extract_batch_result(result)
-            if content:
-                premises_map[custom_id] = self._parse_list_items(content)
+        for i, content in index_batch_results(phase2_results).items():
+            n_conclusions = n_requested.get(i, 0)
+            try:
+                premises_map[i] = parse_premises_json(
+                    content,
+                    n_conclusions,
+                )
+            except ValueError as e:
+                self._log("Skipping p_%d: %s", i, e, level="warning")
         return premises_map
 
     # ---------------------------- Helper Methods ----------------------------
 
-    def _parse_list_items(self, text: str) -> list[str]:
-        """Parse items from numbered or bulleted list."""
-        items = []
-        for raw_line in text.split("\n"):
-            cleaned_line = raw_line.strip()
-            if not cleaned_line:
-                continue
-
-            is_numbered = cleaned_line[0].isdigit() if cleaned_line else False
-            is_bulleted = cleaned_line.startswith("-")
-
-            if is_numbered or is_bulleted:
-                if "." in cleaned_line:
-                    item = cleaned_line.split(".", 1)[-1].strip()
-                else:
-                    item = cleaned_line
-
-                item = item.lstrip("- ").strip()
-                if item:
-                    items.append(item)
+    def _multi_premise_prompt(self, text: str, conclusions: list[str]) -> str:
+        """Format the all-conclusions premise prompt for one article."""
+        numbered = "\n".join(
+            f"{j}. {conclusion}" for j, conclusion in enumerate(conclusions, 1)
+        )
+        return self.premise_extraction_multi_prompt.format(
+            text=text,
+            conclusions=numbered,
+        )
 
-        return items
+    def _log(
+        self,
+        message: str,
+        *args: object,
+        level: str = "info",
+    ) -> None:
+        """
+        Log message if logger is available.
 
-    def _log(self, message: str, level: str = "info") -> None:
-        """Log message if logger is available."""
+        ``message`` is %-formatted with ``args`` only if the record is
+        emitted, so calls in polling loops cost nothing when filtered out.
+        """
         if self.logger:
-            if level == "warning":
-                self.logger.warning(message)
-            else:
-                self.logger.info(message)
+            self.logger.log(
+                logging.WARNING if level == "warning" else logging.INFO,
+                message,
+                *args,
+            )
@@ -1,8 +1,9 @@
 """Socratic question-answer argumentation mining pipeline."""
 
-from .socratic_extraction import QAArgumentExtractor, QAResult
+from .socratic_extraction import QAArgument, QAArgumentExtractor, QAResult
 
 __all__ = [
+    "QAArgument",
     "QAArgumentExtractor",
     "QAResult",
 ]
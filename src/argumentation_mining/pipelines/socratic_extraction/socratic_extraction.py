@@ -9,46 +9,160 @@ Implements a three-phase pipeline:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import itertools
+import json
+import logging
 from pathlib import Path
-import time
-from typing import TYPE_CHECKING, Any
-
-import yaml
+import re
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from argumentation_mining.pipelines.direct_extraction._parsing import (
+    LIST_ITEM_RE,
+    clean_items,
+)
+from argumentation_mining.utils.batch_poller import BatchPoller
+from argumentation_mining.utils.checkpoint import PhaseCheckpoint, corpus_digest
 from argumentation_mining.utils.openai_calls import (
     OpenAIClient,
     build_batch_request,
+    dedupe_batch_requests,
     extract_batch_result,
+    fan_out_batch_results,
 )
+from argumentation_mining.utils.prompts import load_prompts, partial_format
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from logging import Logger
 
+    from argumentation_mining.utils.llm_cache import LLMCache
+    from argumentation_mining.utils.rate_limit import TokenBucket
+    from argumentation_mining.utils.semantic_cache import SemanticCache
+
+
+def _object_schema(properties: dict[str, Any]) -> dict[str, Any]:
+    """Build a strict-mode object schema requiring every property."""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _structured_format(name: str, properties: dict[str, Any]) -> dict[str, Any]:
+    """Build a strict structured-output ``response_format``."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": _object_schema(properties),
+        },
+    }
+
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Structured outputs guarantee these shapes on the OpenAI backend; the local
+# backend ignores them, so the parsers still accept the plain-text formats
+_QUESTIONS_FORMAT = _structured_format("questions", {"questions": _STRING_LIST})
+_ARGUMENT_FORMAT = _structured_format(
+    "argument",
+    {"claim": {"type": "string"}, "premises": _STRING_LIST},
+)
+_ANSWERS_FORMAT = _structured_format(
+    "answers",
+    {
+        "answers": {
+            "type": "array",
+            "items": _object_schema(
+                {"question": {"type": "integer"}, "answer": {"type": "string"}},
+            ),
+        },
+    },
+)
+_ARGUMENTS_FORMAT = _structured_format(
+    "arguments",
+    {
+        "arguments": {
+            "type": "array",
+            "items": _object_schema(
+                {
+                    "question": {"type": "integer"},
+                    "claim": {"type": "string"},
+                    "premises": _STRING_LIST,
+                },
+            ),
+        },
+    },
+)
+
+_CLAIM_RE = re.compile(r"^[ \t]*Claim:[ \t]*(.*?)\s*$", re.MULTILINE)
+_PREMISES_RE = re.compile(r"^[ \t]*Premises:", re.MULTILINE)
+
+# Questions kept per article
+_MAX_QUESTIONS = 10
+
+# Questions of one article processed at once in the per-question sync path
+_MAX_QUESTION_WORKERS = 10
+
 
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+class QAArgument(NamedTuple):
+    """An argument built from one question and its answer."""
+
+    question: str
+    answer: str
+    claim: str
+    premises: tuple[str, ...]
+
+
+def _make_argument(
+    question: str,
+    answer: str,
+    arg: dict[str, Any],
+) -> QAArgument:
+    """Build a ``QAArgument`` from a parsed claim-and-premises dict."""
+    return QAArgument(
+        question, answer, arg["claim"], tuple(clean_items(arg["premises"]))
+    )
+
+
+@dataclass(slots=True)
 class QAResult:
     """Results from question-answer argumentation extraction."""
 
     text: str
     article_id: str | None = None
     questions: list[str] | None = None
-    arguments: list[dict[str, Any]] | None = None
+    arguments: list[QAArgument] | None = None
     success: bool = False
     error_message: str | None = None
 
 
+@dataclass(slots=True)
+class _ArticleBundle:
+    """Parsed batch results of one article, keyed by question index."""
+
+    questions: list[str] = field(default_factory=list)
+    answers: dict[int, str] = field(default_factory=dict)
+    arguments: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+
 @dataclass
 class _BatchConfig:
     """Internal configuration for batch result combination."""
 
     articles: list[dict[str, Any]]
-    phase_results: dict[str, list[dict[str, Any]]]
+    bundles: dict[int, _ArticleBundle]
     text_column: str
     id_column: str | None
 
@@ -66,14 +180,27 @@ class QAArgumentExtractor:
     1. Extract questions from text
     2. Answer questions using full article
     3. Convert Q&A pairs to argument structure
+
+    By default phases 2 and 3 send one request per article covering all of its
+    questions, so the article is sent once rather than once per question.
     """
 
-    def __init__(
+    # Result type produced by this extractor
+    result_class = QAResult
+
+    def __init__(  # noqa: PLR0913
         self,
         api_key: str | None = None,
         model: str = "gpt-4o-mini",
         prompts_path: str | Path | None = None,
         logger: Logger | None = None,
+        *,
+        cache: LLMCache | None = None,
+        token_bucket: TokenBucket | None = None,
+        temperature: float = 0.0,
+        seed: int | None = 0,
+        semantic_cache: SemanticCache | None = None,
+        multi_question: bool = True,
     ) -> None:
         """
         Initialize the extractor.
@@ -83,10 +210,44 @@ class QAArgumentExtractor:
             model: OpenAI model to use.
             prompts_path: Path to prompts YAML file.
             logger: Logger instance for logging.
+            cache: Optional completion cache for single (non-batch) calls.
+            token_bucket: Optional tokens-per-minute limiter for async calls.
+            temperature: Sampling temperature for every request. The default
+                         of 0 keeps outputs reproducible, so cached and
+                         repeated requests return the same result.
+            seed: Sampling seed sent with every request, or None to omit it.
+            semantic_cache: Optional near-duplicate cache for answering and
+                            argument construction, so a question similar
+                            to one already asked about the same article is
+                            not sent again. Only consulted per question,
+                            i.e. with ``multi_question=False``.
+            multi_question: Answer all of an article's questions, and build
+                            all of its arguments, in one request each. If
+                            False, every question gets its own requests.
 
         """
-        self.client = OpenAIClient(api_key=api_key, model=model)
+        self.client = OpenAIClient(
+            api_key=api_key,
+            model=model,
+            cache=cache,
+            token_bucket=token_bucket,
+        )
+        # Jittered exponential backoff, doubling from 2s up to 5 minutes
+        self._batch_poller = BatchPoller(
+            self.client,
+            initial_delay=2.0,
+            max_delay=300.0,
+            backoff=2.0,
+            jitter=0.2,
+            on_poll=lambda status: self._log(
+                "Batch %s status: %s", status.job_id, status.status
+            ),
+        )
         self.model = model
+        self.temperature = temperature
+        self.seed = seed
+        self.semantic_cache = semantic_cache
+        self.multi_question = multi_question
         self.logger = logger
 
         # Load prompts
@@ -95,30 +256,55 @@ class QAArgumentExtractor:
         else:
             prompts_path = Path(prompts_path)
 
-        with prompts_path.open("r", encoding="utf-8") as f:
-            prompts_data = yaml.safe_load(f)
+        prompts_data = load_prompts(
+            prompts_path,
+            required=(
+                "question_extraction",
+                "question_answering",
+                "question_answering_multi",
+                "argument_construction",
+                "argument_construction_multi",
+            ),
+        )
 
         self.question_extraction_prompt = prompts_data["question_extraction"]
         self.question_answering_prompt = prompts_data["question_answering"]
+        self.question_answering_multi_prompt = prompts_data[
+            "question_answering_multi"
+        ]
         self.argument_construction_prompt = prompts_data[
             "argument_construction"
         ]
+        self.argument_construction_multi_prompt = prompts_data[
+            "argument_construction_multi"
+        ]
 
     # --------------------------- Single Processing --------------------------
 
     def extract_questions(self, text: str) -> list[str]:
         """Extract questions from text."""
         prompt = self.question_extraction_prompt.format(text=text)
-        response = self.client.call(prompt, temperature=0.1)
+        response = self.client.call(
+            prompt,
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_QUESTIONS_FORMAT,
+        )
         return self._parse_questions(response)
 
     def answer_question(self, question: str, article: str) -> str:
         """Answer a question using full article."""
+        if (cached := self._semantic_get(question, article)) is not None:
+            return cached
         prompt = self.question_answering_prompt.format(
             question=question,
             article=article,
         )
-        return self.client.call(prompt, temperature=0.1)
+        response = self.client.call(
+            prompt, temperature=self.temperature, seed=self.seed
+        )
+        self._semantic_set(question, article, response)
+        return response
 
     def construct_argument(
         self,
@@ -126,13 +312,58 @@ class QAArgumentExtractor:
         answer: str,
     ) -> dict[str, Any]:
         """Construct argument from Q&A pair."""
-        prompt = self.argument_construction_prompt.format(
-            question=question,
-            answer=answer,
-        )
-        response = self.client.call(prompt, temperature=0.1)
+        response = self._semantic_get(question, answer)
+        if response is None:
+            prompt = self.argument_construction_prompt.format(
+                question=question,
+                answer=answer,
+            )
+            response = self.client.call(
+                prompt,
+                temperature=self.temperature,
+                seed=self.seed,
+                response_format=_ARGUMENT_FORMAT,
+            )
+            self._semantic_set(question, answer, response)
         return self._parse_argument(response)
 
+    def answer_questions(self, questions: list[str], article: str) -> list[str]:
+        """
+        Answer all questions about an article in one call.
+
+        Returns one answer per question, empty where the response has none.
+        """
+        if not questions:
+            return []
+        response = self.client.call(
+            self._multi_answer_prompt(questions, article),
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_ANSWERS_FORMAT,
+        )
+        return self._parse_answers(response, len(questions))
+
+    def construct_arguments(
+        self,
+        questions: list[str],
+        answers: list[str],
+    ) -> list[dict[str, Any] | None]:
+        """
+        Construct the arguments of all answered questions in one call.
+
+        Returns one argument per question, None where it has no answer or
+        the response has no entry for it.
+        """
+        if not any(answers):
+            return [None] * len(questions)
+        response = self.client.call(
+            self._multi_argument_prompt(questions, answers),
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_ARGUMENTS_FORMAT,
+        )
+        return self._parse_arguments(response, len(questions))
+
     def process_single(
         self,
         text: str,
@@ -168,23 +399,174 @@ class QAArgumentExtractor:
         self,
         questions: list[str],
         text: str,
-    ) -> list[dict[str, Any]]:
+    ) -> list[QAArgument]:
         """Process questions to generate arguments."""
-        arguments_list = []
+        if self.multi_question:
+            answers = self.answer_questions(questions, text)
+            arguments = self.construct_arguments(questions, answers)
+            return self._pair_arguments(questions, answers, arguments)
 
-        for question in questions:
-            answer = self.answer_question(question, text)
-            arg = self.construct_argument(question, answer)
-            arguments_list.append(
-                {
-                    "question": question,
-                    "answer": answer,
-                    "claim": arg["claim"],
-                    "premises": arg["premises"],
-                },
+        if not questions:
+            return []
+
+        # The calls are network-bound, so questions are run in threads
+        workers = min(_MAX_QUESTION_WORKERS, len(questions))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    self._process_question,
+                    questions,
+                    itertools.repeat(text),
+                ),
+            )
+
+    def _process_question(self, question: str, text: str) -> QAArgument:
+        """Answer one question and build its argument."""
+        answer = self.answer_question(question, text)
+        arg = self.construct_argument(question, answer)
+        return _make_argument(question, answer, arg)
+
+    # --------------------------- Async Processing ---------------------------
+
+    async def aextract_questions(self, text: str) -> list[str]:
+        """Extract questions from text without blocking."""
+        prompt = self.question_extraction_prompt.format(text=text)
+        response = await self.client.acall(
+            prompt,
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_QUESTIONS_FORMAT,
+        )
+        return self._parse_questions(response)
+
+    async def aanswer_question(self, question: str, article: str) -> str:
+        """Answer a question using full article without blocking."""
+        if (cached := await self._asemantic_get(question, article)) is not None:
+            return cached
+        prompt = self.question_answering_prompt.format(
+            question=question,
+            article=article,
+        )
+        response = await self.client.acall(
+            prompt, temperature=self.temperature, seed=self.seed
+        )
+        await self._asemantic_set(question, article, response)
+        return response
+
+    async def aconstruct_argument(
+        self,
+        question: str,
+        answer: str,
+    ) -> dict[str, Any]:
+        """Construct argument from Q&A pair without blocking."""
+        response = await self._asemantic_get(question, answer)
+        if response is None:
+            prompt = self.argument_construction_prompt.format(
+                question=question,
+                answer=answer,
+            )
+            response = await self.client.acall(
+                prompt,
+                temperature=self.temperature,
+                seed=self.seed,
+                response_format=_ARGUMENT_FORMAT,
             )
+            await self._asemantic_set(question, answer, response)
+        return self._parse_argument(response)
+
+    async def aanswer_questions(
+        self,
+        questions: list[str],
+        article: str,
+    ) -> list[str]:
+        """Answer all questions about an article in one awaited call."""
+        if not questions:
+            return []
+        response = await self.client.acall(
+            self._multi_answer_prompt(questions, article),
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_ANSWERS_FORMAT,
+        )
+        return self._parse_answers(response, len(questions))
+
+    async def aconstruct_arguments(
+        self,
+        questions: list[str],
+        answers: list[str],
+    ) -> list[dict[str, Any] | None]:
+        """Construct all answered questions' arguments in one awaited call."""
+        if not any(answers):
+            return [None] * len(questions)
+        response = await self.client.acall(
+            self._multi_argument_prompt(questions, answers),
+            temperature=self.temperature,
+            seed=self.seed,
+            response_format=_ARGUMENTS_FORMAT,
+        )
+        return self._parse_arguments(response, len(questions))
 
-        return arguments_list
+    async def aprocess_single(
+        self,
+        text: str,
+        article_id: str | None = None,
+    ) -> QAResult:
+        """
+        Process a single article asynchronously.
+
+        Same phases as ``process_single``, but the API calls are awaited so
+        several articles can be in flight at once. With
+        ``multi_question=False``, each question is answered and turned into an
+        argument concurrently with the others.
+
+        Args:
+            text: The article text.
+            article_id: Optional article identifier.
+
+        Returns:
+            QAResult with extracted information.
+
+        """
+        result = QAResult(text=text, article_id=article_id)
+
+        try:
+            result.questions = await self.aextract_questions(text)
+            if self.multi_question:
+                answers = await self.aanswer_questions(result.questions, text)
+                arguments = await self.aconstruct_arguments(
+                    result.questions,
+                    answers,
+                )
+                result.arguments = self._pair_arguments(
+                    result.questions,
+                    answers,
+                    arguments,
+                )
+            else:
+                result.arguments = list(
+                    await asyncio.gather(
+                        *(
+                            self._aprocess_question(question, text)
+                            for question in result.questions
+                        ),
+                    ),
+                )
+            result.success = True
+
+        except (ValueError, KeyError, RuntimeError) as e:
+            result.error_message = str(e)
+
+        return result
+
+    async def _aprocess_question(
+        self,
+        question: str,
+        text: str,
+    ) -> QAArgument:
+        """Answer one question and build its argument without blocking."""
+        answer = await self.aanswer_question(question, text)
+        arg = await self.aconstruct_argument(question, answer)
+        return _make_argument(question, answer, arg)
 
     # ---------------------------- Batch Processing --------------------------
 
@@ -195,48 +577,80 @@ class QAArgumentExtractor:
         text_column: str = "text",
         id_column: str | None = None,
         output_dir: str | Path = "data/interim",
+        resume: bool = False,
     ) -> list[QAResult]:
         """
         Process multiple articles using batch API.
 
+        The results of each phase are saved under ``output_dir``. With
+        ``resume=True``, phases whose results were saved by an earlier run
+        over the same articles are loaded instead of resubmitted.
+
         Args:
             articles: List of article dicts with text content.
             text_column: Column name containing article text.
             id_column: Column name containing article IDs.
             output_dir: Directory to save batch files.
+            resume: Reuse the phase results saved in ``output_dir``.
 
         Returns:
             List of QAResult objects.
 
+        Raises:
+            ValueError: If resuming from results of different articles.
+
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-
-        self._log(f"Processing {len(articles)} articles in batch mode...")
-
-        # Three phases: questions -> answers -> arguments
-        phase1_results = self._batch_phase1(articles, text_column, output_dir)
-        phase2_results = self._batch_phase2(
-            articles,
-            phase1_results,
-            text_column,
+        checkpoint = PhaseCheckpoint(
             output_dir,
+            corpus_digest(article.get(text_column) for article in articles),
+            resume=resume,
         )
-        phase3_results = self._batch_phase3(
-            articles,
-            phase1_results,
-            phase2_results,
-            text_column,
-            output_dir,
+
+        self._log("Processing %d articles in batch mode...", len(articles))
+
+        # Three phases: questions -> answers -> arguments. Each phase's
+        # results are parsed once into the bundles the next phase reads.
+        bundles: dict[int, _ArticleBundle] = {}
+        self._ingest_results(
+            bundles,
+            self._checkpointed(
+                checkpoint,
+                "phase1",
+                lambda: self._batch_phase1(articles, text_column, output_dir),
+            ),
+        )
+        self._ingest_results(
+            bundles,
+            self._checkpointed(
+                checkpoint,
+                "phase2",
+                lambda: self._batch_phase2(
+                    articles,
+                    bundles,
+                    text_column,
+                    output_dir,
+                ),
+            ),
+        )
+        self._ingest_results(
+            bundles,
+            self._checkpointed(
+                checkpoint,
+                "phase3",
+                lambda: self._batch_phase3(
+                    articles,
+                    bundles,
+                    text_column,
+                    output_dir,
+                ),
+            ),
         )
 
         config = _BatchConfig(
             articles=articles,
-            phase_results={
-                "phase1": phase1_results,
-                "phase2": phase2_results,
-                "phase3": phase3_results,
-            },
+            bundles=bundles,
             text_column=text_column,
             id_column=id_column,
         )
@@ -258,81 +672,134 @@ class QAArgumentExtractor:
                     text=article[text_column],
                 ),
                 model=self.model,
-                temperature=0.1,
+                temperature=self.temperature,
+                seed=self.seed,
+                response_format=_QUESTIONS_FORMAT,
             )
             for i, article in enumerate(articles)
             if text_column in article
         ]
 
-        batch_file = output_dir / "phase1_questions.jsonl"
-        status = self.client.send_batch(requests, batch_file)
-        return self._wait_for_batch(status.job_id)
+        return self._submit_batch(
+            requests, output_dir / "phase1_questions.jsonl"
+        )
 
     def _batch_phase2(
         self,
         articles: list[dict[str, Any]],
-        phase1_results: list[dict[str, Any]],
+        bundles: dict[int, _ArticleBundle],
         text_column: str,
         output_dir: Path,
     ) -> list[dict[str, Any]]:
         """Phase 2: Answer questions."""
         self._log("Phase 2: Question answering...")
 
-        questions_map = self._build_questions_map(phase1_results)
-        requests = []
+        requests = self._iter_phase2_requests(articles, bundles, text_column)
+
+        # Requests are built lazily; peek so an empty phase is not submitted
+        first_request = next(requests, None)
+        if first_request is None:
+            self._log(
+                "No valid questions extracted in Phase 1", level="warning"
+            )
+            return []
+
+        return self._submit_batch(
+            itertools.chain((first_request,), requests),
+            output_dir / "phase2_answers.jsonl",
+        )
 
+    def _iter_phase2_requests(
+        self,
+        articles: list[dict[str, Any]],
+        bundles: dict[int, _ArticleBundle],
+        text_column: str,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield the Phase 2 requests one at a time.
+
+        ``send_batch`` writes each request as it is produced, so only one
+        article's prompts are held in memory rather than the whole phase.
+        """
         for i, article in enumerate(articles):
             if text_column not in article:
                 continue
 
-            text = article[text_column]
-            questions = questions_map.get(f"q_{i}", [])
-
-            for j, question in enumerate(questions):
-                requests.append(
-                    build_batch_request(
-                        custom_id=f"qa_{i}_{j}",
-                        prompt=self.question_answering_prompt.format(
-                            question=question,
-                            article=text,
-                        ),
-                        model=self.model,
-                        temperature=0.1,
+            bundle = bundles.get(i)
+            if bundle is None or not bundle.questions:
+                continue
+            questions = bundle.questions
+
+            if self.multi_question:
+                yield build_batch_request(
+                    custom_id=f"qa_{i}",
+                    prompt=self._multi_answer_prompt(
+                        questions,
+                        article[text_column],
                     ),
+                    model=self.model,
+                    temperature=self.temperature,
+                    seed=self.seed,
+                    response_format=_ANSWERS_FORMAT,
                 )
+                continue
 
-        if not requests:
-            self._log("No valid questions extracted in Phase 1", "warning")
-            return []
-
-        batch_file = output_dir / "phase2_answers.jsonl"
-        status = self.client.send_batch(requests, batch_file)
-        return self._wait_for_batch(status.job_id)
+            # Substitute the article once, then fill in each question
+            head, tail = partial_format(
+                self.question_answering_prompt,
+                "question",
+                article=article[text_column],
+            )
+            for j, question in enumerate(questions):
+                yield build_batch_request(
+                    custom_id=f"qa_{i}_{j}",
+                    prompt=f"{head}{question}{tail}",
+                    model=self.model,
+                    temperature=self.temperature,
+                    seed=self.seed,
+                )
 
     def _batch_phase3(
         self,
         articles: list[dict[str, Any]],
-        phase1_results: list[dict[str, Any]],
-        phase2_results: list[dict[str, Any]],
+        bundles: dict[int, _ArticleBundle],
         text_column: str,
         output_dir: Path,
     ) -> list[dict[str, Any]]:
         """Phase 3: Construct arguments."""
         self._log("Phase 3: Argument construction...")
 
-        questions_map = self._build_questions_map(phase1_results)
-        answers_map = self._build_answers_map(phase2_results)
         requests = []
 
         for i, article in enumerate(articles):
-            if text_column not in article:
+            bundle = bundles.get(i)
+            if text_column not in article or bundle is None:
                 continue
 
-            questions = questions_map.get(f"q_{i}", [])
+            questions = bundle.questions
+
+            if self.multi_question:
+                answers = [
+                    bundle.answers.get(j, "") for j in range(len(questions))
+                ]
+                if any(answers):
+                    requests.append(
+                        build_batch_request(
+                            custom_id=f"arg_{i}",
+                            prompt=self._multi_argument_prompt(
+                                questions,
+                                answers,
+                            ),
+                            model=self.model,
+                            temperature=self.temperature,
+                            seed=self.seed,
+                            response_format=_ARGUMENTS_FORMAT,
+                        ),
+                    )
+                continue
 
             for j, question in enumerate(questions):
-                qa_id = f"qa_{i}_{j}"
-                answer = answers_map.get(qa_id)
+                answer = bundle.answers.get(j)
 
                 if answer:
                     requests.append(
@@ -343,93 +810,181 @@ class QAArgumentExtractor:
                                 answer=answer,
                             ),
                             model=self.model,
-                            temperature=0.1,
+                            temperature=self.temperature,
+                            seed=self.seed,
+                            response_format=_ARGUMENT_FORMAT,
                         ),
                     )
 
         if not requests:
-            self._log("No valid Q&A pairs from Phase 2", "warning")
+            self._log("No valid Q&A pairs from Phase 2", level="warning")
             return []
 
-        batch_file = output_dir / "phase3_arguments.jsonl"
-        status = self.client.send_batch(requests, batch_file)
-        return self._wait_for_batch(status.job_id)
+        return self._submit_batch(
+            requests, output_dir / "phase3_arguments.jsonl"
+        )
 
-    def _wait_for_batch(self, batch_id: str) -> list[dict[str, Any]]:
-        """Wait for batch completion and return results."""
-        self._log(f"Batch job created: {batch_id}")
+    def _checkpointed(
+        self,
+        checkpoint: PhaseCheckpoint,
+        phase: str,
+        run: Callable[[], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Load the saved results of ``phase``, or run and save it."""
+        results = checkpoint.load(phase)
+        if results is not None:
+            self._log("Resuming %s from saved results", phase)
+            return results
+        results = run()
+        checkpoint.save(phase, results)
+        return results
 
-        status = self.client.check_batch(batch_id)
-        while not status.is_complete:
-            time.sleep(30)
-            status = self.client.check_batch(batch_id)
-            self._log(f"Status: {status.status}")
+    def _submit_batch(
+        self,
+        requests: Iterable[dict[str, Any]],
+        batch_file: Path,
+    ) -> list[dict[str, Any]]:
+        """
+        Submit requests once per distinct prompt and wait for results.
+
+        Large phases are split into several batch jobs, which the API runs
+        in parallel; all of them are polled together.
+        """
+        aliases: dict[str, list[str]] = {}
+        statuses = self.client.send_batch_shards(
+            dedupe_batch_requests(requests, aliases),
+            batch_file,
+        )
+        for status in statuses:
+            self._batch_poller.submit(status.job_id)
+        results = [
+            result
+            for status in statuses
+            for result in self._wait_for_batch(status.job_id)
+        ]
+        if aliases:
+            self._log(
+                "Reused results for %d duplicate requests",
+                sum(map(len, aliases.values())),
+            )
+        return fan_out_batch_results(results, aliases)
+
+    def _wait_for_batch(
+        self,
+        batch_id: str,
+        *,
+        max_wait: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Wait for batch completion and return results.
+
+        The job is polled by the extractor's shared ``BatchPoller``, so jobs
+        waited on from several threads cost one status check per tick.
+
+        Args:
+            batch_id: The batch job ID.
+            max_wait: Give up after this many seconds. If None, wait
+                      indefinitely.
+
+        Returns:
+            The batch results.
+
+        Raises:
+            RuntimeError: If the job failed, expired or was cancelled.
+            TimeoutError: If the job is still running after ``max_wait``.
+
+        """
+        self._log("Batch job created: %s", batch_id)
+
+        status = self._batch_poller.wait(batch_id, timeout=max_wait)
+        if status.status != "completed":
+            msg = f"Batch {batch_id} ended with status {status.status}"
+            raise RuntimeError(msg)
 
         return self.client.get_batch_results(batch_id)
 
-    def _build_questions_map(
+    def _ingest_results(
         self,
-        phase1_results: list[dict[str, Any]],
-    ) -> dict[str, list[str]]:
-        """Build mapping of custom_id to questions."""
-        questions_map = {}
-        for result in phase1_results:
+        bundles: dict[int, _ArticleBundle],
+        results: Iterable[dict[str, Any]],
+    ) -> None:
+        """
+        Parse one phase's batch results into per-article bundles.
+
+        Custom IDs are ``<kind>_<article>`` (questions and multi-question
+        responses) or ``<kind>_<article>_<question>``; each is split once and
+        dispatched on its kind. Multi-question responses are split into one
+        entry per question, so both modes fill the same bundle fields.
+        """
+        for result in results:
             custom_id = result.get("custom_id", "")
+            kind, _, index = custom_id.partition("_")
+            article, _, question = index.partition("_")
             content = extract_batch_result(result)
-            if content:
-                questions_map[custom_id] = self._parse_questions(content)
-        return questions_map
+            if not content or not article.isdigit():
+                continue
+
+            bundle = bundles.get(int(article))
+            if bundle is None:
+                bundle = bundles[int(article)] = _ArticleBundle()
+
+            if kind == "q":
+                bundle.questions = self._parse_questions(content)
+            elif question.isdigit():
+                if kind == "qa":
+                    bundle.answers[int(question)] = content
+                elif kind == "arg":
+                    bundle.arguments[int(question)] = self._parse_argument(
+                        content,
+                    )
+            else:
+                try:
+                    self._ingest_multi(bundle, kind, content)
+                except ValueError as e:
+                    self._log("Skipping %s: %s", custom_id, e, level="warning")
 
-    def _build_answers_map(
+    def _ingest_multi(
         self,
-        phase2_results: list[dict[str, Any]],
-    ) -> dict[str, str]:
-        """Build mapping of custom_id to answers."""
-        answers_map = {}
-        for result in phase2_results:
-            custom_id = result.get("custom_id", "")
-            content = extract_batch_result(result)
-            if content:
-                answers_map[custom_id] = content
-        return answers_map
+        bundle: _ArticleBundle,
+        kind: str,
+        content: str,
+    ) -> None:
+        """Split a multi-question response into the bundle's entries."""
+        n_questions = len(bundle.questions)
+        if kind == "qa":
+            for j, answer in enumerate(
+                self._parse_answers(content, n_questions),
+            ):
+                if answer:
+                    bundle.answers[j] = answer
+        elif kind == "arg":
+            for j, arg in enumerate(
+                self._parse_arguments(content, n_questions),
+            ):
+                if arg is not None:
+                    bundle.arguments[j] = arg
 
     def _combine_results(self, config: _BatchConfig) -> list[QAResult]:
-        """Combine all phase results into QAResult objects."""
-        questions_map = self._build_questions_map(
-            config.phase_results["phase1"],
-        )
-        answers_map = self._build_answers_map(config.phase_results["phase2"])
-        arguments_map = self._build_arguments_map(
-            config.phase_results["phase3"],
-        )
-
+        """Combine the parsed phase results into QAResult objects."""
         results = []
         for i, article in enumerate(config.articles):
             article_id = (
                 article.get(config.id_column) if config.id_column else None
             )
             text = article.get(config.text_column, "")
+            bundle = config.bundles.get(i) or _ArticleBundle()
 
             result = QAResult(text=text, article_id=article_id)
-            questions = questions_map.get(f"q_{i}", [])
-            result.questions = questions
+            result.questions = bundle.questions
 
             arguments_list = []
-            for j, question in enumerate(questions):
-                qa_id = f"qa_{i}_{j}"
-                arg_id = f"arg_{i}_{j}"
-
-                answer = answers_map.get(qa_id)
-                arg = arguments_map.get(arg_id)
+            for j, question in enumerate(bundle.questions):
+                answer = bundle.answers.get(j)
+                arg = bundle.arguments.get(j)
 
                 if answer and arg:
                     arguments_list.append(
-                        {
-                            "question": question,
-                            "answer": answer,
-                            "claim": arg["claim"],
-                            "premises": arg["premises"],
-                        },
+                        _make_argument(question, answer, arg),
                     )
 
             result.arguments = arguments_list
@@ -442,78 +997,221 @@ class QAArgumentExtractor:
 
         return results
 
-    def _build_arguments_map(
+    # ---------------------------- Helper Methods ----------------------------
+
+    def _semantic_get(self, question: str, context: str) -> str | None:
+        """Look up a near-duplicate question asked about ``context``."""
+        if self.semantic_cache is None:
+            return None
+        return self.semantic_cache.get(question, context)
+
+    def _semantic_set(self, question: str, context: str, response: str) -> None:
+        """Remember ``response`` for ``question`` within ``context``."""
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(question, context, response)
+
+    async def _asemantic_get(self, question: str, context: str) -> str | None:
+        """``_semantic_get`` with the embedding run off the event loop."""
+        if self.semantic_cache is None:
+            return None
+        return await asyncio.to_thread(
+            self.semantic_cache.get, question, context
+        )
+
+    async def _asemantic_set(
         self,
-        phase3_results: list[dict[str, Any]],
-    ) -> dict[str, dict[str, Any]]:
-        """Build mapping of custom_id to arguments."""
-        arguments_map = {}
-        for result in phase3_results:
-            custom_id = result.get("custom_id", "")
-            content = extract_batch_result(result)
-            if content:
-                arguments_map[custom_id] = self._parse_argument(content)
-        return arguments_map
+        question: str,
+        context: str,
+        response: str,
+    ) -> None:
+        """``_semantic_set`` with the embedding run off the event loop."""
+        if self.semantic_cache is not None:
+            await asyncio.to_thread(
+                self.semantic_cache.set, question, context, response
+            )
 
-    # ---------------------------- Helper Methods ----------------------------
+    def _multi_answer_prompt(self, questions: list[str], article: str) -> str:
+        """Format the all-questions answering prompt for one article."""
+        numbered = "\n".join(
+            f"{j}. {question}" for j, question in enumerate(questions, 1)
+        )
+        return self.question_answering_multi_prompt.format(
+            article=article,
+            numbered_questions=numbered,
+        )
 
-    def _parse_questions(self, text: str) -> list[str]:
-        """Parse questions from numbered list."""
-        questions = []
-        for raw_line in text.split("\n"):
-            cleaned_line = raw_line.strip()
-            if not cleaned_line:
-                continue
+    def _multi_argument_prompt(
+        self,
+        questions: list[str],
+        answers: list[str],
+    ) -> str:
+        """
+        Format the all-pairs argument prompt for one article.
 
-            is_numbered = cleaned_line[0].isdigit()
-            is_bulleted = cleaned_line.startswith("-")
+        Pairs keep their question numbers, so unanswered questions leave gaps
+        rather than shifting the numbering.
+        """
+        pairs = "\n".join(
+            f"{j}. Question: {question}\n   Answer: {answer}"
+            for j, (question, answer) in enumerate(
+                zip(questions, answers, strict=True),
+                1,
+            )
+            if answer
+        )
+        return self.argument_construction_multi_prompt.format(qa_pairs=pairs)
 
-            if is_numbered or is_bulleted:
-                if "." in cleaned_line:
-                    question = cleaned_line.split(".", 1)[-1].strip()
-                else:
-                    question = cleaned_line
+    def _pair_arguments(
+        self,
+        questions: list[str],
+        answers: list[str],
+        arguments: Sequence[dict[str, Any] | None],
+    ) -> list[QAArgument]:
+        """Combine answered questions that have an argument into results."""
+        return [
+            _make_argument(question, answer, arg)
+            for question, answer, arg in zip(
+                questions,
+                answers,
+                arguments,
+                strict=True,
+            )
+            if answer and arg is not None
+        ]
 
-                question = question.lstrip("- ").strip()
-                if question:
-                    questions.append(question)
+    def _parse_numbered_json(
+        self,
+        content: str,
+        key: str,
+        n_questions: int,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Parse a multi-question JSON response into one entry per question.
+
+        Entries are matched to questions by their ``question`` number when
+        present, otherwise by position.
+
+        Args:
+            content: JSON response text.
+            key: Key of the list holding the entries.
+            n_questions: Number of questions the prompt listed.
+
+        Returns:
+            One entry per question, None where the response has none.
+
+        Raises:
+            ValueError: If the response is not the expected JSON object.
+
+        """
+        try:
+            entries = json.loads(content)[key]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            msg = f"Invalid multi-question response: {e}"
+            raise ValueError(msg) from e
+        if not isinstance(entries, list):
+            # Callers only catch ValueError for malformed responses
+            msg = f"Invalid multi-question response: {key!r} is not a list"
+            raise ValueError(msg)  # noqa: TRY004
+
+        matched: list[dict[str, Any] | None] = [None] * n_questions
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                continue
+            number = entry.get("question")
+            index = number - 1 if isinstance(number, int) else position
+            if 0 <= index < n_questions:
+                matched[index] = entry
+        return matched
+
+    def _parse_answers(self, content: str, n_questions: int) -> list[str]:
+        """Parse a multi-question answering response."""
+        return [
+            str(entry.get("answer") or "").strip() if entry else ""
+            for entry in self._parse_numbered_json(
+                content,
+                "answers",
+                n_questions,
+            )
+        ]
+
+    def _parse_arguments(
+        self,
+        content: str,
+        n_questions: int,
+    ) -> list[dict[str, Any] | None]:
+        """Parse a multi-pair argument construction response."""
+        arguments: list[dict[str, Any] | None] = []
+        for entry in self._parse_numbered_json(
+            content,
+            "arguments",
+            n_questions,
+        ):
+            if entry is None:
+                arguments.append(None)
+                continue
+            arguments.append(
+                {
+                    "claim": str(entry.get("claim") or "").strip(),
+                    "premises": clean_items(entry.get("premises")),
+                },
+            )
+        return arguments
+
+    def _parse_json_object(self, text: str) -> dict[str, Any] | None:
+        """Decode a structured-output response, or None for plain text."""
+        if not text.lstrip().startswith("{"):
+            return None
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
 
-        return questions[:10]
+    def _parse_questions(self, text: str) -> list[str]:
+        """Parse questions from a JSON object or a numbered list."""
+        data = self._parse_json_object(text)
+        if data is not None and isinstance(data.get("questions"), list):
+            questions = clean_items(data["questions"])
+        else:
+            questions = LIST_ITEM_RE.findall(text)
+        return questions[:_MAX_QUESTIONS]
 
     def _parse_argument(self, text: str) -> dict[str, Any]:
-        """Parse argument structure from text."""
-        lines = text.split("\n")
-        claim = ""
-        premises = []
-
-        current_section = None
-        for raw_line in lines:
-            cleaned_line = raw_line.strip()
-            if cleaned_line.startswith("Claim:"):
-                claim = cleaned_line.split(":", 1)[-1].strip()
-                current_section = "claim"
-            elif cleaned_line.startswith("Premises:"):
-                current_section = "premises"
-            elif current_section == "premises" and cleaned_line:
-                is_numbered = cleaned_line[0].isdigit()
-                is_bulleted = cleaned_line.startswith("-")
-
-                if is_numbered or is_bulleted:
-                    if "." in cleaned_line:
-                        premise = cleaned_line.split(".", 1)[-1].strip()
-                    else:
-                        premise = cleaned_line
-
-                    premise = premise.lstrip("- ").strip()
-                    if premise:
-                        premises.append(premise)
-
-        return {"claim": claim, "premises": premises}
-
-    def _log(self, message: str, level: str = "info") -> None:
-        """Log message if logger is available."""
+        """Parse argument structure from a JSON object or text."""
+        data = self._parse_json_object(text)
+        if data is not None and "claim" in data:
+            return {
+                "claim": str(data["claim"] or "").strip(),
+                "premises": clean_items(data.get("premises")),
+            }
+
+        claim_match = _CLAIM_RE.search(text)
+        premises_match = _PREMISES_RE.search(text)
+        premises = (
+            LIST_ITEM_RE.findall(text, premises_match.end())
+            if premises_match
+            else []
+        )
+        return {
+            "claim": claim_match.group(1) if claim_match else "",
+            "premises": premises,
+        }
+
+    def _log(
+        self,
+        message: str,
+        *args: object,
+        level: str = "info",
+    ) -> None:
+        """
+        Log message if logger is available.
+
+        ``message`` is %-formatted with ``args`` only if the record is
+        emitted, so calls in polling loops cost nothing when filtered out.
+        """
         if self.logger:
-            if level == "warning":
-                self.logger.warning(message)
-            else:
-                self.logger.info(message)
+            self.logger.log(
+                logging.WARNING if level == "warning" else logging.INFO,
+                message,
+                *args,
+            )
@@ -1,15 +1,34 @@
 """Utility modules for argumentation mining."""
 
+from argumentation_mining.utils.batch_poller import BatchPoller
+from argumentation_mining.utils.llm_cache import LLMCache
+from argumentation_mining.utils.local_llm import LocalLLMClient
 from argumentation_mining.utils.openai_calls import (
     BatchJobStatus,
     OpenAIClient,
     build_batch_request,
+    build_batch_requests,
+    dedupe_batch_requests,
     extract_batch_result,
+    fan_out_batch_results,
 )
+from argumentation_mining.utils.prompts import load_prompts, partial_format
+from argumentation_mining.utils.rate_limit import TokenBucket
+from argumentation_mining.utils.semantic_cache import SemanticCache
 
 __all__ = [
     "BatchJobStatus",
+    "BatchPoller",
+    "LLMCache",
+    "LocalLLMClient",
     "OpenAIClient",
+    "SemanticCache",
+    "TokenBucket",
     "build_batch_request",
+    "build_batch_requests",
+    "dedupe_batch_requests",
     "extract_batch_result",
+    "fan_out_batch_results",
+    "load_prompts",
+    "partial_format",
 ]
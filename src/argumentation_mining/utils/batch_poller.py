@@ -0,0 +1,212 @@
+"""
+Shared status poller for concurrent batch jobs.
+
+When several batch jobs are in flight at once (e.g. one per length bucket),
+polling each with its own ``wait_for_batch`` loop costs one status request
+per job per tick. A ``BatchPoller`` instead fetches the newest jobs with a
+single ``batches.list`` call per tick and resolves the waiter of every job
+that has finished.
+"""
+
+from __future__ import annotations
+
+from concurrent import futures
+import threading
+from typing import TYPE_CHECKING
+
+from argumentation_mining.utils.openai_calls import (
+    _RETRYABLE_ERRORS,
+    _jittered,
+    _next_poll_delay,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from argumentation_mining.utils.openai_calls import (
+        BatchJobStatus,
+        OpenAIClient,
+    )
+
+# Jobs per ``batches.list`` page; older jobs are looked up one by one
+_LIST_PAGE_SIZE = 100
+
+# Consecutive transient API errors tolerated before waiters are failed
+_MAX_POLL_FAILURES = 3
+
+
+class BatchPoller:
+    """
+    Background poller resolving one future per submitted batch job.
+
+    The polling thread starts with the first submitted job and exits once no
+    job is pending. It follows the same backoff schedule as
+    ``OpenAIClient.wait_for_batch``, restarting from ``initial_delay``
+    whenever a new job is submitted.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        client: OpenAIClient,
+        *,
+        initial_delay: float = 5.0,
+        max_delay: float = 300.0,
+        backoff: float = 1.5,
+        jitter: float = 0.0,
+        on_poll: Callable[[BatchJobStatus], None] | None = None,
+    ) -> None:
+        """
+        Create an idle poller.
+
+        Args:
+            client: Client used to fetch batch statuses.
+            initial_delay: Seconds between submission and the first check.
+            max_delay: Upper bound on the delay between checks.
+            backoff: Factor applied to the delay after each pending check.
+            jitter: Randomize each sleep by up to this fraction.
+            on_poll: Optional callback invoked with every fetched status of
+                     a submitted job.
+
+        """
+        self.client = client
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.jitter = jitter
+        self.on_poll = on_poll
+
+        self._pending: dict[str, futures.Future[BatchJobStatus]] = {}
+        self._lock = threading.Lock()
+        self._submitted = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, job_id: str) -> futures.Future[BatchJobStatus]:
+        """Track ``job_id``; the future resolves to its final status."""
+        with self._lock:
+            future = self._pending.get(job_id)
+            if future is None:
+                future = futures.Future()
+                self._pending[job_id] = future
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="batch-poller",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._submitted.set()
+        return future
+
+    def wait(
+        self,
+        job_id: str,
+        timeout: float | None = None,
+    ) -> BatchJobStatus:
+        """
+        Block until ``job_id`` reaches a terminal state.
+
+        Args:
+            job_id: The batch job ID.
+            timeout: Give up after this many seconds. If None, wait
+                     indefinitely.
+
+        Returns:
+            Final BatchJobStatus.
+
+        Raises:
+            TimeoutError: If the job is still running after ``timeout``.
+
+        """
+        future = self.submit(job_id)
+        try:
+            return future.result(timeout)
+        except futures.TimeoutError as e:
+            with self._lock:
+                if self._pending.get(job_id) is future:
+                    del self._pending[job_id]
+            msg = f"Batch {job_id} not complete after {timeout}s"
+            raise TimeoutError(msg) from e
+
+    def _run(self) -> None:
+        """Poll until no submitted job is pending."""
+        delay = self.initial_delay
+        failures = 0
+        while True:
+            if self._submitted.wait(_jittered(delay, self.jitter)):
+                # A job was added: give it the short initial delay as well
+                self._submitted.clear()
+                delay = self.initial_delay
+                continue
+
+            with self._lock:
+                job_ids = list(self._pending)
+                if not job_ids:
+                    self._thread = None
+                    return
+
+            try:
+                statuses = self._fetch(job_ids)
+            except _RETRYABLE_ERRORS as e:
+                failures += 1
+                if failures < _MAX_POLL_FAILURES:
+                    delay = min(delay * self.backoff, self.max_delay)
+                    continue
+                self._fail_all(e)
+                return
+            except Exception as e:  # noqa: BLE001
+                # Hand the error to every waiter instead of leaving them hung
+                self._fail_all(e)
+                return
+
+            failures = 0
+            delay = self._resolve(statuses, delay)
+
+    def _fetch(self, job_ids: list[str]) -> list[BatchJobStatus]:
+        """Fetch the statuses of ``job_ids``, listing recent jobs first."""
+        wanted = set(job_ids)
+        statuses = [
+            status
+            for status in self.client.list_batches(limit=_LIST_PAGE_SIZE)
+            if status.job_id in wanted
+        ]
+        found = {status.job_id for status in statuses}
+        statuses.extend(
+            self.client.check_batch(job_id)
+            for job_id in job_ids
+            if job_id not in found
+        )
+        return statuses
+
+    def _resolve(self, statuses: list[BatchJobStatus], delay: float) -> float:
+        """Complete the futures of finished jobs and return the next delay."""
+        next_delay = None
+        for status in statuses:
+            if self.on_poll:
+                self.on_poll(status)
+            if status.is_complete:
+                with self._lock:
+                    future = self._pending.pop(status.job_id, None)
+                if future is not None:
+                    future.set_result(status)
+                continue
+            # The job closest to completion sets the pace
+            job_delay = _next_poll_delay(
+                delay,
+                status,
+                initial_delay=self.initial_delay,
+                max_delay=self.max_delay,
+                backoff=self.backoff,
+            )
+            next_delay = (
+                job_delay if next_delay is None else min(next_delay, job_delay)
+            )
+        return self.initial_delay if next_delay is None else next_delay
+
+    def _fail_all(self, error: Exception) -> None:
+        """Fail every pending future with ``error`` and stop polling."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._thread = None
+        for future in pending:
+            future.set_exception(error)
@@ -0,0 +1,126 @@
+"""
+On-disk checkpoints of batch phase results.
+
+A batch run spends most of its wall-clock time waiting on the Batch API, so
+a crash after a phase has finished should not cost that phase again. A
+``PhaseCheckpoint`` stores each phase's downloaded results as gzipped JSONL
+next to the batch files, and a resumed run loads them instead of
+resubmitting the phase.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from argumentation_mining.utils.openai_calls import (
+    _jsonl_line,
+    _parse_jsonl_line,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+MANIFEST_NAME = "manifest.json"
+
+
+def corpus_digest(texts: Iterable[str | None]) -> str:
+    """
+    Return a digest identifying an ordered list of article texts.
+
+    Unlike ``hashing.fingerprint``, the digest does not depend on which
+    optional packages are installed, so it stays valid across environments.
+
+    Args:
+        texts: Article texts in submission order; None marks an article
+               without text.
+
+    Returns:
+        Hex digest of the texts.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        # Length prefixes keep ["ab", "c"] and ["a", "bc"] apart
+        data = b"" if text is None else text.encode("utf-8")
+        digest.update(b"-" if text is None else str(len(data)).encode())
+        digest.update(b":")
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class PhaseCheckpoint:
+    """
+    Phase results of one batch run, persisted under its output directory.
+
+    A ``manifest.json`` records the digest of the run's articles. Resuming
+    against a directory whose manifest names other articles raises instead
+    of silently reusing their results. Result files are written under a
+    temporary name and renamed when complete, so an existing file is always
+    a full phase.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        digest: str,
+        *,
+        resume: bool = False,
+    ) -> None:
+        """
+        Open the checkpoint of a run.
+
+        Args:
+            directory: Output directory of the run.
+            digest: ``corpus_digest`` of the run's articles.
+            resume: Load saved phase results. If False, results left by an
+                    earlier run are discarded.
+
+        Raises:
+            ValueError: If resuming and the directory holds results for
+                        different articles.
+
+        """
+        self.directory = Path(directory)
+        self.resume = resume
+
+        manifest_path = self.directory / MANIFEST_NAME
+        if resume and manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("articles") != digest:
+                msg = (
+                    f"{self.directory} holds results for different articles; "
+                    "use another output directory or disable resume"
+                )
+                raise ValueError(msg)
+            return
+
+        for path in self.directory.glob("*_results.jsonl.gz"):
+            path.unlink()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(
+            json.dumps({"articles": digest}),
+            encoding="utf-8",
+        )
+
+    def _path(self, phase: str) -> Path:
+        return self.directory / f"{phase}_results.jsonl.gz"
+
+    def load(self, phase: str) -> list[dict[str, Any]] | None:
+        """Return the saved results of ``phase``, or None to run it."""
+        path = self._path(phase)
+        if not self.resume or not path.exists():
+            return None
+        with gzip.open(path, "rb") as f:
+            return [_parse_jsonl_line(line) for line in f]
+
+    def save(self, phase: str, results: list[dict[str, Any]]) -> None:
+        """Persist the results of a finished ``phase``."""
+        path = self._path(phase)
+        partial = path.with_name(f"{path.name}.partial")
+        with gzip.open(partial, "wb") as f:
+            f.writelines(_jsonl_line(result) for result in results)
+        partial.replace(path)
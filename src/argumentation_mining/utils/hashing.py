@@ -0,0 +1,38 @@
+"""
+Fast fingerprints for prompts and texts.
+
+Used wherever content is hashed only to detect repeats (completion cache
+keys, duplicate batch requests, duplicate articles), so a non-cryptographic
+hash is enough.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+try:
+    import xxhash
+except ImportError:
+    # Fall back to hashlib when xxhash is not installed
+    xxhash = None
+
+
+def fingerprint(data: str | bytes) -> bytes:
+    """
+    Return a 128-bit digest of ``data``.
+
+    Uses xxh3_128 when xxhash is installed and BLAKE2b otherwise, so digests
+    are only comparable within one environment.
+
+    Args:
+        data: Content to hash; strings are encoded as UTF-8.
+
+    Returns:
+        The 16-byte digest.
+
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
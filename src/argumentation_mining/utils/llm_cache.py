@@ -0,0 +1,154 @@
+"""
+Two-level cache for LLM completions.
+
+An in-memory LRU serves repeats within a run; an optional disk tier lets
+reruns over overlapping data reuse earlier responses instead of paying for
+the same prompt twice.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from argumentation_mining.utils.hashing import fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class LLMCache:
+    """
+    Completion cache keyed by model, sampling settings and prompt.
+
+    Prompts are whitespace-normalized before hashing, so formatting-only
+    differences still hit the same entry. Lookups check the in-memory LRU
+    first and fall back to the disk store. The cache can be shared between
+    threads. Entries optionally expire after
+    ``ttl`` seconds, and requests sampled above ``max_temperature`` bypass the
+    cache since their outputs are not meant to repeat.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = "./data/interim/llm_cache",
+        memory_size: int = 1024,
+        *,
+        ttl: float | None = None,
+        max_temperature: float | None = None,
+    ) -> None:
+        """
+        Open (or create) the cache.
+
+        Args:
+            directory: Directory where cache entries are persisted. If None,
+                       only the in-memory tier is used.
+            memory_size: Maximum number of entries kept in memory.
+            ttl: Seconds after which an entry expires. If None, entries
+                 never expire.
+            max_temperature: Highest sampling temperature whose requests
+                             are cached. If None, every request is cached.
+
+        """
+        self._store = None
+        if directory is not None:
+            try:
+                from diskcache import Cache  # noqa: PLC0415
+            except ImportError as e:
+                msg = "Install diskcache package: uv add diskcache"
+                raise ImportError(msg) from e
+            self._store = Cache(str(directory))
+
+        # key -> (completion, expiry time on the monotonic clock or None)
+        self._memory: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._memory_size = memory_size
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.hits = 0
+        self.misses = 0
+        # Guards the memory tier and counters; diskcache is thread-safe
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: float,
+        prompt: str,
+        response_format: dict | None = None,
+        seed: int | None = None,
+    ) -> str:
+        """
+        Build the cache key for a single completion request.
+
+        The response format and seed are part of the key, so a JSON reply is
+        never served for a plain-text request and differently seeded samples
+        stay apart.
+        """
+        normalized_prompt = " ".join(prompt.split())
+        fmt = json.dumps(response_format, sort_keys=True)
+        raw = f"{model}|{temperature}|{fmt}|{seed}|{normalized_prompt}"
+        return fingerprint(raw).hex()
+
+    def accepts(self, temperature: float) -> bool:
+        """Whether requests at ``temperature`` are served from the cache."""
+        return self.max_temperature is None or (
+            temperature <= self.max_temperature
+        )
+
+    def get(self, key: str) -> str | None:
+        """Return the cached completion for ``key``, or None on a miss."""
+        with self._lock:
+            value = self._recall(key)
+        if value is None and self._store is not None:
+            # diskcache drops expired entries itself
+            value = self._store.get(key)
+            if value is not None:
+                self._remember(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a completion under ``key``."""
+        self._remember(key, value)
+        if self._store is not None:
+            self._store.set(key, value, expire=self.ttl)
+
+    def _recall(self, key: str) -> str | None:
+        """Look ``key`` up in the memory tier, dropping it if expired."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _remember(self, key: str, value: str) -> None:
+        """Insert into the memory tier, evicting the oldest entry if full."""
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._memory[key] = (value, expires)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self) -> None:
+        """Close the underlying cache files."""
+        if self._store is not None:
+            self._store.close()
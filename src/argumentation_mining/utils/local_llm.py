@@ -0,0 +1,200 @@
+"""
+Local vLLM backend with the same call interface as ``OpenAIClient``.
+
+Meant for short articles, where the API round trip costs more than the
+generation itself. Batch requests are handed to vLLM in a single call so its
+continuous batching schedules them, instead of going through the Batch API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from argumentation_mining.utils.llm_cache import LLMCache
+
+# 4-bit AWQ build of Llama 3 8B Instruct; fits on a single 16GB GPU
+DEFAULT_LOCAL_MODEL = "casperhansen/llama-3-8b-instruct-awq"
+
+
+class LocalLLMClient:
+    """
+    Wrapper around an in-process vLLM engine.
+
+    Exposes ``call``/``acall`` like ``OpenAIClient`` plus ``run_batch``,
+    which returns results in the Batch API output format so the extractors
+    can parse them with ``extract_batch_result``.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_LOCAL_MODEL,
+        cache: LLMCache | None = None,
+        *,
+        quantization: str | None = "awq",
+        dtype: str = "half",
+        max_tokens: int = 512,
+    ) -> None:
+        """
+        Load the model into a vLLM engine.
+
+        Args:
+            model: Hugging Face model ID or local path.
+            cache: Optional completion cache consulted before single calls.
+            quantization: vLLM quantization method, or None for an
+                          unquantized checkpoint.
+            dtype: Activation dtype.
+            max_tokens: Maximum number of generated tokens per request.
+
+        """
+        try:
+            from vllm import LLM, SamplingParams  # noqa: PLC0415
+        except ImportError as e:
+            msg = "Install vllm package: uv add vllm"
+            raise ImportError(msg) from e
+
+        self.llm = LLM(model=model, quantization=quantization, dtype=dtype)
+        self.model = model
+        self.cache = cache
+        self.max_tokens = max_tokens
+        self._sampling_params = SamplingParams
+        # The engine is not thread-safe; acall runs generation in a thread
+        self._lock = threading.Lock()
+
+    async def aclose(self) -> None:
+        """No-op, kept for interface parity with ``OpenAIClient``."""
+
+    def _generate(
+        self,
+        prompts: list[str],
+        temperatures: list[float],
+        seeds: list[int | None],
+    ) -> list[str]:
+        """Generate one completion per prompt in a single engine call."""
+        conversations = [[{"role": "user", "content": p}] for p in prompts]
+        params = [
+            self._sampling_params(
+                temperature=temperature,
+                seed=seed,
+                max_tokens=self.max_tokens,
+            )
+            for temperature, seed in zip(temperatures, seeds, strict=True)
+        ]
+        with self._lock:
+            outputs = self.llm.chat(conversations, params, use_tqdm=False)
+        return [output.outputs[0].text for output in outputs]
+
+    # --------------------------- Single Requests ----------------------------
+
+    def call(
+        self,
+        prompt: str,
+        model: str | None = None,  # noqa: ARG002
+        temperature: float = 0.0,
+        response_format: dict | None = None,  # noqa: ARG002
+        seed: int | None = None,
+    ) -> str:
+        """
+        Generate a single completion.
+
+        ``model`` and ``response_format`` are accepted for compatibility with
+        ``OpenAIClient.call``; the loaded model is always used and JSON output
+        relies on the prompt's instructions.
+
+        Args:
+            prompt: The prompt text.
+            model: Ignored.
+            temperature: Sampling temperature.
+            response_format: Ignored.
+            seed: Optional sampling seed for reproducible outputs.
+
+        Returns:
+            The completion text.
+
+        """
+        key = None
+        if self.cache is not None and self.cache.accepts(temperature):
+            # response_format is ignored here, so it does not split the key
+            key = self.cache.make_key(
+                self.model, temperature, prompt, seed=seed
+            )
+            if (cached := self.cache.get(key)) is not None:
+                return cached
+
+        content = self._generate([prompt], [temperature], [seed])[0]
+
+        if key is not None:
+            self.cache.set(key, content)
+        return content
+
+    async def acall(
+        self,
+        prompt: str,
+        model: str | None = None,
+        temperature: float = 0.0,
+        response_format: dict | None = None,
+        seed: int | None = None,
+    ) -> str:
+        """Generate a single completion without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.call,
+            prompt,
+            model,
+            temperature,
+            response_format,
+            seed,
+        )
+
+    # ---------------------------- Batch Requests ----------------------------
+
+    def run_batch(self, requests: Iterable[dict]) -> list[dict[str, Any]]:
+        """
+        Run Batch API style requests locally.
+
+        Every prompt goes to vLLM in one engine call. vLLM does not pad, and
+        its continuous batching schedules the whole list, so splitting it
+        into smaller calls would only leave the GPU idle between them.
+        Results are returned in request order.
+
+        Args:
+            requests: Requests built with ``build_batch_request``.
+
+        Returns:
+            One result per request, shaped like Batch API output lines.
+
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+
+        prompts = [r["body"]["messages"][-1]["content"] for r in requests]
+        temperatures = [r["body"].get("temperature", 0.0) for r in requests]
+        seeds = [r["body"].get("seed") for r in requests]
+
+        contents = self._generate(prompts, temperatures, seeds)
+
+        return [
+            {
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "model": self.model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": content,
+                                },
+                            },
+                        ],
+                    },
+                },
+            }
+            for request, content in zip(requests, contents, strict=True)
+        ]
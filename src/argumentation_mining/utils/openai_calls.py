@@ -2,19 +2,137 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
 import json
 import os
 from pathlib import Path
+import random
+import re
+import time
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from argumentation_mining.utils.hashing import fingerprint
 
 try:
-    from openai import OpenAI
+    from openai import (
+        APIConnectionError,
+        AsyncOpenAI,
+        InternalServerError,
+        OpenAI,
+        RateLimitError,
+    )
 except ImportError as e:
     msg = "Install openai package: uv add openai"
     raise ImportError(msg) from e
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    orjson = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+    from openai.types import Batch
+
+    from argumentation_mining.utils.llm_cache import LLMCache
+    from argumentation_mining.utils.rate_limit import TokenBucket
+
+
+# Transient API errors (429, 5xx, dropped connections) worth retrying.
+_RETRYABLE_ERRORS = (RateLimitError, InternalServerError, APIConnectionError)
+
+_api_retry = retry(
+    retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+    wait=wait_exponential(multiplier=1, min=1, max=20),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+
+# Rough prompt-size estimate used for rate limiting, same heuristic the API
+# applies before a request is tokenized.
+_CHARS_PER_TOKEN = 4
+
+# Pause new async requests while fewer than this fraction of the per-minute
+# token quota remains, until the window the API reports has reset.
+_TOKEN_HEADROOM = 0.1
+_RESET_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RESET_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset(value: str) -> float:
+    """Convert a rate-limit reset header such as ``"1m30s"`` to seconds."""
+    return sum(
+        float(amount) * _RESET_UNITS[unit]
+        for amount, unit in _RESET_PART.findall(value)
+    )
+
+
+# Batch files larger than one Uploads API part (64 MB max) are sent through
+# the multipart Uploads API, several parts at a time, instead of one stream.
+_UPLOAD_PART_SIZE = 64 * 1024 * 1024
+_UPLOAD_CONCURRENCY = 4
+
+# Batch input files are written through a large buffer so a million small
+# request lines turn into few write syscalls
+_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Requests per batch job; the Batch API rejects input files with more, and
+# separate jobs are processed in parallel
+BATCH_SHARD_SIZE = 50_000
+
+# Maximum number of inputs the embeddings endpoint accepts per call
+_EMBEDDING_BATCH_SIZE = 2048
+
+
+def _read_part(path: Path, offset: int, size: int) -> bytes:
+    """Read ``size`` bytes of ``path`` starting at ``offset``."""
+    with path.open("rb") as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load ``.env`` into the environment, once per process."""
+    load_dotenv()
+
+
+def _optional_kwargs(response_format: dict | None, seed: int | None) -> dict:
+    """Return the ``response_format`` and ``seed`` arguments that are set."""
+    kwargs: dict = {}
+    if response_format:
+        kwargs["response_format"] = response_format
+    if seed is not None:
+        kwargs["seed"] = seed
+    return kwargs
+
+
+def _jsonl_line(record: dict) -> bytes:
+    """Serialize one record as a UTF-8 JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _parse_jsonl_line(line: str | bytes) -> dict:
+    """Parse one JSONL line."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
 
 # ---------------------------------------------------------------------------
 # Models
@@ -29,12 +147,65 @@ class BatchJobStatus(BaseModel):
     input_file_id: str
     output_file_id: str | None = None
     error_file_id: str | None = None
+    completed_requests: int = 0
+    total_requests: int = 0
 
     @property
     def is_complete(self) -> bool:
         """Check if batch is in terminal state."""
         return self.status in {"completed", "failed", "expired", "cancelled"}
 
+    @property
+    def progress(self) -> float:
+        """Fraction of requests finished so far (0.0 if unknown)."""
+        if not self.total_requests:
+            return 0.0
+        return self.completed_requests / self.total_requests
+
+
+def _jittered(delay: float, jitter: float) -> float:
+    """Scale ``delay`` by a random factor in ``[1 - jitter, 1 + jitter]``."""
+    if not jitter:
+        return delay
+    return delay * random.uniform(1 - jitter, 1 + jitter)  # noqa: S311
+
+
+def _next_poll_delay(
+    delay: float,
+    status: BatchJobStatus,
+    *,
+    initial_delay: float,
+    max_delay: float,
+    backoff: float,
+) -> float:
+    """
+    Grow the poll interval, shrinking it again as the batch nears completion.
+
+    The delay is capped by the fraction of requests still pending, so a batch
+    that is 95% done is polled close to ``initial_delay`` again.
+    """
+    remaining_cap = max(initial_delay, max_delay * (1.0 - status.progress))
+    return min(delay * backoff, max_delay, remaining_cap)
+
+
+def _batch_status(batch: Batch) -> BatchJobStatus:
+    """
+    Convert an API batch object to a ``BatchJobStatus``.
+
+    ``batch`` was already validated by the SDK, so its fields are read
+    directly instead of through ``getattr`` fallbacks.
+    """
+    request_counts = batch.request_counts
+    return BatchJobStatus(
+        job_id=batch.id,
+        status=batch.status,
+        input_file_id=batch.input_file_id,
+        output_file_id=batch.output_file_id,
+        error_file_id=batch.error_file_id,
+        completed_requests=request_counts.completed if request_counts else 0,
+        total_requests=request_counts.total if request_counts else 0,
+    )
+
 
 # ---------------------------------------------------------------------------
 # OpenAI Client Wrapper
@@ -52,6 +223,8 @@ class OpenAIClient:
         self,
         api_key: str | None = None,
         model: str = "gpt-4o-mini",
+        cache: LLMCache | None = None,
+        token_bucket: TokenBucket | None = None,
     ) -> None:
         """
         Initialize OpenAI client.
@@ -59,16 +232,45 @@ class OpenAIClient:
         Args:
             api_key: OpenAI API key (reads from env if not provided).
             model: Default model to use.
+            cache: Optional completion cache consulted before single calls.
+            token_bucket: Optional tokens-per-minute limiter applied to async
+                          calls.
 
         """
-        load_dotenv()
-        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            _load_env()
+            api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             msg = "OPENAI_API_KEY is required"
             raise ValueError(msg)
 
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.cache = cache
+        self.token_bucket = token_bucket
+        self._api_key = api_key
+        self._async_client: AsyncOpenAI | None = None
+        self._paused_until = 0.0
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        Async client, created lazily on first use.
+
+        Retries are handled by ``acall``, so the SDK's own retries are off.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(
+                api_key=self._api_key,
+                max_retries=0,
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client so a new event loop can open a fresh one."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
 
     # --------------------------- Single Requests ----------------------------
 
@@ -77,6 +279,8 @@ class OpenAIClient:
         prompt: str,
         model: str | None = None,
         temperature: float = 0.0,
+        response_format: dict | None = None,
+        seed: int | None = None,
     ) -> str:
         """
         Make a single chat completion call.
@@ -85,30 +289,168 @@ class OpenAIClient:
             prompt: The prompt text.
             model: Model to use (uses default if None).
             temperature: Sampling temperature.
+            response_format: Optional response format, e.g.
+                             ``{"type": "json_object"}``.
+            seed: Optional sampling seed for reproducible outputs.
 
         Returns:
             The completion text.
 
         """
+        model = model or self.model
+        key = self._cache_lookup_key(
+            model, temperature, prompt, response_format, seed
+        )
+        if key is not None and (cached := self.cache.get(key)) is not None:
+            return cached
+
         response = self.client.chat.completions.create(
-            model=model or self.model,
+            model=model,
             messages=[{"role": "user", "content": prompt}],
             temperature=temperature,
+            **_optional_kwargs(response_format, seed),
         )
+        content = response.choices[0].message.content or ""
+
+        if key is not None:
+            self.cache.set(key, content)
+        return content
+
+    async def acall(
+        self,
+        prompt: str,
+        model: str | None = None,
+        temperature: float = 0.0,
+        response_format: dict | None = None,
+        seed: int | None = None,
+    ) -> str:
+        """
+        Make a single chat completion call without blocking the event loop.
+
+        Rate-limit and server errors are retried with exponential backoff.
+
+        Args:
+            prompt: The prompt text.
+            model: Model to use (uses default if None).
+            temperature: Sampling temperature.
+            response_format: Optional response format, e.g.
+                             ``{"type": "json_object"}``.
+            seed: Optional sampling seed for reproducible outputs.
+
+        Returns:
+            The completion text.
+
+        """
+        model = model or self.model
+        key = self._cache_lookup_key(
+            model, temperature, prompt, response_format, seed
+        )
+        if key is not None and (cached := self.cache.get(key)) is not None:
+            return cached
+
+        content = await self._acomplete(
+            prompt, model, temperature, response_format, seed
+        )
+
+        if key is not None:
+            self.cache.set(key, content)
+        return content
+
+    @_api_retry
+    async def _acomplete(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_format: dict | None = None,
+        seed: int | None = None,
+    ) -> str:
+        """Send one async chat completion request, retrying on 429/5xx."""
+        if self.token_bucket is not None:
+            await self.token_bucket.acquire(len(prompt) / _CHARS_PER_TOKEN)
+        if (delay := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+        raw = await self.async_client.chat.completions.with_raw_response.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            **_optional_kwargs(response_format, seed),
+        )
+        self._track_token_headroom(raw.headers)
+        response = raw.parse()
         return response.choices[0].message.content or ""
 
+    def _track_token_headroom(self, headers: Mapping[str, str]) -> None:
+        """Schedule a dispatch pause when the token quota is almost spent."""
+        try:
+            limit = int(headers["x-ratelimit-limit-tokens"])
+            remaining = int(headers["x-ratelimit-remaining-tokens"])
+            reset = _parse_reset(headers["x-ratelimit-reset-tokens"])
+        except (KeyError, ValueError):
+            return
+        if limit and remaining < limit * _TOKEN_HEADROOM:
+            self._paused_until = max(
+                self._paused_until,
+                time.monotonic() + reset,
+            )
+
+    def _cache_lookup_key(
+        self,
+        model: str,
+        temperature: float,
+        prompt: str,
+        response_format: dict | None,
+        seed: int | None,
+    ) -> str | None:
+        """Return the cache key for a request, or None if it is not cached."""
+        if self.cache is None or not self.cache.accepts(temperature):
+            return None
+        return self.cache.make_key(
+            model, temperature, prompt, response_format, seed
+        )
+
+    # ------------------------------ Embeddings ------------------------------
+
+    def embed(
+        self,
+        texts: list[str],
+        model: str = "text-embedding-3-small",
+    ) -> list[list[float]]:
+        """
+        Embed texts, sending as many per request as the API allows.
+
+        Args:
+            texts: Texts to embed.
+            model: Embedding model to use.
+
+        Returns:
+            One embedding vector per text, in input order.
+
+        """
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), _EMBEDDING_BATCH_SIZE):
+            response = self.client.embeddings.create(
+                model=model,
+                input=texts[start : start + _EMBEDDING_BATCH_SIZE],
+            )
+            data = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in data)
+        return embeddings
+
     # ----------------------------- Batch API --------------------------------
 
     def send_batch(
         self,
-        requests: list[dict],
+        requests: Iterable[dict],
         output_path: str | Path,
     ) -> BatchJobStatus:
         """
         Submit a batch of requests.
 
         Args:
-            requests: List of request dicts in OpenAI batch format.
+            requests: Request dicts in OpenAI batch format. Any iterable
+                      works; requests are written to disk one at a time.
             output_path: Path to save the JSONL file.
 
         Returns:
@@ -133,28 +475,115 @@ class OpenAIClient:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with output_path.open("w", encoding="utf-8") as f:
-            for request in requests:
-                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+        with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(_jsonl_line(request) for request in requests)
 
         # Upload file
-        with output_path.open("rb") as f:
-            uploaded_file = self.client.files.create(file=f, purpose="batch")
+        input_file_id = self._upload_batch_file(output_path)
 
         # Create batch job
         batch = self.client.batches.create(
-            input_file_id=uploaded_file.id,
+            input_file_id=input_file_id,
             endpoint="/v1/chat/completions",
             completion_window="24h",
         )
 
-        return BatchJobStatus(
-            job_id=batch.id,
-            status=batch.status,
-            input_file_id=uploaded_file.id,
-            output_file_id=getattr(batch, "output_file_id", None),
-            error_file_id=getattr(batch, "error_file_id", None),
-        )
+        return _batch_status(batch)
+
+    def send_batch_shards(
+        self,
+        requests: Iterable[dict],
+        output_path: str | Path,
+        shard_size: int = BATCH_SHARD_SIZE,
+    ) -> list[BatchJobStatus]:
+        """
+        Submit requests as one batch job per ``shard_size`` requests.
+
+        The first shard is written to ``output_path`` and the k-th to
+        ``<stem>_shard<k><suffix>`` next to it, so a run that fits in one
+        job keeps the file name ``send_batch`` would use.
+
+        Args:
+            requests: Request dicts in OpenAI batch format. Any iterable
+                      works; each shard is streamed to disk as it is read.
+            output_path: Path to save the first shard's JSONL file.
+            shard_size: Maximum number of requests per job.
+
+        Returns:
+            BatchJobStatus of each submitted job, in shard order.
+
+        """
+        output_path = Path(output_path)
+        requests = iter(requests)
+        statuses = []
+        for k in itertools.count():
+            first = next(requests, None)
+            if first is None:
+                break
+            shard_path = (
+                output_path
+                if k == 0
+                else output_path.with_name(
+                    f"{output_path.stem}_shard{k}{output_path.suffix}",
+                )
+            )
+            statuses.append(
+                self.send_batch(
+                    itertools.chain(
+                        (first,),
+                        itertools.islice(requests, shard_size - 1),
+                    ),
+                    shard_path,
+                ),
+            )
+        return statuses
+
+    def _upload_batch_file(self, path: Path) -> str:
+        """Upload a batch input file and return its file ID."""
+        size = path.stat().st_size
+        if size <= _UPLOAD_PART_SIZE:
+            with path.open("rb") as f:
+                return self.client.files.create(file=f, purpose="batch").id
+        return asyncio.run(self._aupload_in_parts(path, size))
+
+    async def _aupload_in_parts(self, path: Path, size: int) -> str:
+        """Upload a large file as concurrent Uploads API parts."""
+        # A client of its own, since this runs in a short-lived event loop
+        async with AsyncOpenAI(api_key=self._api_key) as client:
+            upload = await client.uploads.create(
+                bytes=size,
+                filename=path.name,
+                mime_type="application/jsonl",
+                purpose="batch",
+            )
+            semaphore = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+
+            async def _send_part(offset: int) -> str:
+                async with semaphore:
+                    data = await asyncio.to_thread(
+                        _read_part,
+                        path,
+                        offset,
+                        _UPLOAD_PART_SIZE,
+                    )
+                    part = await client.uploads.parts.create(
+                        upload.id,
+                        data=data,
+                    )
+                return part.id
+
+            # gather keeps part order, which the upload is assembled in
+            part_ids = await asyncio.gather(
+                *(
+                    _send_part(offset)
+                    for offset in range(0, size, _UPLOAD_PART_SIZE)
+                ),
+            )
+            completed = await client.uploads.complete(
+                upload.id,
+                part_ids=list(part_ids),
+            )
+        return completed.file.id
 
     def check_batch(self, job_id: str) -> BatchJobStatus:
         """
@@ -167,14 +596,78 @@ class OpenAIClient:
             Updated BatchJobStatus.
 
         """
-        batch = self.client.batches.retrieve(job_id)
-        return BatchJobStatus(
-            job_id=batch.id,
-            status=batch.status,
-            input_file_id=batch.input_file_id,
-            output_file_id=getattr(batch, "output_file_id", None),
-            error_file_id=getattr(batch, "error_file_id", None),
-        )
+        return _batch_status(self.client.batches.retrieve(job_id))
+
+    def list_batches(self, limit: int = 100) -> list[BatchJobStatus]:
+        """
+        Fetch the statuses of the most recent batch jobs in one call.
+
+        Args:
+            limit: Number of jobs to return (at most 100).
+
+        Returns:
+            Statuses of the newest jobs, newest first.
+
+        """
+        page = self.client.batches.list(limit=limit)
+        return [_batch_status(batch) for batch in page.data]
+
+    def wait_for_batch(  # noqa: PLR0913
+        self,
+        job_id: str,
+        *,
+        initial_delay: float = 5.0,
+        max_delay: float = 300.0,
+        backoff: float = 1.5,
+        jitter: float = 0.0,
+        max_wait: float | None = None,
+        on_poll: Callable[[BatchJobStatus], None] | None = None,
+    ) -> BatchJobStatus:
+        """
+        Block until a batch job reaches a terminal state.
+
+        Polls with exponential backoff, so long-running jobs cost a handful
+        of status checks instead of one every few seconds.
+
+        Args:
+            job_id: The batch job ID.
+            initial_delay: Seconds before the first re-check.
+            max_delay: Upper bound on the delay between checks.
+            backoff: Factor applied to the delay after each pending check.
+            jitter: Randomize each sleep by up to this fraction (e.g. 0.2
+                    for +/-20%) so concurrent waiters do not poll in step.
+            max_wait: Give up after this many seconds. If None, wait
+                      indefinitely.
+            on_poll: Optional callback invoked with every fetched status.
+
+        Returns:
+            Final BatchJobStatus.
+
+        Raises:
+            TimeoutError: If the job is still running after ``max_wait``.
+
+        """
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        delay = initial_delay
+
+        status = self.check_batch(job_id)
+        while not status.is_complete:
+            if deadline is not None and time.monotonic() + delay > deadline:
+                msg = f"Batch {job_id} not complete after {max_wait}s"
+                raise TimeoutError(msg)
+            time.sleep(_jittered(delay, jitter))
+            status = self.check_batch(job_id)
+            if on_poll:
+                on_poll(status)
+            delay = _next_poll_delay(
+                delay,
+                status,
+                initial_delay=initial_delay,
+                max_delay=max_delay,
+                backoff=backoff,
+            )
+
+        return status
 
     def get_batch_results(self, job_id: str) -> list[dict]:
         """
@@ -187,18 +680,33 @@ class OpenAIClient:
             List of result dicts.
 
         """
-        status = self.check_batch(job_id)
+        return list(self.iter_batch_results(job_id))
 
-        if not status.output_file_id:
-            return []
+    def iter_batch_results(self, job_id: str) -> Iterator[dict]:
+        """
+        Stream results from a completed batch job.
 
-        content = self.client.files.content(status.output_file_id)
-        text = content.text if hasattr(content, "text") else content.read()
+        The output file is downloaded and parsed line by line, so neither
+        the raw file nor its lines are ever held in memory as a whole.
 
-        if isinstance(text, bytes):
-            text = text.decode("utf-8")
+        Args:
+            job_id: The batch job ID.
 
-        return [json.loads(line) for line in text.splitlines() if line.strip()]
+        Yields:
+            One result dict per output line.
+
+        """
+        status = self.check_batch(job_id)
+
+        if not status.output_file_id:
+            return
+
+        with self.client.files.with_streaming_response.content(
+            status.output_file_id,
+        ) as response:
+            for line in response.iter_lines():
+                if line.strip():
+                    yield _parse_jsonl_line(line)
 
 
 # ---------------------------------------------------------------------------
@@ -206,11 +714,14 @@ class OpenAIClient:
 # ---------------------------------------------------------------------------
 
 
-def build_batch_request(
+def build_batch_request(  # noqa: PLR0913
     custom_id: str,
     prompt: str,
     model: str = "gpt-4o-mini",
     temperature: float = 0.2,
+    response_format: dict | None = None,
+    *,
+    seed: int | None = None,
 ) -> dict:
     """
     Build a single batch request.
@@ -220,6 +731,9 @@ def build_batch_request(
         prompt: The prompt text.
         model: Model to use.
         temperature: Sampling temperature.
+        response_format: Optional response format, e.g.
+                         ``{"type": "json_object"}``.
+        seed: Optional sampling seed for reproducible outputs.
 
     Returns:
         Request dict in OpenAI batch format.
@@ -233,10 +747,105 @@ def build_batch_request(
             "model": model,
             "messages": [{"role": "user", "content": prompt}],
             "temperature": temperature,
+            **_optional_kwargs(response_format, seed),
         },
     }
 
 
+def build_batch_requests(
+    prompts: Iterable[str],
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.2,
+    id_prefix: str = "request",
+) -> Iterator[dict]:
+    """
+    Build batch requests for many prompts sharing one model and temperature.
+
+    The invariant request fields are built once and reused, and requests are
+    yielded lazily so they can be streamed straight into ``send_batch``.
+
+    Args:
+        prompts: The prompt texts.
+        model: Model to use.
+        temperature: Sampling temperature.
+        id_prefix: Prefix for the generated ``custom_id`` values, which are
+                   ``f"{id_prefix}_{i}"`` for the i-th prompt.
+
+    Yields:
+        Request dicts in OpenAI batch format.
+
+    """
+    base = {"method": "POST", "url": "/v1/chat/completions"}
+    base_body = {"model": model, "temperature": temperature}
+    for i, prompt in enumerate(prompts):
+        yield {
+            "custom_id": f"{id_prefix}_{i}",
+            **base,
+            "body": {
+                **base_body,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        }
+
+
+def dedupe_batch_requests(
+    requests: Iterable[dict],
+    aliases: dict[str, list[str]],
+) -> Iterator[dict]:
+    """
+    Drop batch requests whose body repeats an earlier request.
+
+    Requests are consumed lazily. The ``custom_id`` of every skipped
+    duplicate is recorded in ``aliases`` under the ``custom_id`` that will
+    actually be sent, so results can be fanned out afterwards with
+    ``fan_out_batch_results``.
+
+    Args:
+        requests: Request dicts in OpenAI batch format.
+        aliases: Dict filled with representative id -> duplicate ids.
+
+    Yields:
+        The first request for each distinct body.
+
+    """
+    first_ids: dict[bytes, str] = {}
+    for request in requests:
+        key = fingerprint(_jsonl_line(request["body"]))
+        if key in first_ids:
+            aliases.setdefault(first_ids[key], []).append(
+                request["custom_id"],
+            )
+            continue
+        first_ids[key] = request["custom_id"]
+        yield request
+
+
+def fan_out_batch_results(
+    results: list[dict],
+    aliases: dict[str, list[str]],
+) -> list[dict]:
+    """
+    Copy each batch result to the duplicates it stood in for.
+
+    Args:
+        results: Result dicts from ``get_batch_results``.
+        aliases: Mapping filled by ``dedupe_batch_requests``.
+
+    Returns:
+        Results including one entry per original ``custom_id``.
+
+    """
+    if not aliases:
+        return results
+    fanned = list(results)
+    for result in results:
+        fanned.extend(
+            {**result, "custom_id": alias}
+            for alias in aliases.get(result.get("custom_id", ""), ())
+        )
+    return fanned
+
+
 def extract_batch_result(result: dict) -> str:
     """
     Extract the completion text from a batch result.
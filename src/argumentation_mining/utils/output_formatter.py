@@ -7,23 +7,32 @@ Provides functions to save extraction results in JSON and CSV formats.
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    orjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    # Fall back to csv.writer when pyarrow is not installed
+    pa = None
+    pa_csv = None
+
 if TYPE_CHECKING:
     from logging import Logger
 
+# Records are small, so a large write buffer turns them into few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
 
-@dataclass
-class _ArticleData:
-    """Internal class to group article-related data for row creation."""
-
-    article_id: str
-    text: str
-    success: bool
-    error_message: str
+# The one CSV column written as a number; every other column is text
+_INT_COLUMN = "premises_count"
 
 
 def save_as_json(
@@ -34,6 +43,10 @@ def save_as_json(
     """
     Save results to JSON file.
 
+    Records are serialized one at a time and framed as a JSON array, so the
+    full output string is never built in memory; writes go through a 1 MiB
+    buffer. Uses orjson when available.
+
     Args:
         results: List of result dictionaries.
         output_path: Path to output JSON file.
@@ -44,8 +57,12 @@ def save_as_json(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(b"[")
+            for i, record in enumerate(results):
+                f.write(b",\n" if i else b"\n")
+                f.write(_dumps(record))
+            f.write(b"\n]\n" if results else b"]\n")
 
         if logger:
             logger.info("Results saved to JSON: %s", output_path)
@@ -57,6 +74,16 @@ def save_as_json(
         raise
 
 
+def _dumps(record: dict[str, Any]) -> bytes:
+    """Serialize one result record to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            record,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(record, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def save_as_csv(
     results: list[dict[str, Any]],
     output_path: str | Path,
@@ -79,39 +106,46 @@ def save_as_csv(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    flattened_rows = _flatten_results_for_csv(results, max_premises)
+    columns = _flatten_results_for_csv(results, max_premises)
+    n_rows = len(columns["article_id"])
 
-    if not flattened_rows:
+    if not n_rows:
         msg = "No data to write to CSV."
         if logger:
             logger.warning(msg)
         return
 
-    fieldnames = [
-        "article_id",
-        "text",
-        "success",
-        "error_message",
-        "argument_index",
-        "question",
-        "answer",
-        "claim",
-        "premises_count",
-        "premises_concatenated",
-    ]
-    # Add premise columns
-    fieldnames.extend([f"premise_{i + 1}" for i in range(max_premises)])
-
     try:
-        with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(flattened_rows)
+        if pa is not None:
+            _write_csv_arrow(columns, output_path)
+        else:
+            with output_path.open(
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=_WRITE_BUFFER_SIZE,
+            ) as csvfile:
+                # Same dialect as the pyarrow writer: text quoted, "\n" rows
+                writer = csv.writer(
+                    csvfile,
+                    quoting=csv.QUOTE_NONNUMERIC,
+                    lineterminator="\n",
+                )
+                writer.writerow(columns)
+                writer.writerows(
+                    zip(
+                        *(
+                            values if name == _INT_COLUMN else _as_text(values)
+                            for name, values in columns.items()
+                        ),
+                        strict=True,
+                    ),
+                )
 
         if logger:
             logger.info(
                 "Successfully converted %d rows to %s",
-                len(flattened_rows),
+                n_rows,
                 output_path,
             )
 
@@ -122,122 +156,107 @@ def save_as_csv(
         raise
 
 
+def _write_csv_arrow(
+    columns: dict[str, list[Any]],
+    output_path: Path,
+) -> None:
+    """
+    Write flattened columns with pyarrow's C++ CSV writer.
+
+    Every column except ``premises_count`` is written as quoted text (None
+    becomes an empty field), and rows end in a bare newline. The
+    ``csv.writer`` fallback in ``save_as_csv`` writes the same bytes.
+    """
+    arrays = {}
+    for name, values in columns.items():
+        if name == _INT_COLUMN:
+            arrays[name] = pa.array(values, type=pa.int64())
+        else:
+            arrays[name] = pa.array(_as_text(values), type=pa.string())
+
+    pa_csv.write_csv(
+        pa.table(arrays),
+        str(output_path),
+        write_options=pa_csv.WriteOptions(quoting_style="needed"),
+    )
+
+
+def _as_text(values: list[Any]) -> list[str]:
+    """Render CSV cells as text, with None as an empty field."""
+    return ["" if v is None else str(v) for v in values]
+
+
 def _flatten_results_for_csv(
     results: list[dict[str, Any]],
     max_premises: int = 5,
-) -> list[dict[str, Any]]:
+) -> dict[str, list[Any]]:
     """
-    Flatten nested JSON structure to create rows for CSV.
+    Flatten nested JSON structure into CSV columns.
 
-    Each row contains article info + one argument with premises flattened.
+    Each row holds article info + one argument with premises flattened;
+    articles without arguments get a single row with empty argument fields.
+    The output is built a column at a time, so no per-row dict is created.
 
     Args:
         results: List of result dictionaries.
         max_premises: Maximum number of premise columns to create.
 
     Returns:
-        List of flattened row dictionaries.
+        Mapping of CSV field name to column values, in field order.
 
     """
-    rows = []
+    article_columns: dict[str, list[Any]] = {
+        "article_id": [],
+        "text": [],
+        "success": [],
+        "error_message": [],
+    }
+    defaults = {
+        "article_id": "",
+        "text": "",
+        "success": False,
+        "error_message": "",
+    }
+    arguments: list[dict[str, Any] | None] = []
+    argument_indices: list[int | str] = []
 
     for article in results:
-        article_id = article.get("article_id", "")
-        text = article.get("text", "")
-        success = article.get("success", False)
-        error_message = article.get("error_message", "")
-        arguments = article.get("arguments", [])
-
-        # If there are no arguments, create one row with just article data
-        if not arguments:
-            article_data = _ArticleData(
-                article_id=article_id,
-                text=text,
-                success=success,
-                error_message=error_message,
-            )
-            row = _create_empty_row(article_data, max_premises)
-            rows.append(row)
+        article_arguments = article.get("arguments") or []
+        # Articles without arguments keep one row with just article data
+        n_rows = len(article_arguments) or 1
+        for name, column in article_columns.items():
+            column.extend([article.get(name, defaults[name])] * n_rows)
+        if article_arguments:
+            arguments.extend(article_arguments)
+            argument_indices.extend(range(1, n_rows + 1))
         else:
-            # Create one row per argument
-            for arg_index, argument in enumerate(arguments):
-                article_data = _ArticleData(
-                    article_id=article_id,
-                    text=text,
-                    success=success,
-                    error_message=error_message,
-                )
-                row = _create_argument_row(
-                    article_data,
-                    arg_index,
-                    argument,
-                    max_premises,
-                )
-                rows.append(row)
-
-    return rows
-
-
-def _create_empty_row(
-    article_data: _ArticleData,
-    max_premises: int,
-) -> dict[str, Any]:
-    """Create an empty row for articles with no arguments."""
-    row = {
-        "article_id": article_data.article_id,
-        "text": article_data.text,
-        "success": article_data.success,
-        "error_message": article_data.error_message,
-        "argument_index": "",
-        "question": "",
-        "answer": "",
-        "claim": "",
-        "premises_count": 0,
-        "premises_concatenated": "",
-    }
+            arguments.append(None)
+            argument_indices.append("")
 
-    # Add empty premise columns
-    for i in range(max_premises):
-        row[f"premise_{i + 1}"] = ""
-
-    return row
-
-
-def _create_argument_row(
-    article_data: _ArticleData,
-    arg_index: int,
-    argument: dict[str, Any],
-    max_premises: int,
-) -> dict[str, Any]:
-    """Create a row for a single argument."""
-    question = argument.get("question", "")
-    answer = argument.get("answer", "")
-    claim = argument.get("claim", "")
-    premises = argument.get("premises", [])
-
-    # Prepare premise columns (up to max_premises)
-    premise_cols = [""] * max_premises
-    for i, premise in enumerate(premises[:max_premises]):
-        premise_cols[i] = premise
-
-    row = {
-        "article_id": article_data.article_id,
-        "text": article_data.text,
-        "success": article_data.success,
-        "error_message": article_data.error_message,
-        "argument_index": arg_index + 1,
-        "question": question,
-        "answer": answer,
-        "claim": claim,
-        "premises_count": len(premises),
-        "premises_concatenated": " | ".join(premises),
+    premises_lists = [
+        arg.get("premises", []) if arg is not None else [] for arg in arguments
+    ]
+    columns = {
+        **article_columns,
+        "argument_index": argument_indices,
+        **{
+            name: [
+                arg.get(name, "") if arg is not None else ""
+                for arg in arguments
+            ]
+            for name in ("question", "answer", "claim")
+        },
+        "premises_count": [len(premises) for premises in premises_lists],
+        "premises_concatenated": [
+            " | ".join(premises) for premises in premises_lists
+        ],
     }
-
-    # Add premise columns
     for i in range(max_premises):
-        row[f"premise_{i + 1}"] = premise_cols[i]
-
-    return row
+        columns[f"premise_{i + 1}"] = [
+            premises[i] if i < len(premises) else ""
+            for premises in premises_lists
+        ]
+    return columns
 
 
 def print_statistics(
@@ -252,11 +271,14 @@ def print_statistics(
         logger: Optional logger for logging.
 
     """
+    # Single pass over the results for both counters
     total_articles = len(results)
-    successful_articles = sum(1 for r in results if r.get("success", False))
-    total_arguments = sum(
-        len(r.get("arguments", [])) for r in results if r.get("arguments")
-    )
+    successful_articles = 0
+    total_arguments = 0
+    for r in results:
+        if r.get("success", False):
+            successful_articles += 1
+        total_arguments += len(r.get("arguments") or ())
     avg_args = total_arguments / total_articles if total_articles > 0 else 0
 
     stats = f"""
@@ -0,0 +1,81 @@
+"""
+Prompt template loading for the extraction pipelines.
+
+Parsed YAML files are cached per path, so creating several extractors that
+share a prompt file parses it only once.
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+import yaml
+
+# libyaml's C loader when available, the pure-Python one otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_prompts(path: str) -> dict[str, str]:
+    """Parse a prompt YAML file (cached by resolved path)."""
+    with Path(path).open("rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)  # noqa: S506
+
+
+def load_prompts(
+    path: str | Path,
+    required: tuple[str, ...] = (),
+) -> dict[str, str]:
+    """
+    Load prompt templates from a YAML file.
+
+    The returned dict is shared between callers and must not be modified.
+
+    Args:
+        path: Path to the prompts YAML file.
+        required: Template names that must be present.
+
+    Returns:
+        Mapping of template name to template string.
+
+    Raises:
+        KeyError: If any of the ``required`` templates is missing.
+
+    """
+    prompts = _read_prompts(str(Path(path).resolve()))
+    missing = [name for name in required if name not in prompts]
+    if missing:
+        msg = f"Prompts missing from {path}: {', '.join(missing)}"
+        raise KeyError(msg)
+    return prompts
+
+
+def partial_format(
+    template: str,
+    field: str,
+    **values: str,
+) -> tuple[str, str]:
+    """
+    Format a template except for one field.
+
+    Lets a loop that only varies ``field`` (e.g. one question per request)
+    substitute the fixed values, such as the article text, once.
+
+    Args:
+        template: Template in ``str.format`` syntax.
+        field: Name of the field left open; must appear exactly once.
+        **values: Values for every other field.
+
+    Returns:
+        Tuple of (formatted text before ``field``, formatted text after it).
+
+    Raises:
+        ValueError: If ``field`` does not appear exactly once.
+
+    """
+    head, marker, tail = template.partition("{" + field + "}")
+    if not marker or marker in tail:
+        msg = f"Template must contain {{{field}}} exactly once"
+        raise ValueError(msg)
+    return head.format(**values), tail.format(**values)
@@ -0,0 +1,66 @@
+"""
+Client-side token-per-minute limiter for concurrent API calls.
+
+Keeps bursts of concurrent requests under the account's TPM quota so they
+wait locally instead of triggering 429s and retry storms.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``tokens_per_minute / 60`` per second.
+
+    The bucket starts full, so up to one minute's quota can be spent in a
+    burst before callers start waiting.
+    """
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        """
+        Create a full bucket.
+
+        Args:
+            tokens_per_minute: Sustained token budget per minute.
+
+        Raises:
+            ValueError: If ``tokens_per_minute`` is not positive.
+
+        """
+        if tokens_per_minute <= 0:
+            msg = "tokens_per_minute must be positive"
+            raise ValueError(msg)
+
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float) -> None:
+        """
+        Wait until ``tokens`` are available, then take them.
+
+        Requests larger than the bucket are clamped to its capacity so they
+        can still go through. Waiters are served in arrival order.
+
+        Args:
+            tokens: Estimated number of tokens the request will use.
+
+        """
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
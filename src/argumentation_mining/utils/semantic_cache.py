@@ -0,0 +1,129 @@
+"""
+Embedding-based cache for near-duplicate prompts.
+
+Articles on the same topic get near-identical questions ("What is the main
+claim?"), which an exact-match cache never hits. Queries are embedded with a
+small local model and compared against earlier ones; a close enough match
+returns the earlier response instead of calling the LLM.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from argumentation_mining.utils.hashing import fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """
+    Response cache keyed by query embedding within a context.
+
+    Entries are partitioned by a fingerprint of the first ``context_chars``
+    characters of their context (e.g. the article), so a similar question
+    asked about a different article never returns that article's answer.
+    Within a partition, the nearest earlier query by cosine similarity is
+    returned when it reaches ``threshold``. The cache can be shared between
+    threads.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        threshold: float = 0.92,
+        context_chars: int = 500,
+        encode: Callable[[str], np.ndarray] | None = None,
+    ) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            model: sentence-transformers model used to embed queries.
+            threshold: Minimum cosine similarity for a hit.
+            context_chars: Leading characters of the context that identify
+                           its partition.
+            encode: Optional function returning a query's embedding, used
+                    instead of loading ``model``.
+
+        """
+        if encode is None:
+            try:
+                from sentence_transformers import (  # noqa: PLC0415
+                    SentenceTransformer,
+                )
+            except ImportError as e:
+                msg = (
+                    "Install sentence-transformers package: "
+                    "uv add sentence-transformers"
+                )
+                raise ImportError(msg) from e
+            encode = SentenceTransformer(model).encode
+
+        self._encode = encode
+        self.threshold = threshold
+        self.context_chars = context_chars
+        # context fingerprint -> (normalized query vectors, responses)
+        self._entries: dict[bytes, tuple[np.ndarray, list[str]]] = {}
+        # get() and the set() after a miss embed the same query
+        self._last_query: tuple[str, np.ndarray] | None = None
+        self.hits = 0
+        self.misses = 0
+        # Guards the entries and counters; embedding runs outside of it
+        self._lock = threading.Lock()
+
+    def _embed(self, query: str) -> np.ndarray:
+        """Return the L2-normalized embedding of ``query``."""
+        last_query = self._last_query
+        if last_query is not None and last_query[0] == query:
+            return last_query[1]
+        vector = np.asarray(self._encode(query), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        self._last_query = (query, vector)
+        return vector
+
+    def _partition(self, context: str) -> bytes:
+        return fingerprint(context[: self.context_chars])
+
+    def get(self, query: str, context: str) -> str | None:
+        """Return the response of the closest earlier query, or None."""
+        key = self._partition(context)
+        if key in self._entries:
+            vector = self._embed(query)
+            with self._lock:
+                vectors, responses = self._entries[key]
+                scores = vectors @ vector
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    self.hits += 1
+                    return responses[best]
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, query: str, context: str, response: str) -> None:
+        """Store ``response`` for ``query`` within ``context``."""
+        key = self._partition(context)
+        vector = self._embed(query)[np.newaxis, :]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = (vector, [response])
+            else:
+                vectors, responses = entry
+                self._entries[key] = (np.vstack((vectors, vector)), responses)
+                responses.append(response)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
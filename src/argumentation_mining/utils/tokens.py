@@ -0,0 +1,105 @@
+"""
+Token counting and truncation helpers built on tiktoken.
+
+Encoders are cached per model, and whole article lists are encoded in one
+batched call.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+
+import tiktoken
+
+# Encoding used for models tiktoken does not know (local or non-OpenAI)
+FALLBACK_ENCODING = "o200k_base"
+
+
+# Building an encoder loads the BPE ranks, so reuse one per model
+@functools.lru_cache(maxsize=4)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """Return the model's tokenizer, or ``FALLBACK_ENCODING`` if unknown."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
+
+
+# A soft cut may give up at most this fraction of the token budget to end on
+# a paragraph or sentence boundary; otherwise fall back to a hard cut
+_SOFT_CUT_MIN_KEEP = 0.8
+_SOFT_CUT_BOUNDARIES = ("\n\n", "\n", ". ")
+
+
+def count_tokens(texts: list[str], model: str) -> list[int]:
+    """
+    Count the tokens of every text with the model's tokenizer.
+
+    Args:
+        texts: Texts to measure.
+        model: Model name used to pick the tokenizer.
+
+    Returns:
+        Token count per text, in input order.
+
+    """
+    encoding = get_encoding(model)
+    tokens = encoding.encode_batch(
+        [str(text) for text in texts],
+        num_threads=os.cpu_count() or 1,
+    )
+    return [len(t) for t in tokens]
+
+
+def truncate_texts(
+    texts: list[str],
+    model: str,
+    max_tokens: int,
+) -> tuple[list[str], list[int]]:
+    """
+    Shorten texts that exceed a token budget.
+
+    Texts over the budget are cut at the last paragraph or sentence boundary
+    that still keeps most of the budget (soft cut), or exactly at
+    ``max_tokens`` when no such boundary exists (hard cut).
+
+    Args:
+        texts: Texts to truncate.
+        model: Model name used to pick the tokenizer.
+        max_tokens: Maximum number of tokens per text.
+
+    Returns:
+        Tuple of (truncated texts, token count per truncated text).
+
+    """
+    encoding = get_encoding(model)
+    texts = [str(text) for text in texts]
+    all_tokens = encoding.encode_batch(texts, num_threads=os.cpu_count() or 1)
+
+    truncated = []
+    counts = []
+    for text, tokens in zip(texts, all_tokens, strict=True):
+        if len(tokens) <= max_tokens:
+            truncated.append(text)
+            counts.append(len(tokens))
+            continue
+
+        prefix = encoding.decode(tokens[:max_tokens])
+        cut = _soft_cut(prefix)
+        truncated.append(cut)
+        counts.append(
+            max_tokens if cut is prefix else len(encoding.encode(cut)),
+        )
+
+    return truncated, counts
+
+
+def _soft_cut(prefix: str) -> str:
+    """Trim ``prefix`` back to a natural boundary if one is close enough."""
+    min_length = int(len(prefix) * _SOFT_CUT_MIN_KEEP)
+    for boundary in _SOFT_CUT_BOUNDARIES:
+        position = prefix.rfind(boundary)
+        if position >= min_length:
+            return prefix[: position + len(boundary)].rstrip()
+    return prefix
@@ -1,9 +1,19 @@
 import pandas as pd
 import torch
 import re
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from gliner import GLiNER
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import DBSCAN
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from tqdm import tqdm
+
+# Author strings sent to GLiNER per forward pass
+GLINER_BATCH_SIZE = 64
+
+# Author names compared per sparse similarity product when clustering
+NAME_SIMILARITY_BLOCK_SIZE = 2048
 
 DEFAULT_AUTHOR_HEURISTIC_KEYWORDS = [
     # non-person orgs
@@ -18,11 +28,17 @@ DEFAULT_AUTHOR_HEURISTIC_KEYWORDS = [
     ";", " and ", "/", "with", "by"
 ]
 
+# Author strings recur across articles, so capitalization fixes are memoized
+@lru_cache(maxsize=8192)
 def fix_capitalization(name: str) -> str:
-    return ' '.join([
-        part.capitalize() if part.isupper() else part
-        for part in re.split(r'(\s+)', name)
-    ])
+    return ' '.join(part.capitalize() if part.isupper() else part for part in name.split())
+
+# Keywords are matched against the lowercased string, so capitalized entries
+# never match; '#' is the one delimiter symbol not already a keyword
+_NER_KEYWORD_RE = re.compile('|'.join(map(re.escape, DEFAULT_AUTHOR_HEURISTIC_KEYWORDS + ['#'])))
+
+# Matches strings of at least two words, without splitting them into lists
+_MULTI_WORD_RE = re.compile(r'\S\s+\S')
 
 def should_apply_ner(text: str) -> bool:
     """
@@ -31,60 +47,110 @@ def should_apply_ner(text: str) -> bool:
     if not isinstance(text, str):
         return False
 
-    text_clean = text.lower()
-    keyword_hit = any(kw in text_clean for kw in DEFAULT_AUTHOR_HEURISTIC_KEYWORDS)
-    all_caps = text.isupper()
-    too_short = len(text.strip()) < 5
-    too_long = len(text.strip().split()) > 6
-    contains_symbols = any(sym in text for sym in [';', '/', ' and ', '#'])
+    stripped = text.strip()
+    return (
+        _NER_KEYWORD_RE.search(text.lower()) is not None
+        or text.isupper()
+        or len(stripped) < 5
+        or len(stripped.split()) > 6
+    )
 
-    return keyword_hit or all_caps or too_short or too_long or contains_symbols
+def _ner_mask(autores: pd.Series) -> pd.Series:
+    """
+    Vectorized `should_apply_ner` over a Series of stripped author strings.
+    """
+    return (
+        autores.str.lower().str.contains(_NER_KEYWORD_RE)
+        | autores.str.isupper()
+        | (autores.str.len() < 5)
+        | (autores.str.count(r'\S+') > 6)
+    )
+
+def _predict_persons(model_gliner, texts: list[str], batch_size: int) -> list[list[str]]:
+    """
+    Run GLiNER over `texts` in batches and return the Person names found in each.
+    """
+    results = []
+    batches = range(0, len(texts), batch_size)
+    with torch.inference_mode():
+        for start in tqdm(batches, desc="GLiNER", unit="batch", mininterval=1.0):
+            batch = [fix_capitalization(text) for text in texts[start:start + batch_size]]
+            try:
+                batch_entities = model_gliner.batch_predict_entities(batch, ['Person'])
+            except Exception as e:
+                # Retry one by one so a single bad string does not drop the whole batch
+                print(f"[GLiNER ERROR] Batch starting at {start} failed — {e}")
+                batch_entities = []
+                for text in batch:
+                    try:
+                        batch_entities.append(model_gliner.predict_entities(text, ['Person']))
+                    except Exception as e:
+                        print(f"[GLiNER ERROR] Fallback failed on: {text} — {e}")
+                        batch_entities.append([])
+            results.extend(
+                [fix_capitalization(e["text"]) for e in entities if e["label"] == "Person"]
+                for entities in batch_entities
+            )
+    return results
+
+def _split_authors(autores: pd.Series) -> pd.Series:
+    """
+    Split plain author lists on ';' entirely in pandas.
+    """
+    split_authors = autores.str.split(';').explode().str.strip()
+    return split_authors[split_authors != ''].map(fix_capitalization)
 
-def process_authors(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def process_authors(df: pd.DataFrame, batch_size: int = GLINER_BATCH_SIZE) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     if df.empty:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
     df = df.copy()
     assert 'id_articulo' in df.columns, "df must have 'id_articulo' before running process_authors()"
 
-    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    model_gliner = GLiNER.from_pretrained("urchade/gliner_multi_pii-v1").to(device)
-
-    author_lists = []
-    for i, autor in enumerate(df['autor'], start=1):
-        print(f"processing: {i}/{len(df)}")
-
-        if pd.isna(autor) or autor.strip() == "":
-            author_lists.append([])
-            continue
-
-        autor = str(autor).strip()
-        if should_apply_ner(autor):
-            print(f"NER is applied to: {autor}")
-            try:
-                entities = model_gliner.predict_entities(fix_capitalization(autor), ['Person'])
-                authors = [fix_capitalization(e["text"]) for e in entities if e["label"] == "Person"]
-                print(f"Result: {authors}")
-            except Exception as e:
-                print(f"[GLiNER ERROR] Fallback failed on: {autor} — {e}")
-                authors = []
-        else:
-            authors = [fix_capitalization(name.strip()) for name in autor.split(';') if name.strip()]
-
-        author_lists.append(authors)
-
-    # Explode authors
-    df_autores = df[['id_articulo']].copy()
-    df_autores['autor'] = author_lists
-    df_autores = df_autores.explode('autor').dropna()
-    df_autores = df_autores[df_autores['autor'].str.split().apply(len) > 1]
-
-    # Create unique author mapping
-    unique_authors = pd.DataFrame(df_autores['autor'].unique(), columns=['autor'])
-    unique_authors['id_autor'] = unique_authors.index
-
-    # Article-author relationship
-    relacion_autores = df_autores.merge(unique_authors, on='autor')[['id_articulo', 'id_autor']]
+    autores = df['autor'].where(df['autor'].notna(), '').astype(str).str.strip()
+    non_empty = autores != ''
+    mask = non_empty & _ner_mask(autores)
+
+    # Plain author lists are split in a worker thread while GLiNER loads and
+    # runs on the ambiguous ones, so the CPU work overlaps the model's
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        split_future = executor.submit(_split_authors, autores[non_empty & ~mask])
+
+        # Ambiguous strings: GLiNER, one batched call per `batch_size` rows
+        ner_authors = pd.Series(dtype=object)
+        if mask.any():
+            device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            model_gliner = GLiNER.from_pretrained("urchade/gliner_multi_pii-v1").to(device)
+            model_gliner.eval()
+            if device.type == 'cuda':
+                # Half precision runs on tensor cores; bf16 keeps fp32's exponent
+                # range (no fp16 overflow), so prefer it where supported
+                half_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                model_gliner = model_gliner.to(half_dtype)
+
+            # Bylines repeat across articles, so each distinct string is run once
+            ner_texts = autores[mask]
+            codes, unique_texts = pd.factorize(ner_texts)
+            print(f"NER is applied to {len(ner_texts)}/{len(df)} author strings ({len(unique_texts)} distinct)")
+            persons = _predict_persons(model_gliner, unique_texts.tolist(), batch_size)
+            ner_authors = pd.Series(
+                [persons[code] for code in codes],
+                index=ner_texts.index,
+                dtype=object,
+            ).explode()
+
+        split_authors = split_future.result()
+
+    # Explode authors, keeping row order and the order of names within a row
+    author_names = pd.concat([split_authors, ner_authors]).sort_index(kind='stable').dropna()
+    df_autores = df.loc[author_names.index, ['id_articulo']].copy()
+    df_autores['autor'] = author_names.to_numpy()
+    df_autores = df_autores[df_autores['autor'].str.contains(_MULTI_WORD_RE, na=False)]
+
+    # Article-author relationship; factorize numbers authors by first appearance,
+    # so no merge on the name strings is needed
+    codes, unique_authors = pd.factorize(df_autores['autor'])
+    relacion_autores = pd.DataFrame({'id_articulo': df_autores['id_articulo'].to_numpy(), 'id_autor': codes})
 
     # Keep only valid articles
     valid_articles = relacion_autores['id_articulo'].unique()
@@ -114,23 +180,32 @@ def preprocess_author_strings(df_autores: pd.DataFrame) -> pd.DataFrame:
     else:
         names[2] = split1[1].fillna('').str.strip()
 
-    def normalize_names(row):
-        if pd.notnull(row[1]):
-            base = f"{row[1].strip('.;')} {row[0].strip(';. ')}"
-            return f"{base} {row[2].strip(';.')}" if pd.notnull(row[2]) else base
-        return row[0]
-
-    names[0] = names.apply(normalize_names, axis=1)
+    # "Last, First; Middle" -> "First Last Middle", column-wise
+    base = names[1].str.strip('.;') + ' ' + names[0].str.strip(';. ')
+    full = base.where(names[2].isna(), base + ' ' + names[2].str.strip(';.'))
+    names[0] = full.where(names[1].notna(), names[0])
     names = names.rename(columns={0: 'author_name'})
-    names['author_name'] = names['author_name'].str.replace(r'\s+', ' ', regex=True)
-    names['author_name'] = names['author_name'].str.replace('\t', ' ')
-    names['author_name'] = names['author_name'].str.strip()
+    names['author_name'] = names['author_name'].str.replace(r'\s+', ' ', regex=True).str.strip()
 
     df_autores = df_autores.copy()
     df_autores['author_name'] = names['author_name']
     return df_autores
 
-def cluster_author_names(author_names: pd.Series, threshold: float = 0.85) -> dict:
+def _similarity_graph(tfidf_matrix, threshold: float, block_size: int):
+    """
+    Sparse graph linking names whose cosine similarity reaches the threshold.
+    TF-IDF rows are L2-normalized, so each block product holds cosine scores.
+    """
+    blocks = []
+    for start in range(0, tfidf_matrix.shape[0], block_size):
+        sims = (tfidf_matrix[start:start + block_size] @ tfidf_matrix.T).tocsr()
+        sims.data[sims.data < threshold] = 0
+        sims.eliminate_zeros()
+        blocks.append(sims)
+    return sparse.vstack(blocks, format='csr')
+
+def cluster_author_names(author_names: pd.Series, threshold: float = 0.85,
+                         block_size: int = NAME_SIMILARITY_BLOCK_SIZE) -> dict:
     names = author_names.dropna().unique().tolist()
     if not names:
         return {}
@@ -138,8 +213,10 @@ def cluster_author_names(author_names: pd.Series, threshold: float = 0.85) -> di
     vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 4))
     tfidf_matrix = vectorizer.fit_transform(names)
 
-    db = DBSCAN(eps=1 - threshold, min_samples=1, metric='cosine').fit(tfidf_matrix)
-    labels = db.labels_
+    # Same clusters as DBSCAN(min_samples=1), where every name is a core point,
+    # without materializing the dense pairwise distance matrix
+    graph = _similarity_graph(tfidf_matrix, threshold, block_size)
+    _, labels = connected_components(graph, directed=False)
 
     clusters = {}
     for label, name in zip(labels, names):
@@ -153,23 +230,21 @@ def cluster_author_names(author_names: pd.Series, threshold: float = 0.85) -> di
 
     return canonical_map
 
+# Names containing any of these are organizations, not people
+_JUNK_AUTHOR_RE = re.compile('foundation|team|house|board|reporters')
+
 def filter_invalid_authors(df_authors: pd.DataFrame) -> pd.DataFrame:
-    def is_valid(name):
-        if not isinstance(name, str):
-            return False
-        name = name.strip()
-        if len(name.split()) < 2:
-            return False
-        if name.isupper():
-            return False
-        if re.search(r'[|/#]', name):
-            return False
-        if name.lower() in {'staff', 'editorial', 'press', 'guest'}:
-            return False
-        junk_terms = ['foundation', 'team', 'house', 'board', 'reporters']
-        return not any(kw in name.lower() for kw in junk_terms)
-
-    return df_authors[df_authors['autor'].apply(is_valid)].reset_index(drop=True)
+    # Non-string values strip to NaN and then to '', which fails the word count
+    names = df_authors['autor'].astype(object).str.strip().fillna('')
+    lowered = names.str.lower()
+    valid = (
+        names.str.contains(_MULTI_WORD_RE)
+        & ~names.str.isupper()
+        & ~names.str.contains(r'[|/#]', regex=True)
+        & ~lowered.isin({'staff', 'editorial', 'press', 'guest'})
+        & ~lowered.str.contains(_JUNK_AUTHOR_RE)
+    )
+    return df_authors[valid.to_numpy()].reset_index(drop=True)
 
 def standardize_author_names(df_autores: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     df_autores = preprocess_author_strings(df_autores)
@@ -181,11 +256,15 @@ def standardize_author_names(df_autores: pd.DataFrame) -> tuple[pd.DataFrame, pd
     # Final filter to remove junk
     df_autores = filter_invalid_authors(df_autores)
 
-    unique_authors = df_autores['autor'].dropna().unique()
-    df_clean = pd.DataFrame(unique_authors, columns=['autor'])
-    df_clean['id_autor'] = df_clean.index
+    # Missing names get code -1 and no relationship row
+    codes, unique_authors = pd.factorize(df_autores['autor'])
+    df_clean = pd.DataFrame({'autor': unique_authors, 'id_autor': range(len(unique_authors))})
 
-    relacion_autores = df_autores.merge(df_clean, on='autor')[['id_articulo', 'id_autor']]
+    has_author = codes >= 0
+    relacion_autores = pd.DataFrame({
+        'id_articulo': df_autores['id_articulo'].to_numpy()[has_author],
+        'id_autor': codes[has_author],
+    })
 
     print(f"Final deduplicated authors: {len(df_clean)}")
     return df_clean, relacion_autores
@@ -1,12 +1,22 @@
 import pandas as pd
 
+# Raw columns no later step reads; can be skipped when loading
+UNUSED_COLUMNS = ['resumen', 'seccion', 'lugar_publicacion', 'tipo_documento', 'id_proQuest',
+                  'url', 'copyright', 'ultima_actualizacion', 'anio_publicación',
+                  'pais_publicacion', 'materia_publicacion']
+
+# Rows missing any of these are dropped
+REQUIRED_COLUMNS = ['autor', 'texto_completo', 'publicacion', 'fecha_de_publicacion', 'editorial', 'tipo_fuente', 'idioma']
+
 def clean_data(df: pd.DataFrame) -> pd.DataFrame:
-    df['fecha_de_publicacion'] = pd.to_datetime(df['fecha_de_publicacion'], errors='coerce')
-    df['titulo'] = df['titulo'].fillna('Unknown')
-    df = df.dropna(subset=['autor', 'texto_completo', 'publicacion', 'fecha_de_publicacion', 'editorial', 'tipo_fuente', 'idioma'])
-    df = df[df['idioma'] == 'English']
-    columns_to_drop = ['resumen', 'seccion', 'lugar_publicacion', 'idioma', 'tipo_documento', 'id_proQuest', 
-                        'url', 'copyright', 'ultima_actualizacion', 'anio_publicación', 
-                        'pais_publicacion', 'materia_publicacion']
-    df = df.drop(columns=columns_to_drop, errors='ignore')
+    # One mask for the language filter and the missing-value checks; dates are
+    # parsed afterwards, only for the rows that are kept
+    mask = (df['idioma'] == 'English') & df[REQUIRED_COLUMNS].notna().all(axis=1)
+    df = df[mask]
+    dates = pd.to_datetime(df['fecha_de_publicacion'], errors='coerce')
+    df = df[dates.notna()].assign(
+        fecha_de_publicacion=dates,
+        titulo=lambda d: d['titulo'].fillna('Unknown'),
+    )
+    df = df.drop(columns=UNUSED_COLUMNS + ['idioma'], errors='ignore')
     return df
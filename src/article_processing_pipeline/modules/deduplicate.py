@@ -1,69 +1,193 @@
-import os
+from pathlib import Path
 import pandas as pd
 import numpy as np
+import torch
+from tqdm import tqdm
 from sentence_transformers import SentenceTransformer
-from datasketch import MinHash, MinHashLSH
-import gc
 
-def deduplicate_articles(df: pd.DataFrame, column: str = 'texto_completo') -> pd.DataFrame:
+# Articles per SentenceTransformer forward pass
+ENCODE_BATCH_SIZE = 64
+# Articles encoded per encode() call; bounds the embeddings held in memory
+ENCODE_CHUNK_SIZE = 10_000
+# Articles compared against each other in one matrix product
+SIMILARITY_BLOCK_SIZE = 1024
+# Embeddings of encoded articles, keyed by a hash of their text; one part per
+# encoded chunk, so a crash only loses the chunk in progress
+EMBEDDINGS_CACHE_DIR = Path('./data/interim/embeddings')
+# Row positions of the duplicate articles, reused on reruns
+DUPLICATE_INDICES_PATH = Path('./data/interim/duplicate_indices.npy')
+
+def _start_encode_pool(model):
     """
-    Deduplicates articles using MinHash and LSH on a given text column.
-    If duplicate_indices.csv exists, uses that instead of recalculating.
+    Start one encoding process per GPU when several are available.
+    Returns None on single-GPU and CPU machines, where the model encodes in-process.
     """
-    dir_path = './data/interim/duplicate_indices.csv'
-    if os.path.isfile(dir_path):
-        print("Found duplicate_indices.csv. Using it to remove duplicates.")
-        duplicate_indices = pd.read_csv(dir_path, header=None)[0].tolist()
-        duplicate_indices = list(map(int, duplicate_indices))
-        mask = [i not in duplicate_indices for i in range(len(df))]
-        df_clean = df.iloc[mask].reset_index(drop=True)
-        print(f"Original: {df.shape[0]} articles | Cleaned: {df_clean.shape[0]} articles")
-        return df_clean
+    if torch.cuda.device_count() < 2:
+        return None
+    print(f"Encoding on {torch.cuda.device_count()} GPUs...")
+    return model.start_multi_process_pool()
 
-    print("Loading SentenceTransformer model...")
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+def _iter_embeddings(model, articles: list[str], pool=None):
+    """
+    Yield (indices, L2-normalized float32 embeddings) one chunk of articles at a time.
+    Chunks are split across the processes of `pool` if one is given.
+    If a chunk fails, its articles are encoded one by one and the failing ones skipped.
+    """
+    for start in range(0, len(articles), ENCODE_CHUNK_SIZE):
+        chunk = articles[start:start + ENCODE_CHUNK_SIZE]
+        try:
+            if pool is None:
+                embeddings = model.encode(
+                    chunk, batch_size=ENCODE_BATCH_SIZE, show_progress_bar=True,
+                    convert_to_numpy=True, normalize_embeddings=True
+                )
+            else:
+                embeddings = model.encode_multi_process(
+                    chunk, pool, batch_size=ENCODE_BATCH_SIZE,
+                    show_progress_bar=True, normalize_embeddings=True
+                )
+            indices = list(range(start, start + len(chunk)))
+        except Exception as e:
+            print(f"Error encoding articles {start}-{start + len(chunk) - 1}: {e}")
+            indices, rows = [], []
+            for idx, article in enumerate(chunk, start=start):
+                try:
+                    embedding = model.encode(
+                        [article], show_progress_bar=False, batch_size=1,
+                        convert_to_numpy=True, normalize_embeddings=True
+                    )
+                except Exception as e:
+                    print(f"Error processing article {idx}: {e}")
+                    continue
+                indices.append(idx)
+                rows.append(embedding[0])
+            if not rows:
+                continue
+            embeddings = np.stack(rows)
 
-    num_perm = 64
-    lsh_threshold = 0.9
-    lsh = MinHashLSH(threshold=lsh_threshold, num_perm=num_perm)
+        yield indices, np.asarray(embeddings, dtype=np.float32)
 
-    def create_minhash(embedding):
-        m = MinHash(num_perm=num_perm)
-        for value in embedding:
-            m.update(value.tobytes())
-        return m
+def _load_embedding_cache() -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Load every complete cache part as (text hashes, memory-mapped float16 embeddings).
+    A part's hashes file is written last, so parts without one are ignored.
+    Parts are kept separate, so embeddings are only read when their rows are used.
+    """
+    parts = []
+    for hashes_path in sorted(EMBEDDINGS_CACHE_DIR.glob('part_*_hashes.npy')):
+        part_path = hashes_path.with_name(hashes_path.name.replace('_hashes', ''))
+        if not part_path.is_file():
+            continue
+        part_hashes = np.load(hashes_path)
+        part = np.load(part_path, mmap_mode='r')
+        if len(part_hashes) != len(part):
+            print(f"Ignoring inconsistent embedding cache part: {part_path}")
+            continue
+        parts.append((part_hashes, part))
+    return parts
 
-    articles = df[column].astype(str)
+def _save_embedding_cache_part(hashes: np.ndarray, embeddings: np.ndarray) -> None:
+    """Write one cache part, embeddings first so a part with hashes is always complete."""
+    EMBEDDINGS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    k = len(list(EMBEDDINGS_CACHE_DIR.glob('part_*_hashes.npy')))
+    while (EMBEDDINGS_CACHE_DIR / f'part_{k:05d}.npy').exists():
+        k += 1
+    np.save(EMBEDDINGS_CACHE_DIR / f'part_{k:05d}.npy', embeddings)
+    np.save(EMBEDDINGS_CACHE_DIR / f'part_{k:05d}_hashes.npy', hashes)
+
+def _get_embeddings(articles: list[str]) -> tuple[list[int], np.ndarray, list[np.ndarray]]:
+    """
+    Return (article indices, their (part, row) locations, float16 embedding parts).
+    Cached articles are looked up by text hash; only the others are encoded, and
+    their embeddings are added to the cache. Articles that fail to encode are left out.
+    """
+    hashes = pd.util.hash_pandas_object(pd.Series(articles), index=False).to_numpy()
+    parts, location_of = [], {}
+    for part_hashes, part in _load_embedding_cache():
+        for row, h in enumerate(part_hashes.tolist()):
+            location_of.setdefault(h, (len(parts), row))
+        parts.append(part)
+
+    missing = [i for i, h in enumerate(hashes.tolist()) if h not in location_of]
+    if missing:
+        print(f"Encoding {len(missing)} articles ({len(articles) - len(missing)} cached)...")
+        print("Loading SentenceTransformer model...")
+        model = SentenceTransformer('all-MiniLM-L6-v2')
+        pool = _start_encode_pool(model)
+        try:
+            for positions, embeddings in _iter_embeddings(model, [articles[i] for i in missing], pool):
+                part_hashes = hashes[[missing[p] for p in positions]]
+                part = embeddings.astype(np.float16)
+                _save_embedding_cache_part(part_hashes, part)
+                for row, h in enumerate(part_hashes.tolist()):
+                    location_of.setdefault(h, (len(parts), row))
+                parts.append(part)
+        finally:
+            if pool is not None:
+                model.stop_multi_process_pool(pool)
+    else:
+        print(f"All {len(articles)} article embeddings found in cache.")
+
+    indices, locations = [], []
+    for i, h in enumerate(hashes.tolist()):
+        if h in location_of:
+            indices.append(i)
+            locations.append(location_of[h])
+    return indices, np.array(locations, dtype=np.int64).reshape(-1, 2), parts
+
+def _gather_rows(parts: list[np.ndarray], locations: np.ndarray) -> np.ndarray:
+    """Read the float32 embeddings at `locations` ((part, row) pairs), one part at a time."""
+    block = np.empty((len(locations), parts[0].shape[1]), dtype=np.float32)
+    for p in np.unique(locations[:, 0]):
+        selected = locations[:, 0] == p
+        block[selected] = parts[p][locations[selected, 1]]
+    return block
+
+def deduplicate_articles(df: pd.DataFrame, column: str = 'texto_completo', threshold: float = 0.9) -> pd.DataFrame:
+    """
+    Deduplicates articles by cosine similarity of their embeddings on a given text column.
+    An article is a duplicate if it is at least `threshold` similar to an earlier kept one.
+    If duplicate_indices.npy exists, uses that instead of recalculating.
+    """
+    if DUPLICATE_INDICES_PATH.is_file():
+        print("Found duplicate_indices.npy. Using it to remove duplicates.")
+        mask = np.ones(len(df), dtype=bool)
+        mask[np.load(DUPLICATE_INDICES_PATH)] = False
+        df_clean = df.iloc[mask].reset_index(drop=True)
+        print(f"Original: {df.shape[0]} articles | Cleaned: {df_clean.shape[0]} articles")
+        return df_clean
+
+    articles = df[column].astype(str).tolist()
     unique_indices = []
     duplicate_indices = set()
+    kept_blocks = []  # normalized embeddings of the unique articles so far
 
-    print("Processing articles sequentially...")
-    tot = len(articles)
-    i = 1
-    for idx, article in enumerate(articles):
-        print(f"Processing {i}/{tot}")
-        try:
-            embedding = model.encode([article], show_progress_bar=False, batch_size=1)
-        except Exception as e:
-            print(f"Error processing article {idx}: {e}")
-            continue
+    indices, locations, parts = _get_embeddings(articles)
 
-        embedding = np.array(embedding, dtype=np.float16)[0]
-        mh = create_minhash(embedding)
-        similar = lsh.query(mh)
+    # Progress is redrawn at most once per second, not once per block
+    progress = tqdm(total=len(indices), desc="Comparing", unit="article", mininterval=1.0)
+    for block_start in range(0, len(indices), SIMILARITY_BLOCK_SIZE):
+        block = _gather_rows(parts, locations[block_start:block_start + SIMILARITY_BLOCK_SIZE])
+        block_indices = indices[block_start:block_start + SIMILARITY_BLOCK_SIZE]
 
-        if similar:
-            duplicate_indices.add(idx)
-        else:
-            lsh.insert(idx, mh)
-            unique_indices.append(idx)
+        # Best match of each row among earlier unique articles, then among
+        # the earlier rows of its own block
+        is_duplicate = np.zeros(len(block), dtype=bool)
+        for kept in kept_blocks:
+            is_duplicate |= (block @ kept.T).max(axis=1) >= threshold
+        within_block = block @ block.T
 
-        del embedding, mh
-        if idx % 1000 == 0 and idx > 0:
-            gc.collect()
-        if idx % 10000 == 0 and idx > 0:
-            print(f"Processed {idx} articles...")
-        i += 1
+        new_rows = []
+        for row, idx in enumerate(block_indices):
+            if is_duplicate[row] or (new_rows and within_block[row, new_rows].max() >= threshold):
+                duplicate_indices.add(idx)
+            else:
+                new_rows.append(row)
+                unique_indices.append(idx)
+        if new_rows:
+            kept_blocks.append(block[new_rows])
+        progress.update(len(block_indices))
+    progress.close()
 
     print("Processing completed.")
     print(f"Total articles: {len(articles)}")
@@ -73,8 +197,8 @@ def deduplicate_articles(df: pd.DataFrame, column: str = 'texto_completo') -> pd
     df_clean = df.iloc[unique_indices].reset_index(drop=True)
 
     # Save for future re-use
-    df_clean.to_csv('./data/interim/clean_articles.csv', index=False)
-    pd.Series(unique_indices).to_csv('./data/interim/unique_indices.csv', index=False)
-    pd.Series(list(duplicate_indices)).to_csv('./data/interim/duplicate_indices.csv', index=False)
+    df_clean.to_parquet('./data/interim/clean_articles.parquet', compression='zstd', engine='pyarrow', index=False)
+    np.save('./data/interim/unique_indices.npy', np.array(unique_indices, dtype=np.int32))
+    np.save(DUPLICATE_INDICES_PATH, np.array(sorted(duplicate_indices), dtype=np.int32))
 
     return df_clean
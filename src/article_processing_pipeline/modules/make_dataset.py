@@ -1,8 +1,16 @@
 import pandas as pd
 
-def load_data(path: str) -> pd.DataFrame:
+def load_data(path: str, skip_columns: list | None = None) -> pd.DataFrame:
     try:
-        df = pd.read_csv(path)
+        usecols = None
+        if skip_columns:
+            # Read only the header to pick the columns, so skipped ones are never parsed
+            header = pd.read_csv(path, nrows=0).columns
+            skip = set(skip_columns)
+            usecols = [col for col in header if col not in skip]
+        # The C engine handles newlines inside quoted fields (paragraph breaks
+        # in texto_completo); engine='pyarrow' fails on them past one block
+        df = pd.read_csv(path, usecols=usecols)
         print("Data loaded successfully.")
         print(len(df))
         return df
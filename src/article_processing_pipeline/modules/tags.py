@@ -12,34 +12,37 @@ def extract_tags(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataF
 
     # Step 1: Extract tag fields and fill missing values
     tag_cols = ['materia', 'lugar_articulo', 'personas', 'empresa']
-    df_tags = df[['id_articulo'] + tag_cols].copy()
+    df_tags = df[['id_articulo'] + tag_cols].reset_index(drop=True)
     df_tags = df_tags.fillna('').astype(str)
     df_tags['empresa'] = df_tags['empresa'].str.replace('Nombre: ', '', regex=False)
 
-    # Step 2: Combine into one "tags" column
-    df_tags['tags'] = df_tags['materia'] + ';' + df_tags['lugar_articulo'] + ';' + df_tags['personas'] + ';' + df_tags['empresa']
+    # Step 2: Stack the tag fields into one column, without concatenating them
+    # first; the stable sort restores per-article order so tag IDs follow
+    # first appearance as before
+    df_tags = df_tags.melt(id_vars='id_articulo', value_vars=tag_cols, value_name='tags', ignore_index=False)
+    df_tags = df_tags.sort_index(kind='stable')[['id_articulo', 'tags']]
     df_tags['tags'] = df_tags['tags'].str.split(';')
 
     # Step 3: Explode
     df_tags = df_tags.explode('tags').reset_index(drop=True)
     df_tags['tags'] = df_tags['tags'].str.strip()
-    df_tags = df_tags[df_tags['tags'].notna() & (df_tags['tags'] != '') & (df_tags['tags'].str.lower() != 'nan')]
+    df_tags = df_tags[df_tags['tags'].ne('') & df_tags['tags'].str.lower().ne('nan')]
 
     if df_tags.empty:
         print("⚠️ No tags found. Returning empty results.")
         empty_df = pd.DataFrame(columns=df.columns)
         return empty_df, pd.DataFrame(columns=['id_tags', 'tags']), pd.DataFrame(columns=['id_articulo', 'id_tags'])
 
-    # Step 4: Create unique tag table
-    tag_df = pd.DataFrame(df_tags['tags'].unique(), columns=['tags']).reset_index()
-    tag_df.rename(columns={'index': 'id_tags'}, inplace=True)
+    # Step 4: Create unique tag table; factorize numbers tags by first
+    # appearance in one pass, replacing unique() plus a merge on the strings
+    codes, uniques = pd.factorize(df_tags['tags'])
+    tag_df = pd.DataFrame({'id_tags': range(len(uniques)), 'tags': uniques})
 
-    # Step 5: Merge and create relationship
-    df_tags = df_tags.merge(tag_df, on='tags', how='left')
-    if 'id_tags' not in df_tags.columns:
-        raise ValueError("id_tags not created during merge. Check tag format.")
-
-    relacion_tags = df_tags[['id_articulo', 'id_tags']].dropna().astype({'id_articulo': int, 'id_tags': int})
+    # Step 5: Create relationship
+    relacion_tags = pd.DataFrame({
+        'id_articulo': df_tags['id_articulo'].astype(int).to_numpy(),
+        'id_tags': codes.astype(int),
+    })
 
     # Step 6: Filter articles to those with valid tags
     df_filtered = df[df['id_articulo'].isin(relacion_tags['id_articulo'])].reset_index(drop=True)
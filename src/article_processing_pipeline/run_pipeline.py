@@ -4,7 +4,7 @@ import pandas as pd
 from pathlib import Path
 
 from src.data.make_dataset import load_data
-from src.data.clean_dataset import clean_data
+from src.data.clean_dataset import UNUSED_COLUMNS, clean_data
 from src.data.authors import process_authors, standardize_author_names
 from src.data.deduplicate import deduplicate_articles
 from src.data.tags import extract_tags
@@ -19,7 +19,7 @@ def main():
 
     # Step 1: Load data
     print("Loading raw data...")
-    df_raw = load_data(RAW_DATA_PATH)
+    df_raw = load_data(RAW_DATA_PATH, skip_columns=UNUSED_COLUMNS)
 
     # Step 2: Basic column cleanup and filtering
     print("Cleaning dataset...")
@@ -36,7 +36,7 @@ def main():
     print("Standardizing author identities...")
     df_autores_final, rel_autores_final = standardize_author_names(df_autores_raw)
 
-    # Step 5: Deduplicate articles using MinHash / LSH
+    # Step 5: Deduplicate articles by embedding cosine similarity
     print("Deduplicating articles...")
     df_deduped = deduplicate_articles(df_clean, column='texto_completo')
 
@@ -48,11 +48,15 @@ def main():
 
     # Step 7: Save outputs
     print("Saving processed datasets...")
-    df_tagged.to_csv(PROCESSED_PATH / "articles.csv", index=False)
-    df_autores_final.to_csv(PROCESSED_PATH / "authors.csv", index=False)
-    rel_autores_final.to_csv(PROCESSED_PATH / "rel_authors.csv", index=False)
-    tag_df.to_csv(PROCESSED_PATH / "tags.csv", index=False)
-    rel_tags.to_csv(PROCESSED_PATH / "rel_tags.csv", index=False)
+    outputs = {
+        "articles": df_tagged,
+        "authors": df_autores_final,
+        "rel_authors": rel_autores_final,
+        "tags": tag_df,
+        "rel_tags": rel_tags,
+    }
+    for name, table in outputs.items():
+        table.to_parquet(PROCESSED_PATH / f"{name}.parquet", compression="zstd", engine="pyarrow", index=False)
 
     print("✅ Pipeline finished successfully.")
 
@@ -22,6 +22,7 @@ class wikipediaSettings(BaseModel):
     timeout: int
     response_code: int
     language: str
+    concurrency: int = 16  # Wikipedia requests in flight at once
 
 
 class scrapingConfig(BaseModel):
@@ -51,6 +52,7 @@ class extractionFile(BaseModel):
 class extractionPaths(BaseModel):
     prompt_path: str
     results_path: str
+    cache_dir: str | None = None  # LLM response cache; None disables it
     
 class extractionConfig(BaseModel):
     paths: extractionPaths
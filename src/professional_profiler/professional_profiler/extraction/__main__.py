@@ -2,19 +2,23 @@ from professional_profiler.logging.logger import get_logger, setup_logging
 import sys
 import pandas as pd
 from professional_profiler.config import load_app_config
-from professional_profiler.extraction.llm import extract_degrees_async
+from professional_profiler.extraction.llm import extract_degrees_batch
 import asyncio
 import json
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    orjson = None
+
 setup_logging()
 logger = get_logger(__name__)
 config = load_app_config()
 
 
 async def process_degrees(df):
-    df["degrees"] = await asyncio.gather(
-        *(extract_degrees_async(sentence) for sentence in df["sentences"])
-    )
+    df["degrees"] = await extract_degrees_batch(df["sentences"].tolist())
     return df
 
 def parse_output(degrees, id, author_name):
@@ -23,7 +27,7 @@ def parse_output(degrees, id, author_name):
         "author_name":  author_name,
         "degrees":      []
     }
-    for degree in degrees.output.studies:
+    for degree in degrees.studies:
         out["degrees"].append({
             "degree_type":  degree.degree_type,
             "degree_field": degree.degree_field
@@ -31,6 +35,13 @@ def parse_output(degrees, id, author_name):
     return out
 
 
+def dump_record(record) -> bytes:
+    """Serialize one parsed record as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
 def main():
     logger.info("Starting extraction")
     logger.debug("Configuration loaded: %s", config)
@@ -47,14 +58,9 @@ def main():
 
     output_path = config.extraction.paths.results_path + config.extraction.file.file_name
 
-    with open(output_path, "w", encoding="utf-8") as fp:
-        fp.write("[\n")
-        for i, record in enumerate(parsed_list):
-            # dump each record and add a comma except after the last one
-            fp.write(json.dumps(record, ensure_ascii=False))
-            if i < len(parsed_list) - 1:
-                fp.write(",\n")
-        fp.write("\n]")
+    # One record per line, written as a single JSON array
+    with open(output_path, "wb") as fp:
+        fp.write(b"[\n" + b",\n".join(map(dump_record, parsed_list)) + b"\n]")
 
 if __name__ == "__main__":
     try:
@@ -1,12 +1,19 @@
+from pydantic import ValidationError
 from .pydantic_class import AuthorDegrees
 from pydantic_ai.providers.deepseek import DeepSeekProvider
 from pydantic_ai.models.openai import OpenAIModel
 from pydantic_ai.models.gemini import GeminiModel
 from pydantic_ai.providers.google_vertex import GoogleVertexProvider
+from pydantic_ai.providers.google_gla import GoogleGLAProvider
 
 from pydantic_ai import Agent
+import httpx
 from httpx import AsyncClient
+import asyncio
+import functools
+import hashlib
 import os
+from pathlib import Path
 import dotenv
 import json
 from professional_profiler.config import load_app_config
@@ -21,54 +28,25 @@ config = load_app_config()
 # Global accumulator for total cost across calls
 total_cost_accumulator = 0.0
 
-async def extract_degrees_async(sentences: str) -> AuthorDegrees:
-    # Read and prepare prompt
-    with open(config.extraction.paths.prompt_path, encoding="utf-8") as f:
-        prompt = f.read()
-    prompt += f"\n{sentences}"
-
-    # Prepare hook to capture usage from DeepSeek response
-    token_usage = {"input": 0, "output": 0}
-    async def capture_usage(response):
-        try:
-            # Ensure full body is loaded
-            raw = await response.aread()
-            data = json.loads(raw)
-            usage = data.get("usage", {})
-            token_usage["input"] = usage.get("input_tokens", 0)
-            token_usage["output"] = usage.get("output_tokens", 0)
-        except Exception as e:
-            logger.warning("Failed to parse usage: %s", e)
-
-        
-        # Create custom HTTP client with response hook
-    custom_http_client = AsyncClient(
-        timeout=30,
-        event_hooks={"response": [capture_usage]}
-    )
+# LLM requests in flight at once during a batch
+DEFAULT_CONCURRENCY = 32
+
+# A structured-output call can take minutes; only connecting should fail fast
+REQUEST_TIMEOUT = httpx.Timeout(600, connect=5)
+
+# Model the extraction agent runs on; part of the response cache key
+MODEL_NAME = "gemini-2.5-flash-preview-04-17"
 
-    # Initialize DeepSeek model via pydantic_ai
-    deepseek_model = OpenAIModel(
-        'deepseek-chat',
-        provider=DeepSeekProvider(
-            api_key=os.getenv("DEEPSEEK_API_KEY"),
-            http_client=custom_http_client
-        ),
-    )
-    
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    gemini_model = GeminiModel(
-        model_name="gemini-2.5-flash-preview-04-17",
-        provider="google-gla",     
-    )
-    agent = Agent(gemini_model, output_type=AuthorDegrees, max_result_retries=3)
 
-    # Run the agent and await the result
-    result: AuthorDegrees = await agent.run(prompt)
+@functools.cache
+def load_prompt() -> str:
+    """Read the extraction prompt once per process."""
+    with open(config.extraction.paths.prompt_path, encoding="utf-8") as f:
+        return f.read()
+
 
-    # Compute cost based on DeepSeek pricing (standard)
-    input_tokens = token_usage.get("input", 0)
-    output_tokens = token_usage.get("output", 0)
+def record_usage(input_tokens: int, output_tokens: int) -> None:
+    """Add one response's token usage to the running cost (DeepSeek pricing)."""
     cost_input = (input_tokens / 1_000_000) * 0.07
     cost_output = (output_tokens / 1_000_000) * 1.10
     query_cost = cost_input + cost_output
@@ -86,4 +64,101 @@ async def extract_degrees_async(sentences: str) -> AuthorDegrees:
     total_cost_accumulator += query_cost
     logger.debug("Total cost so far: $%.6f", total_cost_accumulator)
 
-    return result
+
+async def capture_usage(response):
+    """httpx response hook recording the token usage of each LLM response."""
+    try:
+        # Ensure full body is loaded
+        raw = await response.aread()
+        data = json.loads(raw)
+        usage = data.get("usage", {})
+        record_usage(usage.get("input_tokens", 0), usage.get("output_tokens", 0))
+    except Exception as e:
+        logger.warning("Failed to parse usage: %s", e)
+
+
+def cache_path(prompt: str) -> Path | None:
+    """Cache file for a full prompt, or None when caching is disabled."""
+    if not config.extraction.paths.cache_dir:
+        return None
+    key = hashlib.blake2b(f"{MODEL_NAME}\n{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+    return Path(config.extraction.paths.cache_dir) / f"{key}.json"
+
+
+def load_cached(path: Path | None) -> AuthorDegrees | None:
+    """Return the cached extraction at `path`, or None on a miss."""
+    if path is None or not path.is_file():
+        return None
+    try:
+        return AuthorDegrees.model_validate_json(path.read_text(encoding="utf-8"))
+    except ValidationError as e:
+        logger.warning("Ignoring invalid cache entry %s: %s", path, e)
+        return None
+
+
+def store_cached(path: Path | None, degrees: AuthorDegrees) -> None:
+    """Write an extraction to the cache; the rename keeps entries complete."""
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(degrees.model_dump_json(), encoding="utf-8")
+    tmp.replace(path)
+
+
+def build_agent(http_client: AsyncClient) -> Agent:
+    """Create the extraction agent; every model shares `http_client`."""
+    # Initialize DeepSeek model via pydantic_ai
+    deepseek_model = OpenAIModel(
+        'deepseek-chat',
+        provider=DeepSeekProvider(
+            api_key=os.getenv("DEEPSEEK_API_KEY"),
+            http_client=http_client
+        ),
+    )
+
+    gemini_model = GeminiModel(
+        model_name=MODEL_NAME,
+        provider=GoogleGLAProvider(
+            api_key=os.getenv("GEMINI_API_KEY"),
+            http_client=http_client
+        ),
+    )
+    return Agent(gemini_model, output_type=AuthorDegrees, max_result_retries=3)
+
+
+async def extract_degrees_batch(sentences_list, concurrency: int = DEFAULT_CONCURRENCY) -> list[AuthorDegrees]:
+    """
+    Run the extraction over every sentence blob, `concurrency` requests at a time.
+    One HTTP client and agent are shared by all requests; results keep input order.
+    Cached responses are returned without calling the LLM, and repeated blobs
+    are sent only once.
+    """
+    prompt = load_prompt()
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency)
+    async with AsyncClient(timeout=REQUEST_TIMEOUT, limits=limits, event_hooks={"response": [capture_usage]}) as http_client:
+        agent = build_agent(http_client)
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(sentences: str) -> AuthorDegrees:
+            full_prompt = f"{prompt}\n{sentences}"
+            path = cache_path(full_prompt)
+            cached = load_cached(path)
+            if cached is not None:
+                return cached
+            async with sem:
+                result = await agent.run(full_prompt)
+            store_cached(path, result.output)
+            return result.output
+
+        # Identical blobs would all miss the cache concurrently; run each once
+        unique = list(dict.fromkeys(sentences_list))
+        results = await asyncio.gather(*(one(s) for s in unique))
+        by_blob = dict(zip(unique, results))
+        return [by_blob[s] for s in sentences_list]
+
+
+async def extract_degrees_async(sentences: str) -> AuthorDegrees:
+    """Run the extraction for a single sentence blob."""
+    results = await extract_degrees_batch([sentences], concurrency=1)
+    return results[0]
@@ -13,6 +13,7 @@ file located in the "config" directory relative to
 :type config_path: str | Path
 """
 import logging.config
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import yaml
 
@@ -32,3 +33,23 @@ def setup_logging(config_path: str | Path = _LOG_YAML) -> None:
 
 def get_logger(name: str = None):
     return logging.getLogger(name or __name__)
+
+
+def start_queue_listener(queue) -> QueueListener:
+    """
+    Hand records that worker processes put on `queue` to this process's
+    root handlers, so only one process ever writes (and rotates) the log file.
+    """
+    root = logging.getLogger()
+    listener = QueueListener(queue, *root.handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def log_to_queue(queue) -> None:
+    """Route this worker's records to `queue` instead of the inherited handlers."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        # removed, not closed: the parent still owns these files
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(queue))
@@ -1,14 +1,32 @@
 import sys
+from multiprocessing import Pool, Queue, cpu_count
 import pandas as pd
-from professional_profiler.logging.logger import get_logger, setup_logging
+from professional_profiler.logging.logger import (
+    get_logger,
+    log_to_queue,
+    setup_logging,
+    start_queue_listener,
+)
 from professional_profiler.config import load_app_config
-from professional_profiler.parsing.extractors import extract_degrees_markdown
+from professional_profiler.parsing.extractors import extract_degrees_markdown, warm_up
 
 # Initialize first thing in main
 setup_logging()
 logger = get_logger(__name__)
 config = load_app_config()
 
+# Scraped pages read, parsed and written per batch
+CHUNK_ROWS = 256
+
+
+# ===== FUNCTIONS =====
+
+
+def init_worker(log_queue: Queue) -> None:
+    """Pool initializer: log through the parent and load the parsing resources."""
+    log_to_queue(log_queue)
+    warm_up()
+
 
 # ===== MAIN =====
 
@@ -20,14 +38,33 @@ def main():
     # Load the dataset
     dataset_path = config.scraping.paths.processed_data + config.scraping.file.name
 
-    db = pd.read_csv(dataset_path)
-    logger.info("Loading HTML from DataFrame")
-    db["sentences"] = db["source"].apply(extract_degrees_markdown)
-    # Save the results just the id, name and sentences
-    db = db[["id", "author_name", "sentences"]]
-    # Save the results to a CSV file
     output_path = config.parsing.paths.results_path + config.parsing.file.file_name
-    db.to_csv(output_path, index=False)
+    logger.info("Loading HTML from DataFrame")
+    # Each page is parsed independently and parsing is CPU-bound, so spread
+    # the rows over one worker per core; a few chunks per worker keep them busy
+    n_workers = cpu_count()
+    chunksize = max(1, CHUNK_ROWS // (n_workers * 4))
+    # Load patterns and Punkt before forking so workers inherit them; with the
+    # spawn start method the initializer loads them once per worker instead
+    warm_up()
+    # Workers send their records to the parent, which alone writes the
+    # rotating log file; several processes rotating one file lose records
+    log_queue = Queue()
+    listener = start_queue_listener(log_queue)
+    try:
+        with Pool(n_workers, initializer=init_worker, initargs=(log_queue,)) as pool:
+            # Only CHUNK_ROWS pages of HTML are in memory at a time; each chunk's
+            # results are appended to the output before the next one is read
+            with pd.read_csv(
+                dataset_path, usecols=["id", "author_name", "source"], chunksize=CHUNK_ROWS
+            ) as chunks:
+                for n, chunk in enumerate(chunks):
+                    sentences = pool.map(extract_degrees_markdown, chunk["source"].tolist(), chunksize=chunksize)
+                    # Save the results just the id, name and sentences
+                    db = chunk[["id", "author_name"]].assign(sentences=sentences)
+                    db.to_csv(output_path, index=False, mode="w" if n == 0 else "a", header=n == 0)
+    finally:
+        listener.stop()
     logger.info("Parsing completed successfully")
 
 
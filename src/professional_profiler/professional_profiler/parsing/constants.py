@@ -1,24 +1,103 @@
+import functools
 import re
 from professional_profiler.config import load_app_config
+from professional_profiler.logging.logger import get_logger
 import textwrap
 
-config = load_app_config()
+try:
+    import re2
+except ImportError:
+    # Fall back to the stdlib engine when google-re2 is not installed
+    re2 = None
 
-# load & strip regex patterns
-with open(config.parsing.paths.degree_re_path, encoding="utf-8") as f:
-    raw = f.read()
+logger = get_logger(__name__)
 
-pattern_src = textwrap.dedent(raw).strip()
 
-# 2) compile under VERBOSE so comments and line-breaks work
-DEGREE_PATTERN = re.compile(pattern_src, re.IGNORECASE | re.VERBOSE)
+def strip_verbose(pattern: str) -> str:
+    """Drop VERBOSE-mode whitespace and comments, which RE2 does not support."""
+    out = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            # Escapes, including escaped whitespace and '#', are kept verbatim
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if c == "]":
+                in_class = False
+        elif c == "[":
+            in_class = True
+            # A ']' right after '[' or '[^' is a literal, not the end of the class
+            j = i + 1
+            if j < len(pattern) and pattern[j] == "^":
+                j += 1
+            if j < len(pattern) and pattern[j] == "]":
+                j += 1
+            out.append(pattern[i:j])
+            i = j
+            continue
+        elif c.isspace():
+            i += 1
+            continue
+        elif c == "#":
+            end = pattern.find("\n", i)
+            i = len(pattern) if end == -1 else end
+            continue
+        out.append(c)
+        i += 1
+    return "".join(out)
 
-with open(config.parsing.paths.degree_loose_re_path, encoding="utf-8") as f:
-    loose = textwrap.dedent(f.read()).strip()
 
-LOOSE_DEGREE_RE = re.compile(loose, re.IGNORECASE | re.VERBOSE)
+def compile_pattern(src: str):
+    """
+    Compile a case-insensitive VERBOSE pattern with RE2's linear-time engine,
+    or with `re` if RE2 is missing or the pattern needs features it lacks
+    (lookaround, backreferences).
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        try:
+            return re2.compile(strip_verbose(src), options)
+        except re2.error as e:
+            logger.warning("Pattern not supported by RE2, using re: %s", e)
+    return re.compile(src, re.IGNORECASE | re.VERBOSE)
 
 
-# load blacklist as a set of lines
-with open(config.parsing.paths.blacklist_path, "r", encoding="utf-8") as f:
-    BLACKLIST_SECTIONS = {line.strip() for line in f if line.strip()}
+def _read_pattern(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return textwrap.dedent(f.read()).strip()
+
+
+@functools.cache
+def load_patterns() -> dict:
+    """
+    Read and compile the parsing patterns and the section blacklist once per
+    process. Call it before forking workers so they inherit the compiled
+    objects instead of building their own.
+    """
+    paths = load_app_config().parsing.paths
+    # load blacklist as a set of lines
+    with open(paths.blacklist_path, "r", encoding="utf-8") as f:
+        blacklist = {line.strip() for line in f if line.strip()}
+    return {
+        # compiled under VERBOSE semantics so comments and line-breaks work
+        "DEGREE_PATTERN": compile_pattern(_read_pattern(paths.degree_re_path)),
+        "LOOSE_DEGREE_RE": compile_pattern(_read_pattern(paths.degree_loose_re_path)),
+        "BLACKLIST_SECTIONS": blacklist,
+    }
+
+
+def __getattr__(name: str):
+    # DEGREE_PATTERN, LOOSE_DEGREE_RE and BLACKLIST_SECTIONS are loaded on
+    # first access (PEP 562), so importing this module reads no files
+    patterns = load_patterns()
+    if name not in patterns:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # later lookups hit the module globals directly
+    globals().update(patterns)
+    return patterns[name]
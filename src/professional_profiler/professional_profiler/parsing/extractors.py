@@ -1,47 +1,102 @@
-from bs4 import BeautifulSoup, Tag, NavigableString
-from nltk.tokenize import sent_tokenize
-import re
+from bs4 import BeautifulSoup, FeatureNotFound, Tag, NavigableString
+from nltk.tokenize import PunktTokenizer
+import functools
 from .utils import is_html
-from .constants import DEGREE_PATTERN, LOOSE_DEGREE_RE, BLACKLIST_SECTIONS
+from . import constants
 from .formatter import degrees_to_markdown
 from professional_profiler.logging.logger import get_logger, setup_logging
 
 setup_logging()
 logger = get_logger(__name__)
 
+# Heading tag names; find() takes the tuple, sibling checks use the set
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+_HEADING_SET = frozenset(HEADING_TAGS)
+
+# Site-wide elements dropped before extracting sections
+JUNK_SELECTOR = ", ".join([
+    "style", "script", "table.navbox", "sup.reference", "span.mw-cite-backlink",
+    "ol.references", "div.reflist", "div.hatnote", "div#toc",
+])
+
+
+@functools.cache
+def sentence_tokenizer() -> PunktTokenizer:
+    """Load the English Punkt model once per process."""
+    return PunktTokenizer("english")
+
+
+def warm_up() -> None:
+    """Load the patterns and Punkt model up front, e.g. as a Pool initializer."""
+    constants.load_patterns()
+    sentence_tokenizer()
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """Parse with the C-based lxml parser, falling back to html5lib if it is missing or fails."""
+    try:
+        return BeautifulSoup(html, "lxml")
+    except FeatureNotFound:
+        logger.debug("lxml is not installed, parsing with html5lib.")
+    except Exception as e:
+        logger.warning(f"lxml failed to parse page, retrying with html5lib: {e}")
+    return BeautifulSoup(html, "html5lib")
+
+
+class _TextParagraph:
+    """Plain-text stand-in for a <p> tag; supports the get_text calls sections get."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self.text.strip() if strip else self.text
+
+
+def _section(title: str, paragraphs: list[Tag]) -> dict:
+    # paragraph text is extracted once here; every later scan reads "texts"
+    return {
+        "title": title,
+        "paragraphs": paragraphs,
+        "texts": [p.get_text(" ", strip=True) for p in paragraphs],
+    }
+
 
 def extract_all_sections(html: str) -> list[dict]:
-    soup = BeautifulSoup(html, "html5lib")
-    # strip site-wide junk
-    for sel in ["style", "script", "table.navbox", "sup.reference", "span.mw-cite-backlink", "ol.references", "div.reflist", "div.hatnote", "div#toc"]:
-        for el in soup.select(sel):
+    soup = make_soup(html)
+    # strip site-wide junk in a single tree walk; an element inside an already
+    # removed one is decomposed along with it
+    for el in soup.select(JUNK_SELECTOR):
+        if not el.decomposed:
             el.decompose()
 
     body = soup.select_one("div.mw-parser-output") or soup
     sections = []
     # Lead paragraph(s)
     lead_pars = []
-    first_h = body.find(re.compile(r"^h[1-6]$"))
+    first_h = body.find(HEADING_TAGS)
     for sib in body.children:
         if sib is first_h:
             break
         if isinstance(sib, Tag) and sib.name == 'p':
             lead_pars.append(sib)
     if lead_pars:
-        sections.append({"title":"_lead_", "paragraphs":lead_pars})
+        sections.append(_section("_lead_", lead_pars))
 
     # Heading-based sections
-    for h in body.find_all(re.compile(r"^h[1-6]$")):
+    for h in body.find_all(HEADING_TAGS):
         title = h.get_text(strip=True)
-        if title in BLACKLIST_SECTIONS: continue
+        if title in constants.BLACKLIST_SECTIONS: continue
         paras = []
         for sib in h.next_siblings:
-            if isinstance(sib, Tag) and re.fullmatch(r"h[1-6]", sib.name):
+            if isinstance(sib, Tag) and sib.name in _HEADING_SET:
                 break
             if isinstance(sib, Tag) and sib.name=='p':
                 paras.append(sib)
         if paras:
-            sections.append({"title":title, "paragraphs":paras})
+            sections.append(_section(title, paras))
 
 
     # Infobox education as a pseudo-section
@@ -54,15 +109,9 @@ def extract_all_sections(html: str) -> list[dict]:
             if hdr and cell and ("education" in hdr.get_text(" ", strip=True).lower() or "alma mater" in hdr.get_text(" ", strip=True).lower()):
                 edu_texts.append(cell.get_text(" ", strip=True))
         if edu_texts:
-            paras = []
-            for txt in "; ".join(edu_texts).split("; "):
-                # create a <p> tag so it matches your other sections
-                bs = BeautifulSoup(f"<p>{txt}</p>", "html5lib")
-                paras.append(bs.find("p"))
-            sections.append({
-            "title": "_infobox_education_",
-            "paragraphs": paras
-    })
+            # wrap each entry so it reads like the <p> tags of other sections
+            paras = [_TextParagraph(txt) for txt in "; ".join(edu_texts).split("; ")]
+            sections.append(_section("_infobox_education_", paras))
     return sections
 
 
@@ -72,7 +121,7 @@ def extract_section_text(tag: Tag) -> str:
     level = int(tag.name[1])
     texts = []
     for sib in tag.next_siblings:
-        if isinstance(sib, Tag) and re.fullmatch(r"h[1-6]", sib.name):
+        if isinstance(sib, Tag) and sib.name in _HEADING_SET:
             if int(sib.name[1]) <= level:
                 break
         if isinstance(sib, Tag) and sib.name == "p":
@@ -87,21 +136,25 @@ def extract_section_text(tag: Tag) -> str:
 
 def parse_degree_paragraphs(sections: list[dict]) -> dict[str, list[str]]:
     out = {}
+    search = constants.DEGREE_PATTERN.search
     for sec in sections:
-        for p in sec["paragraphs"]:
-            txt = p.get_text(" ", strip=True)
-            if DEGREE_PATTERN.search(txt):
-                out.setdefault(sec["title"], []).append(txt)
+        hits = [txt for txt in sec["texts"] if search(txt)]
+        if hits:
+            out.setdefault(sec["title"], []).extend(hits)
     return out
 
-def extract_every_degree_sentence(html: str) -> list[str]:
-    sections = extract_all_sections(html)
+def extract_every_degree_sentence(html: str, sections: list[dict] | None = None) -> list[str]:
+    # Callers that already extracted the sections pass them to skip re-parsing
+    if sections is None:
+        sections = extract_all_sections(html)
     hits = []
 
     for sec in sections:
         # pick the text from either content or paragraphs
         if "content" in sec:
             text = sec["content"]
+        elif "texts" in sec:
+            text = " ".join(sec["texts"])
         elif "paragraphs" in sec:
             text = " ".join(
                 p.get_text(" ", strip=True) for p in sec["paragraphs"]
@@ -110,8 +163,11 @@ def extract_every_degree_sentence(html: str) -> list[str]:
             # nothing to scan
             continue
 
-        for sent in sent_tokenize(text):
-            if LOOSE_DEGREE_RE.search(sent):
+        # Most sections mention no degree at all; only split the ones that do
+        if not constants.LOOSE_DEGREE_RE.search(text):
+            continue
+        for sent in sentence_tokenizer().tokenize(text):
+            if constants.LOOSE_DEGREE_RE.search(sent):
                 hits.append(sent.strip())
 
     # dedupe while preserving order
@@ -131,8 +187,7 @@ def extract_degrees_markdown(html: str) -> str:
 
     # fallback
     logger.warning("No structured degree mentions found, falling back to loose mentions.")
-    fallback = extract_every_degree_sentence(html)
-    md = "## Degree Mentions"
-    for s in fallback:
-        md += f"\n- {s}"
-    return md
+    fallback = extract_every_degree_sentence(html, sections)
+    parts = ["## Degree Mentions"]
+    parts.extend(f"- {s}" for s in fallback)
+    return "\n".join(parts)
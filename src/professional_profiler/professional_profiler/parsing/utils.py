@@ -1,5 +1,11 @@
 import re
 
 
+# Any opening tag; compiled once instead of looked up in re's cache per call
+_HTML_RE = re.compile(r"<[a-zA-Z][^>]*>")
+# HTML shows a tag within its first few KB; no need to scan whole pages
+HTML_SNIFF_CHARS = 4096
+
+
 def is_html(text: str) -> bool:
-    return bool(re.search(r"<[a-zA-Z][^>]*>", text))
+    return _HTML_RE.search(text, 0, HTML_SNIFF_CHARS) is not None
@@ -1,9 +1,17 @@
 # ===== IMPORTS =====
 
+import asyncio
+import csv
+import os
 import sys
+import httpx
 from professional_profiler.logging.logger import setup_logging, get_logger
 from professional_profiler.config import load_app_config
-from professional_profiler.scraping.wikipedia_search import get_wikipedia, search_html
+from professional_profiler.scraping.wikipedia_search import (
+    RateLimiter,
+    get_wikipedia_async,
+    search_html_async,
+)
 import pandas as pd
 
 setup_logging()
@@ -28,32 +36,55 @@ def load_subject_list(path: str) -> list[str]:
         return []
 
 
-def fetch_wikipedia(subject):
-    logger.debug("Processing subject: %s", subject)
+async def scrape_subjects(names: list[str]):
+    """Search and fetch every subject concurrently, yielding (position, key, source) as each finishes."""
     wiki_conf = conf.scraping.wikipedia
-    result = get_wikipedia(
-        subject,
+    options = dict(
         lang=wiki_conf.language,
         retry=wiki_conf.max_retries,
         timeout=wiki_conf.timeout,
         rc=wiki_conf.response_code,
     )
-    logger.info("Result for %s: %s", subject, result)
-    return result
+    # searches and page fetches share one budget of rate_limit requests per minute
+    limiter = RateLimiter(wiki_conf.rate_limit)
+    limits = httpx.Limits(
+        max_connections=wiki_conf.concurrency, max_keepalive_connections=wiki_conf.concurrency
+    )
+    # requests followed redirects (e.g. title normalisation); httpx does not by default
+    async with httpx.AsyncClient(limits=limits, follow_redirects=True) as client:
+        sem = asyncio.Semaphore(wiki_conf.concurrency)
 
+        async def one(i: int, name: str) -> tuple[int, str, str]:
+            async with sem:
+                key = await get_wikipedia_async(client, limiter, name, **options)
+                logger.info("Result for %s: %s", name, key)
+                source = await search_html_async(client, limiter, key, **options)
+                logger.info("Result for %s: %s", key, source[1:10])
+            return i, key, source
 
-def fetch_source(key):
-    logger.debug("fetching key: %s", key)
-    wiki_conf = conf.scraping.wikipedia
-    result = search_html(
-        key,
-        lang=wiki_conf.language,
-        retry=wiki_conf.max_retries,
-        timeout=wiki_conf.timeout,
-        rc=wiki_conf.response_code,
-    )
-    logger.info("Result for %s: %s", key, result[1:10])
-    return result
+        for done in asyncio.as_completed([one(i, name) for i, name in enumerate(names)]):
+            yield await done
+
+
+async def save_results(subjects: pd.DataFrame, path: str) -> None:
+    """
+    Write each subject with its key and HTML as soon as it and every row before
+    it are scraped, so the pages are never all held in memory.
+    """
+    names = subjects[conf.scraping.file.name_column].tolist()
+    # blank out missing values the way DataFrame.to_csv does
+    rows = subjects.astype(object).where(subjects.notna(), "").values.tolist()
+    pending = {}
+    next_row = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow([*subjects.columns, "key", "source"])
+        async for i, key, source in scrape_subjects(names):
+            pending[i] = (key, source)
+            # rows finishing early wait here so the file keeps the input order
+            while next_row in pending:
+                writer.writerow([*rows[next_row], *pending.pop(next_row)])
+                next_row += 1
 
 
 # ===== MAIN =====
@@ -67,14 +98,10 @@ def main():
         logger.error("No subjects found in the file.")
         return
     logger.debug("Loaded %d subjects", len(subjects))
-    # Process each subject
-    # It will be a concat into a dataframe
-    subjects["key"] = subjects[conf.scraping.file.name_column].apply(fetch_wikipedia)
-    subjects["source"] = subjects["key"].apply(fetch_source)
-    # Save the results to a CSV file
+    # Process each subject, streaming the results to a CSV file
     output_path = conf.scraping.paths.processed_data
     logger.debug("Saving results to %s", output_path)
-    subjects.to_csv(output_path + conf.scraping.file.name, index=False)
+    asyncio.run(save_results(subjects, output_path + conf.scraping.file.name))
 
     logger.info("Finished processing subjects")
 
@@ -1,157 +1,213 @@
 # professional_profiler/scraping/wikipedia_search.py
 
 from professional_profiler.logging.logger import get_logger
+import asyncio
 import os
-import requests
-from dotenv import load_dotenv
 import time
+import httpx
+from dotenv import load_dotenv
 from rapidfuzz import process, fuzz
 
 load_dotenv()
 
 logger = get_logger(__name__)
 
+BASE_URL = "https://api.wikimedia.org/core/v1/wikipedia"
+SEARCH_TIMEOUT = 5
+# Statuses retried besides the configured rate-limit code
+RETRY_STATUSES = (500, 502, 503, 504)
+# Keys get_wikipedia_async returns instead of a page; there is no HTML to fetch
+NO_PAGE_KEYS = ("NO_MATCH", "MULTIPLE_MATCHES", "NO_RESULTS")
+
+
+def _pick_page(name: str, data: dict) -> str:
+    """Key of the search result best matching `name`, or a status marker."""
+    pages = data.get("pages", [])
+    if not pages:
+        return "NO_RESULTS"
+
+    # detection of disambiguation remains the same for the first result
+    if pages[0].get("description") == "Topics referred to by the same term":
+        return "MULTIPLE_MATCHES"
+
+    # normalize query
+    normalized_query = (
+        name.lower().replace(" ", "_").replace(".", "")  # strip dots from initials/suffixes
+    )
+
+    # build candidate list from all returned pages
+    choices = [p["key"].lower().replace(" ", "_") for p in pages]
+
+    # fuzzy‐match
+    best, score, idx = process.extractOne(normalized_query, choices, scorer=fuzz.ratio)
+
+    if score < 50:
+        return "NO_MATCH"
+
+    # we accept pages[idx]
+    match = pages[idx]
+
+    return match["key"]
+
+
+class RateLimiter:
+    """Spaces request starts so at most `per_minute` begin in any minute."""
+
+    def __init__(self, per_minute: int):
+        self.interval = 60 / per_minute
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        # no await between reading and booking the slot, so coroutines never share one
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+async def _aget(
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    url: str,
+    retry: int,
+    timeout: int,
+    rc: int,
+    **kwargs,
+) -> httpx.Response:
+    """GET `url`, retrying rate limits and server errors up to `retry` attempts in all."""
+    for attempt in range(retry):
+        await limiter.wait()
+        rs = await client.get(url, timeout=SEARCH_TIMEOUT, **kwargs)
+        if rs.status_code not in (rc, *RETRY_STATUSES) or attempt == retry - 1:
+            break
+        # honour the server's Retry-After; without one a rate limit waits `timeout`
+        # for the window to reset, server errors back off 1s, 2s, 4s... up to `timeout`
+        retry_after = rs.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = int(retry_after)
+        elif rs.status_code == rc:
+            delay = timeout
+        else:
+            delay = min(2**attempt, timeout)
+        logger.warning(
+            "HTTP %d, retrying in %ds... (%d/%d)", rs.status_code, delay, attempt + 1, retry
+        )
+        await asyncio.sleep(delay)
+    return rs
+
 
 """
 This Python function retrieves information from
 Wikipedia based on a given name and language,
 handling retry logic and error cases.
 
+:param client: Shared `httpx.AsyncClient` every request goes through
+:type client: httpx.AsyncClient
+:param limiter: `RateLimiter` pacing request starts across subjects
+:type limiter: RateLimiter
 :param name: The `name` parameter is a required
 string input representing the search query for the
 Wikipedia page you want to retrieve
 :type name: str
-:param lang: The `lang` parameter in the `get_wikipedia`
+:param lang: The `lang` parameter in the `get_wikipedia_async`
 function specifies the language for the Wikipedia search.
 By default, it is set to "en" for English. You can provide
 a different language code if you want to search in a
 different language, defaults to en
 :type lang: str (optional)
-:param retry: The `retry` parameter in the `get_wikipedia`
+:param retry: The `retry` parameter in the `get_wikipedia_async`
 function specifies the number of retry attempts that will
 be made in case of certain errors, such as a rate limit being hit.
 If the initial request fails, the function will retry making the
 request up to the specified number of times before giving up,
 defaults to 3
 :type retry: int (optional)
-:param timeout: The `timeout` parameter in the `get_wikipedia`
-function specifies the maximum number of seconds to wait for a
-response from the Wikipedia API before raising a timeout error. In the
-provided code snippet, the default value for `timeout` is set to 60 seconds.
-This means that if the API, defaults to 60
+:param timeout: The `timeout` parameter in the `get_wikipedia_async`
+function specifies the number of seconds to wait after a rate limit
+(status `rc`) without a Retry-After header before retrying, so the
+limit can reset. It also caps the backoff for server errors, defaults to 60
 :type timeout: int (optional)
-:param rc: The `rc` parameter in the `get_wikipedia` function stands
+:param rc: The `rc` parameter in the `get_wikipedia_async` function stands
 for "retry count." It specifies the number of times the function will
 retry making a request in case it encounters a rate limit
 from the Wikipedia API. If the rate limit is hit, the function, defaults to 429
 :type rc: int (optional)
-:return: The function `get_wikipedia` returns the key of the best
+:return: The function `get_wikipedia_async` returns the key of the best
 matching Wikipedia page based on the search query provided.
 """
 
 
-def get_wikipedia(
-    name: str, lang: str = "en", retry: int = 3, timeout: int = 60, rc: int = 429
+async def get_wikipedia_async(
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    name: str,
+    lang: str = "en",
+    retry: int = 3,
+    timeout: int = 60,
+    rc: int = 429,
 ) -> str:
     logger.debug("Scraping %r", name)
-    BASE_URL = "https://api.wikimedia.org/core/v1/wikipedia"
     HEADERS = {"Authorization": os.getenv("WP_ACCESS_TOKEN", "")}
-    SEARCH_TIMEOUT = 5
-
     url = f"{BASE_URL}/{lang}/search/page"
-    params = {"q": name, "limit": 1}
     rs = None
     try:
-        # Retry logic
-        for attempt in range(retry):
-            try:
-                rs = requests.get(url, headers=HEADERS, params=params, timeout=SEARCH_TIMEOUT)
-                rs.raise_for_status()
-                break
-            except requests.HTTPError as e:
-                if rs.status_code == rc and attempt < retry - 1:
-                    logger.warning("Rate limit hit, retrying... (%d/%d)", attempt + 1, retry)
-                    # Wait before retrying
-                    logger.debug("Waiting for %d seconds before retrying...", timeout)
-                    time.sleep(timeout)
-                    continue
-                else:
-                    raise e
+        rs = await _aget(
+            client, limiter, url, retry, timeout, rc,
+            headers=HEADERS, params={"q": name, "limit": 1},
+        )
+        rs.raise_for_status()
         data = rs.json()
-    except requests.HTTPError:
+    except httpx.HTTPStatusError:
         logger.error("HTTP error: %s", rs.status_code)
         return "HTTP error"
-    except requests.RequestException:
-        logger.error("Network error: %s", rs.status_code)
+    except httpx.HTTPError as e:
+        logger.error("Network error: %s", e)
         return "Network error"
     except ValueError:
         logger.error("Invalid JSON response")
         return "Invalid JSON"
-
-    pages = data.get("pages", [])
-    if not pages:
-        return "NO_RESULTS"
-
-    # detection of disambiguation remains the same for the first result
-    if pages[0].get("description") == "Topics referred to by the same term":
-        return "MULTIPLE_MATCHES"
-
-    # normalize query
-    normalized_query = (
-        name.lower().replace(" ", "_").replace(".", "")  # strip dots from initials/suffixes
-    )
-
-    # build candidate list from all returned pages
-    choices = [p["key"].lower().replace(" ", "_") for p in pages]
-
-    # fuzzy‐match
-    best, score, idx = process.extractOne(normalized_query, choices, scorer=fuzz.ratio)
-
-    if score < 50:
-        return "NO_MATCH"
-
-    # we accept pages[idx]
-    match = pages[idx]
-
-    return match["key"]
+    return _pick_page(name, data)
 
 
 """
-The function `search_html` fetches HTML
+The function `search_html_async` fetches HTML
 content from a Wikipedia API based on a given key
 with retry logic for handling rate limits.
 
-:param key: The `key` parameter in the `search_html`
+:param client: Shared `httpx.AsyncClient` every request goes through
+:type client: httpx.AsyncClient
+:param limiter: `RateLimiter` pacing request starts across subjects
+:type limiter: RateLimiter
+:param key: The `key` parameter in the `search_html_async`
 function is a required string parameter that
 represents the search term or key for fetching HTML
 content from a Wikipedia API
 :type key: str
-:param lang: The `lang` parameter in the `search_html`
+:param lang: The `lang` parameter in the `search_html_async`
 function is used to specify the language for
 the Wikipedia page search. It has a default value of
 "en" (English), but you can provide a different
 language code if needed, defaults to en
 :type lang: str (optional)
-:param retry: The `retry` parameter in the `search_html`
+:param retry: The `retry` parameter in the `search_html_async`
 function specifies the number of retry attempts that will
 be made in case of certain HTTP errors, such as rate limiting.
 If the initial request fails due to a specific HTTP error
 status code (specified by `rc`), the function will retry
 making the, defaults to 3
 :type retry: int (optional)
-:param timeout: The `timeout` parameter in the `search_html`
-function specifies the maximum number of seconds the function
-will wait for a response from the API before timing out. In
-this case, the default timeout value is set to 60 seconds.
-If the API does not respond within this time frame, the
-function, defaults to 60
+:param timeout: The `timeout` parameter in the `search_html_async`
+function specifies the number of seconds to wait after a rate limit
+(status `rc`) without a Retry-After header before retrying, so the
+limit can reset. It also caps the backoff for server errors, defaults to 60
 :type timeout: int (optional)
-:param rc: The `rc` parameter in the `search_html` function
+:param rc: The `rc` parameter in the `search_html_async` function
 stands for "Retry Count". It is used to specify the number of
 times the function should retry making a request in case a
 rate limit is hit, defaults to 429
 :type rc: int (optional)
-:return: The function `search_html` returns a string, which
+:return: The function `search_html_async` returns a string, which
 is the HTML content fetched from a specified URL. If there
 are any HTTP errors or network errors during the request,
 it will return an error message instead. If the key
@@ -160,42 +216,28 @@ will return the key itself without making the request.
 """
 
 
-def search_html(
-    key: str, lang: str = "en", retry: int = 3, timeout: int = 60, rc: int = 429
+async def search_html_async(
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    key: str,
+    lang: str = "en",
+    retry: int = 3,
+    timeout: int = 60,
+    rc: int = 429,
 ) -> str:
     logger.debug("Fetching %r", key)
-    if key != "NO_MATCH" and key != "MULTIPLE_MATCHES" and key != "NO_RESULTS":
-        url = "https://api.wikimedia.org/core/v1/wikipedia/" + lang + "/page/" + key + "/html"
-        HEADERS = {
-            "Authorization": os.getenv("WP_ACCESS_TOKEN"),
-        }
-        SEARCH_TIMEOUT = 5
-        rs = None
-        try:
-            # Retry logic
-            for attempt in range(retry):
-                try:
-                    rs = requests.get(url, headers=HEADERS, timeout=SEARCH_TIMEOUT)
-                    rs.raise_for_status()
-                    break
-                except requests.HTTPError as e:
-                    if rs.status_code == rc and attempt < retry - 1:
-                        logger.warning(
-                            "Rate limit hit, retrying... (%d/%d)", attempt + 1, retry
-                        )
-                        # Wait before retrying
-                        logger.debug("Waiting for %d seconds before retrying...", timeout)
-                        time.sleep(timeout)
-                        continue
-                    else:
-                        raise e
-            data = rs.text
-        except requests.HTTPError:
-            logger.error("HTTP error: %s", rs.status_code)
-            return "HTTP error"
-        except requests.RequestException:
-            logger.error("Network error: %s", rs.status_code)
-            return "Network error"
-        return data
-    else:
+    if key in NO_PAGE_KEYS:
         return key
+    HEADERS = {"Authorization": os.getenv("WP_ACCESS_TOKEN", "")}
+    url = f"{BASE_URL}/{lang}/page/{key}/html"
+    rs = None
+    try:
+        rs = await _aget(client, limiter, url, retry, timeout, rc, headers=HEADERS)
+        rs.raise_for_status()
+        return rs.text
+    except httpx.HTTPStatusError:
+        logger.error("HTTP error: %s", rs.status_code)
+        return "HTTP error"
+    except httpx.HTTPError as e:
+        logger.error("Network error: %s", e)
+        return "Network error"
@@ -0,0 +1,73 @@
+"""Tests for batch checkpointing in the direct-extraction pipeline."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from argumentation_mining.pipelines.direct_extraction.direct_extraction import (
+    DirectArgumentExtractor,
+)
+from argumentation_mining.utils.checkpoint import PhaseCheckpoint
+from argumentation_mining.utils.openai_calls import BatchJobStatus
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Poller:
+    def __init__(self, status: str) -> None:
+        self.status = status
+
+    def wait(self, job_id: str) -> BatchJobStatus:
+        return BatchJobStatus(
+            job_id=job_id,
+            status=self.status,
+            input_file_id="file-in",
+        )
+
+
+class _Client:
+    def get_batch_results(self, batch_id: str) -> list[dict[str, Any]]:
+        return [{"custom_id": f"{batch_id}_0"}]
+
+
+def _extractor(status: str) -> DirectArgumentExtractor:
+    extractor = DirectArgumentExtractor.__new__(DirectArgumentExtractor)
+    extractor.logger = None
+    extractor.client = _Client()
+    extractor._batch_poller = _Poller(status)  # noqa: SLF001
+    return extractor
+
+
+@pytest.mark.parametrize("status", ["failed", "expired", "cancelled"])
+def test_unfinished_batch_is_not_checkpointed(
+    tmp_path: Path,
+    status: str,
+) -> None:
+    extractor = _extractor(status)
+    checkpoint = PhaseCheckpoint(tmp_path, "digest")
+    with pytest.raises(RuntimeError, match=status):
+        extractor._checkpointed(  # noqa: SLF001
+            checkpoint,
+            "phase1",
+            lambda: extractor._wait_for_batch("job"),  # noqa: SLF001
+        )
+
+    resumed = PhaseCheckpoint(tmp_path, "digest", resume=True)
+    assert resumed.load("phase1") is None
+
+
+def test_completed_batch_is_checkpointed(tmp_path: Path) -> None:
+    extractor = _extractor("completed")
+    checkpoint = PhaseCheckpoint(tmp_path, "digest")
+    results = extractor._checkpointed(  # noqa: SLF001
+        checkpoint,
+        "phase1",
+        lambda: extractor._wait_for_batch("job"),  # noqa: SLF001
+    )
+
+    assert results == [{"custom_id": "job_0"}]
+    resumed = PhaseCheckpoint(tmp_path, "digest", resume=True)
+    assert resumed.load("phase1") == results
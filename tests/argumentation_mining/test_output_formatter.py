@@ -0,0 +1,44 @@
+"""Tests for the CSV output writers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from argumentation_mining.utils import output_formatter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+RESULTS = [
+    {
+        "article_id": 7,
+        "text": 'Line one,\nline "two"',
+        "success": True,
+        "error_message": None,
+        "arguments": [
+            {"claim": "Café", "premises": ["a, b", ""]},
+            {"question": "Q?", "answer": "A", "claim": "C", "premises": []},
+        ],
+    },
+    {"article_id": "x", "text": "", "success": False, "arguments": []},
+]
+
+
+def test_arrow_and_csv_writer_write_the_same_bytes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("pyarrow")
+    arrow_path = tmp_path / "arrow.csv"
+    output_formatter.save_as_csv(RESULTS, arrow_path, max_premises=2)
+
+    monkeypatch.setattr(output_formatter, "pa", None)
+    fallback_path = tmp_path / "fallback.csv"
+    output_formatter.save_as_csv(RESULTS, fallback_path, max_premises=2)
+
+    assert fallback_path.read_bytes() == arrow_path.read_bytes()
+    header, first_row = fallback_path.read_bytes().split(b"\n")[:2]
+    assert header.startswith(b'"article_id","text",')
+    assert first_row == b'"7","Line one,'
@@ -0,0 +1,39 @@
+"""Tests for the direct-extraction response parsers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from argumentation_mining.pipelines.direct_extraction._parsing import (
+    Argument,
+    clean_items,
+    parse_arguments_json,
+    parse_premises_json,
+)
+
+
+@pytest.mark.parametrize("arguments", [None, "abc", 3, {"conclusion": 1}])
+def test_non_list_arguments_raise_value_error(arguments: object) -> None:
+    content = json.dumps({"arguments": arguments})
+    with pytest.raises(ValueError, match="not a list"):
+        parse_premises_json(content, 2)
+    with pytest.raises(ValueError, match="not a list"):
+        parse_arguments_json(content)
+
+
+def test_string_premises_are_one_item() -> None:
+    content = json.dumps(
+        {"arguments": [{"conclusion": "C", "premises": " abc "}]},
+    )
+    assert parse_arguments_json(content) == [Argument("C", ("abc",))]
+
+    content = json.dumps({"arguments": [{"conclusion": 1, "premises": "abc"}]})
+    assert parse_premises_json(content, 1) == [["abc"]]
+
+
+def test_clean_items_ignores_non_list_values() -> None:
+    assert clean_items(None) == []
+    assert clean_items({"a": 1}) == []
+    assert clean_items([" a ", "", 2]) == ["a", "2"]
@@ -0,0 +1,52 @@
+"""Tests for duplicate handling in run_pipeline."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from argumentation_mining.main import run_pipeline
+from argumentation_mining.pipelines.direct_extraction.direct_extraction import (
+    DirectExtractionResult,
+)
+
+
+class _Client:
+    async def aclose(self) -> None:
+        pass
+
+
+class _Extractor:
+    """Records which texts are sent and echoes them back as results."""
+
+    result_class = DirectExtractionResult
+
+    def __init__(self) -> None:
+        self.client = _Client()
+        self.model = "gpt-4o-mini"
+        self.sent: list[str] = []
+
+    async def aprocess_single(
+        self,
+        text: str,
+        article_id: str | None = None,
+    ) -> DirectExtractionResult:
+        self.sent.append(text)
+        return DirectExtractionResult(
+            text=text,
+            article_id=article_id,
+            conclusions=[text.strip()],
+            success=True,
+        )
+
+
+def test_duplicates_keep_their_own_id_and_text() -> None:
+    texts = ["Same  text.", "Other.", " Same text.\n", "Same text."]
+    data = pd.DataFrame({"id": ["a", "b", "c", "d"], "text": texts})
+    extractor = _Extractor()
+
+    results = run_pipeline(extractor, data, "text", "id", run_batch=False)
+
+    assert extractor.sent == ["Same  text.", "Other."]
+    assert [r.article_id for r in results] == ["a", "b", "c", "d"]
+    assert [r.text for r in results] == texts
+    assert results[2].conclusions == results[0].conclusions
@@ -0,0 +1,70 @@
+"""Tests for the Socratic extraction batch-result parsers."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from argumentation_mining.pipelines.socratic_extraction.socratic_extraction import (  # noqa: E501
+    QAArgument,
+    QAArgumentExtractor,
+    _ArticleBundle,
+    _make_argument,
+)
+
+
+def _extractor() -> QAArgumentExtractor:
+    extractor = QAArgumentExtractor.__new__(QAArgumentExtractor)
+    extractor.logger = None
+    return extractor
+
+
+def _result(custom_id: str, content: str) -> dict[str, Any]:
+    return {
+        "custom_id": custom_id,
+        "response": {"body": {"choices": [{"message": {"content": content}}]}},
+    }
+
+
+@pytest.mark.parametrize("entries", [None, "abc", 3, {"question": 1}])
+def test_non_list_entries_raise_value_error(entries: object) -> None:
+    content = json.dumps({"answers": entries})
+    with pytest.raises(ValueError, match="not a list"):
+        _extractor()._parse_answers(content, 2)  # noqa: SLF001
+
+
+def test_malformed_multi_response_skips_only_its_line() -> None:
+    bundles = {
+        0: _ArticleBundle(questions=["Q1"]),
+        1: _ArticleBundle(questions=["Q2"]),
+    }
+    results = [
+        _result("qa_0", json.dumps({"answers": None})),
+        _result("qa_1", json.dumps({"answers": [{"answer": " A2 "}]})),
+    ]
+
+    _extractor()._ingest_results(bundles, results)  # noqa: SLF001
+
+    assert bundles[0].answers == {}
+    assert bundles[1].answers == {0: "A2"}
+
+
+def test_string_premises_are_one_item() -> None:
+    extractor = _extractor()
+    arg = extractor._parse_argument(  # noqa: SLF001
+        json.dumps({"claim": "C", "premises": " abc "}),
+    )
+    assert arg == {"claim": "C", "premises": ["abc"]}
+
+    content = json.dumps(
+        {"arguments": [{"question": 1, "claim": "C", "premises": "abc"}]},
+    )
+    [arg] = extractor._parse_arguments(content, 1)  # noqa: SLF001
+    assert arg == {"claim": "C", "premises": ["abc"]}
+
+
+def test_make_argument_keeps_string_premises_whole() -> None:
+    arg = _make_argument("Q", "A", {"claim": "C", "premises": "abc"})
+    assert arg == QAArgument("Q", "A", "C", ("abc",))
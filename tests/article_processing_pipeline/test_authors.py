@@ -0,0 +1,163 @@
+"""Tests for author clustering and the author relationship tables."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("gliner")
+cluster = pytest.importorskip("sklearn.cluster")
+text = pytest.importorskip("sklearn.feature_extraction.text")
+
+from article_processing_pipeline.modules import authors  # noqa: E402
+
+
+def _names(n_people: int, seed: int = 0) -> pd.Series:
+    """Author names with misspelled, abbreviated and repeated variants."""
+    rng = np.random.default_rng(seed)
+    letters = list("abcdefghijklmnopqrstuvwxyz")
+    names = []
+    for _ in range(n_people):
+        first = "".join(rng.choice(letters, rng.integers(4, 9))).capitalize()
+        last = "".join(rng.choice(letters, rng.integers(5, 11))).capitalize()
+        names.append(f"{first} {last}")
+        names.append(f"{first[0]}. {last}")
+        typo = rng.integers(1, len(last))
+        names.append(f"{first} {last[:typo]}{last[typo:][::-1]}")
+        names.append(f"{first} {rng.choice(letters).upper()} {last}")
+        names.append(f"{first} {last}")
+    names.append(None)
+    return pd.Series(rng.permutation(np.array(names, dtype=object)))
+
+
+def _dbscan_clusters(author_names: pd.Series, threshold: float) -> dict:
+    """Reference: the DBSCAN clustering cluster_author_names replaced."""
+    names = author_names.dropna().unique().tolist()
+    tfidf_matrix = text.TfidfVectorizer(
+        analyzer="char_wb",
+        ngram_range=(2, 4),
+    ).fit_transform(names)
+    labels = cluster.DBSCAN(
+        eps=1 - threshold,
+        min_samples=1,
+        metric="cosine",
+    ).fit(tfidf_matrix).labels_
+
+    clusters: dict = {}
+    for label, name in zip(labels, names, strict=True):
+        clusters.setdefault(label, []).append(name)
+    return {
+        alias: min(group, key=len)
+        for group in clusters.values()
+        for alias in group
+    }
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85])
+@pytest.mark.parametrize("block_size", [7, 64, 2048])
+def test_clustering_matches_dbscan(threshold: float, block_size: int) -> None:
+    names = _names(150)
+    mapping = authors.cluster_author_names(
+        names,
+        threshold=threshold,
+        block_size=block_size,
+    )
+    assert mapping == _dbscan_clusters(names, threshold)
+
+
+def test_clustering_of_no_names_is_empty() -> None:
+    assert authors.cluster_author_names(pd.Series([None], dtype=object)) == {}
+
+
+class _GLiNER:
+    """Stand-in model tagging every ' and '-separated part as a Person."""
+
+    @classmethod
+    def from_pretrained(cls, *args: object) -> _GLiNER:
+        return cls()
+
+    def to(self, *args: object) -> _GLiNER:
+        return self
+
+    def eval(self) -> None:
+        pass
+
+    def predict_entities(self, text: str, labels: list[str]) -> list[dict]:
+        parts = text.removeprefix("By ").split(" And ")
+        return [{"text": part, "label": labels[0]} for part in parts]
+
+    def batch_predict_entities(
+        self,
+        texts: list[str],
+        labels: list[str],
+    ) -> list[list[dict]]:
+        return [self.predict_entities(text, labels) for text in texts]
+
+
+def _merge_relationship(df_autores: pd.DataFrame) -> list[list]:
+    """Reference: number authors by first appearance, merge on the names."""
+    unique_authors = pd.DataFrame(
+        df_autores["autor"].dropna().unique(),
+        columns=["autor"],
+    )
+    unique_authors["id_autor"] = unique_authors.index
+    relacion = df_autores.merge(unique_authors, on="autor")
+    return sorted(relacion[["id_articulo", "id_autor"]].to_numpy().tolist())
+
+
+def test_process_authors_relationship_matches_merge(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(authors, "GLiNER", _GLiNER)
+    bylines = [
+        "Smith, John; Doe, Jane",
+        "By Mary Stone and Peter Pan",
+        None,
+        "",
+        "Doe, Jane",
+        "Solo",
+        "Smith, John; Doe, Jane",
+        "By Peter Pan and Ann Lee",
+    ]
+    df = pd.DataFrame({"id_articulo": range(10, 18), "autor": bylines})
+
+    df_valid, df_autores, relacion = authors.process_authors(df, batch_size=1)
+
+    assert sorted(relacion.to_numpy().tolist()) == (
+        _merge_relationship(df_autores)
+    )
+    assert relacion["id_autor"].max() + 1 == df_autores["autor"].nunique()
+    assert df_valid["id_articulo"].tolist() == [10, 11, 14, 16, 17]
+
+
+def test_standardize_relationship_matches_merge() -> None:
+    df_autores = pd.DataFrame({
+        "id_articulo": [0, 0, 1, 2, 2, 3, 4, 5],
+        "autor": [
+            "Smith, John",
+            "Doe, Jane",
+            "Smith, Jon",
+            "Stone, Mary",
+            "Press, Team",
+            "Doe, Jane",
+            None,
+            "Lee, Ann; Marie",
+        ],
+    })
+
+    df_clean, relacion = authors.standardize_author_names(df_autores.copy())
+
+    # Same steps up to the ID assignment, then the merge it replaced
+    expected = authors.preprocess_author_strings(df_autores.copy())
+    mapping = authors.cluster_author_names(expected["author_name"])
+    expected["autor"] = expected["author_name"].map(mapping)
+    expected = authors.filter_invalid_authors(
+        expected.drop(columns=["author_name"]),
+    )
+    expected_authors = expected["autor"].dropna().unique().tolist()
+    assert df_clean["autor"].tolist() == expected_authors
+    assert df_clean["id_autor"].tolist() == list(range(len(df_clean)))
+    assert sorted(relacion.to_numpy().tolist()) == _merge_relationship(expected)
+    assert "Team Press" not in df_clean["autor"].tolist()
@@ -0,0 +1,122 @@
+"""Tests for embedding-based article deduplication."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+
+from article_processing_pipeline.modules import deduplicate  # noqa: E402
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DIM = 8
+
+
+def _vector(text: str) -> np.ndarray:
+    seed = sum(text.encode()) + len(text)
+    vector = np.random.default_rng(seed).standard_normal(DIM)
+    return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+
+class _Model:
+    """Deterministic stand-in for the SentenceTransformer model."""
+
+    encoded: list[str] = []
+
+    def __init__(self, *args: object) -> None:
+        pass
+
+    def encode(self, articles: list[str], **kwargs: object) -> np.ndarray:
+        _Model.encoded.extend(articles)
+        return np.stack([_vector(article) for article in articles])
+
+
+@pytest.fixture
+def model(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> type[_Model]:
+    monkeypatch.setattr(deduplicate, "SentenceTransformer", _Model)
+    monkeypatch.setattr(deduplicate, "EMBEDDINGS_CACHE_DIR", tmp_path / "emb")
+    monkeypatch.setattr(deduplicate, "ENCODE_CHUNK_SIZE", 3)
+    _Model.encoded = []
+    return _Model
+
+
+def _embeddings(articles: list[str]) -> tuple[np.ndarray, list[np.ndarray]]:
+    indices, locations, parts = deduplicate._get_embeddings(articles)  # noqa: SLF001
+    assert indices == list(range(len(articles)))
+    return deduplicate._gather_rows(parts, locations), parts  # noqa: SLF001
+
+
+def test_embedding_cache_is_reused_across_runs(model: type[_Model]) -> None:
+    first = [f"article {i}" for i in range(7)]
+    first_embeddings, _ = _embeddings(first)
+    assert model.encoded == first
+
+    model.encoded = []
+    articles = [*first[::-1], "new one"]
+    embeddings, parts = _embeddings(articles)
+
+    # Only the new article is encoded; cached parts stay memory-mapped
+    assert model.encoded == ["new one"]
+    assert len(parts) == 4
+    assert all(isinstance(part, np.memmap) for part in parts[:3])
+    np.testing.assert_array_equal(embeddings[:7], first_embeddings[::-1])
+    expected = np.stack([_vector(a) for a in articles]).astype(np.float16)
+    np.testing.assert_array_equal(embeddings, expected.astype(np.float32))
+
+
+def _greedy_unique(embeddings: np.ndarray, threshold: float) -> list[int]:
+    """Reference: keep each article unless it is close to a kept one."""
+    kept: list[int] = []
+    for i, embedding in enumerate(embeddings):
+        if not kept or (embeddings[kept] @ embedding).max() < threshold:
+            kept.append(i)
+    return kept
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 1024])
+def test_deduplication_matches_greedy_scan(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    model: type[_Model],
+    block_size: int,
+) -> None:
+    # Near-copies of a few base vectors, so duplicates span several blocks
+    rng = np.random.default_rng(0)
+    bases = rng.standard_normal((6, DIM))
+    vectors = bases[rng.integers(0, 6, 40)] + 0.3 * rng.standard_normal((40, DIM))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    articles = [f"article {i}" for i in range(len(vectors))]
+    table = dict(zip(articles, vectors.astype(np.float32), strict=True))
+    monkeypatch.setattr(
+        model,
+        "encode",
+        lambda self, chunk, **kwargs: np.stack([table[a] for a in chunk]),
+    )
+    monkeypatch.setattr(deduplicate, "SIMILARITY_BLOCK_SIZE", block_size)
+    monkeypatch.setattr(
+        deduplicate,
+        "DUPLICATE_INDICES_PATH",
+        tmp_path / "data/interim/duplicate_indices.npy",
+    )
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data/interim").mkdir(parents=True)
+    df = pd.DataFrame({"texto_completo": articles})
+
+    df_clean = deduplicate.deduplicate_articles(df, threshold=0.9)
+
+    # Compared at the precision the embeddings are cached in
+    stored = vectors.astype(np.float16).astype(np.float32)
+    expected = _greedy_unique(stored, 0.9)
+    assert 0 < len(expected) < len(articles)
+    assert df_clean["texto_completo"].tolist() == [articles[i] for i in expected]
+
+    # A rerun reuses the saved duplicate indices
+    rerun = deduplicate.deduplicate_articles(df, threshold=0.9)
+    pd.testing.assert_frame_equal(rerun, df_clean)
@@ -0,0 +1,40 @@
+"""Tests for loading the raw article export."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from article_processing_pipeline.modules.make_dataset import load_data
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_multiline_fields_across_read_blocks(tmp_path: Path) -> None:
+    # Large enough to span several parser blocks, with paragraph breaks in
+    # the quoted full texts
+    n_rows = 20_000
+    df = pd.DataFrame({
+        "titulo": [f"title {i}" for i in range(n_rows)],
+        "texto_completo": [
+            f"First paragraph {i}.\n\nSecond paragraph,\nwith a comma."
+            for i in range(n_rows)
+        ],
+        "unused": range(n_rows),
+    })
+    path = tmp_path / "raw.csv"
+    df.to_csv(path, index=False)
+
+    loaded = load_data(str(path), skip_columns=["unused"])
+
+    pd.testing.assert_frame_equal(loaded, df.drop(columns=["unused"]))
+
+
+def test_without_skip_columns_reads_everything(tmp_path: Path) -> None:
+    df = pd.DataFrame({"a": ["x\ny", "z"], "b": [1, 2]})
+    path = tmp_path / "raw.csv"
+    df.to_csv(path, index=False)
+
+    pd.testing.assert_frame_equal(load_data(str(path)), df)
@@ -0,0 +1,76 @@
+"""Tests for article tag extraction."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from article_processing_pipeline.modules.tags import extract_tags
+
+TAG_COLS = ["materia", "lugar_articulo", "personas", "empresa"]
+
+
+def _reference_tags(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Reference: the concatenate-and-merge version extract_tags replaced."""
+    df_tags = df[["id_articulo", *TAG_COLS]].copy().fillna("").astype(str)
+    df_tags["empresa"] = df_tags["empresa"].str.replace(
+        "Nombre: ",
+        "",
+        regex=False,
+    )
+    df_tags["tags"] = df_tags[TAG_COLS].agg(";".join, axis=1).str.split(";")
+    df_tags = df_tags.explode("tags").reset_index(drop=True)
+    df_tags["tags"] = df_tags["tags"].str.strip()
+    df_tags = df_tags[
+        (df_tags["tags"] != "") & (df_tags["tags"].str.lower() != "nan")
+    ]
+
+    tag_df = pd.DataFrame(df_tags["tags"].unique(), columns=["tags"])
+    tag_df = tag_df.reset_index().rename(columns={"index": "id_tags"})
+    relacion_tags = df_tags.merge(tag_df, on="tags", how="left")
+    relacion_tags = relacion_tags[["id_articulo", "id_tags"]].astype(int)
+    return tag_df, relacion_tags
+
+
+def _articles(n_articles: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array(
+        ["Economy", "Trade", " Bogotá ", "nan", "", "Nombre: Acme", "Acme"],
+        dtype=object,
+    )
+
+    def field() -> str | None:
+        if rng.random() < 0.2:
+            return None
+        return ";".join(rng.choice(vocabulary, rng.integers(1, 4)))
+
+    return pd.DataFrame({
+        "id_articulo": np.arange(n_articles) * 3,
+        "titulo": [f"title {i}" for i in range(n_articles)],
+        **{col: [field() for _ in range(n_articles)] for col in TAG_COLS},
+    })
+
+
+def test_tag_ids_match_reference() -> None:
+    df = _articles(200)
+    df_filtered, tag_df, relacion_tags = extract_tags(df)
+    expected_tags, expected_relacion = _reference_tags(df)
+
+    assert tag_df["tags"].tolist() == expected_tags["tags"].tolist()
+    assert tag_df["id_tags"].tolist() == expected_tags["id_tags"].tolist()
+    assert relacion_tags.to_numpy().tolist() == (
+        expected_relacion.to_numpy().tolist()
+    )
+    assert "Acme" in tag_df["tags"].tolist()
+    assert not tag_df["tags"].isin(["", "nan"]).any()
+    assert df_filtered["id_articulo"].tolist() == sorted(
+        set(relacion_tags["id_articulo"]),
+    )
+
+
+def test_articles_without_tags_return_empty_tables() -> None:
+    df = pd.DataFrame({"id_articulo": [0, 1], **dict.fromkeys(TAG_COLS, "")})
+    df_filtered, tag_df, relacion_tags = extract_tags(df)
+    assert df_filtered.empty
+    assert tag_df.empty
+    assert relacion_tags.empty